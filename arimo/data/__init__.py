@@ -231,7 +231,7 @@ class AbstractDataHandler:
 
     @reprSampleSize.setter
     def reprSampleSize(self, reprSampleSize):
-        self._reprSampleSize = reprSampleSize
+        self._reprSampleSize = self._reprSampleReqSize = reprSampleSize
         self._assignReprSample()
 
     @property
@@ -1,5 +1,4 @@
 from argparse import Namespace as _Namespace
-from collections import Counter
 import copy
 from functools import lru_cache
 import itertools
@@ -8,8 +7,7 @@ import math
 import numpy
 import os
 import pandas
-import random
-from sys import maxsize
+import re
 import tempfile
 import time
 import types
@@ -17,16 +15,19 @@ import uuid
 
 import arimo.util.data_backend
 
+from py4j.protocol import Py4JJavaError
 from pyspark.ml import PipelineModel, Transformer
 from pyspark.ml.feature import OneHotEncoder, OneHotEncoderModel, SQLTransformer, VectorAssembler
-from pyspark.ml.linalg import Vector
+from pyspark.ml.linalg import Vector, VectorUDT
 from pyspark.sql import DataFrame, functions as sparkSQLFuncs
-from pyspark.sql.types import StructField, StructType
+from pyspark.sql.types import ArrayType, DoubleType, StructField, StructType
+from pyspark.sql.utils import AnalysisException
 from pyspark.sql.window import Window
 
 from arimo.util import DefaultDict, fs, Namespace
 from arimo.util.aws import rds, s3
 from arimo.util.decor import enable_inplace, _docstr_settable_property, _docstr_verbose
+from arimo.util.hashing import hash_args
 from arimo.util.iterables import flatten, to_iterable
 from arimo.util.types.numpy_pandas import PY_NUM_TYPES
 from arimo.util.types.spark_sql import \
@@ -95,6 +96,18 @@ class DistributedDataFrame(AbstractDataHandler):
     # default ordered chunk size for time-series DistributedDataFrames
     _DEFAULT_T_CHUNK_LEN = 1000
 
+    # number of hash buckets for splitting time-series DistributedDataFrames by (id, chunk) combos
+    _TS_SPLIT_N_HASH_BUCKETS = 2 ** 30
+
+    # number of evenly-spaced probabilities (0, .001, ..., 1) whose quantiles are computed alongside requested ones
+    # & kept per column as a summary, from which later requests are answered without re-scanning
+    # (only for approximate quantiles, i.e. relErr > 0)
+    _QUANTILE_SUMMARY_N_PROBS = 1001
+
+    # max number of columns per exact (relErr = 0) approxQuantile pass,
+    # whose per-column summaries keep all values & hence grow with the number of columns scanned together
+    _EXACT_QUANTILE_SCAN_MAX_N_COLS = 10
+
     # default arguments dict
     _DEFAULT_KWARGS = \
         dict(
@@ -114,6 +127,21 @@ class DistributedDataFrame(AbstractDataHandler):
     # repr sample
     _REPR_SAMPLE_ALIAS_SUFFIX = '__ReprSample'
 
+    # fixed seed, so that the same data's repr sample is reproducible & reusable across sessions
+    _REPR_SAMPLE_SEED = 68
+
+    # moderate partitioning, so that profiling queries over the repr sample still use many cores
+    _REPR_SAMPLE_N_ROWS_PER_PARTITION = 5 * 10 ** 4
+
+    # on-driver Feather files of repr samples, keyed by data identity, size & seed,
+    # cleaned up least-recently-used first once over the size limit
+    _REPR_SAMPLE_DIR_PATH = os.path.join(AbstractDataHandler._TMP_DIR_PATH, 'reprSamples')
+
+    _REPR_SAMPLE_DIR_MAX_BYTES = 20 * 2 ** 30
+
+    # Feather files memory-mapped in this session
+    _LIVE_REPR_SAMPLE_FILE_PATHS = set()
+
     # "inplace-able" methods
     _INPLACE_ABLE = \
         '__call__',\
@@ -126,8 +154,8 @@ class DistributedDataFrame(AbstractDataHandler):
         'select', \
         'sql'
 
-    # whether to test loading Parquet on HDFS
-    _TEST_HDFS_LOAD = not fs._ON_LINUX_CLUSTER_WITH_HDFS
+    # whether to test loading Parquet on HDFS (decided on first use, so that importing doesn't probe HDFS)
+    _TEST_HDFS_LOAD = None
 
     # ********************************
     # "INTERNAL / DON'T TOUCH" METHODS
@@ -580,6 +608,15 @@ class DistributedDataFrame(AbstractDataHandler):
                     if contentCols is None:
                         contentCols = self.contentCols
 
+                    # 1 window pass: time order, chunk number & order within chunk are all derived
+                    # from the same ROW_NUMBER, alongside the LAG for time delta,
+                    # so no further (id, chunk) repartitioning / window sorting is needed
+                    _tOrdExpr = \
+                        sparkSQLFuncs.row_number() \
+                        .over(window=window) \
+                        if _genTOrdCol \
+                        else None
+
                     self._sparkDF = \
                         self._sparkDF.select(
                             *((iCol,) +
@@ -588,14 +625,19 @@ class DistributedDataFrame(AbstractDataHandler):
 
                               (_tColExpr,
 
-                               sparkSQLFuncs.row_number()
-                                .over(window=window)
+                               _tOrdExpr
                                 .alias(self._T_ORD_COL)
                                if _genTOrdCol
                                else self._T_ORD_COL) +
 
-                              (() if _genTChunkCol
-                                  else (self._T_CHUNK_COL,)) +
+                              (((sparkSQLFuncs.floor((_tOrdExpr - 1) / self._tChunkLen) + 1)
+                                 .alias(self._T_CHUNK_COL),
+
+                                (((_tOrdExpr - 1) % self._tChunkLen) + 1)
+                                 .alias(self._T_ORD_IN_CHUNK_COL))
+                               if _genTOrdCol
+                               else (() if _genTChunkCol
+                                        else (self._T_CHUNK_COL,))) +
 
                               ((sparkSQLFuncs.datediff(
                                     end=_tColExprForDelta,
@@ -615,7 +657,7 @@ class DistributedDataFrame(AbstractDataHandler):
                                if _genTDeltaCol
                                else self._T_DELTA_COL,) +
 
-                              (() if _genTOrdInChunkCol
+                              (() if _genTOrdCol or _genTOrdInChunkCol
                                   else (self._T_ORD_IN_CHUNK_COL,)) +
 
                               _tComponentExprs +
@@ -634,7 +676,8 @@ class DistributedDataFrame(AbstractDataHandler):
                     pass
 
                 else:
-                    if _genTChunkCol:
+                    # below only needed when time order already existed (else generated in the window pass above)
+                    if _genTChunkCol and (not _genTOrdCol):
                         if contentCols is None:
                             contentCols = self.contentCols
 
@@ -662,7 +705,7 @@ class DistributedDataFrame(AbstractDataHandler):
 
                                   contentCols))
 
-                    if _genTOrdInChunkCol:
+                    if _genTOrdInChunkCol and (not _genTOrdCol):
                         if self._cache.nRows is None:
                             if arimo.debug.ON:
                                 tic = time.time()
@@ -677,10 +720,9 @@ class DistributedDataFrame(AbstractDataHandler):
                         if contentCols is None:
                             contentCols = self.contentCols
 
+                        # no explicit repartitioning: the window's own (id, chunk) clustering requirement
+                        # is already satisfied if the data is partitioned by id, avoiding a shuffle
                         self._sparkDF = self._sparkDF \
-                            .repartition(
-                                iCol,
-                                self._T_CHUNK_COL) \
                             .select(
                                 iCol,
 
@@ -735,6 +777,7 @@ class DistributedDataFrame(AbstractDataHandler):
 
             if _tComponentColsApplicable:
                 if (_genTHoYCol or _genTQoYCol or _genTMoYCol or _genTPoYCol or   # _genTWoYCol or _genTDoYCol or
+                        _genTQoHCol or _genTMoHCol or _genTPoHCol or _genTMoQCol or _genTPoQCol or
                         _genTWoMCol or _genTDoMCol or _genTPoMCol or
                         _genTDoWCol or _genTPoWCol) or \
                         (_tDailyComponentColsApplicable and
@@ -742,26 +785,57 @@ class DistributedDataFrame(AbstractDataHandler):
                     if contentCols is None:
                         contentCols = self.contentCols
 
+                    # all calendar components are pure column expressions of the time column (or of
+                    # already-valid component columns), generated together in 1 projection
+                    _tQoYExpr = \
+                        sparkSQLFuncs.quarter(tCol) \
+                        if _genTQoYCol \
+                        else sparkSQLFuncs.col(self._T_QoY_COL)
+
+                    _tMoYExpr = \
+                        sparkSQLFuncs.month(tCol) \
+                        if _genTMoYCol \
+                        else sparkSQLFuncs.col(self._T_MoY_COL)
+
+                    _tMoHExpr = \
+                        sparkSQLFuncs.when(_tMoYExpr <= 6, _tMoYExpr) \
+                        .otherwise(_tMoYExpr - 6) \
+                        if _genTMoHCol \
+                        else sparkSQLFuncs.col(self._T_MoH_COL)
+
+                    _tMoQExpr = \
+                        (((_tMoYExpr - 1) % 3) + 1) \
+                        if _genTMoQCol \
+                        else sparkSQLFuncs.col(self._T_MoQ_COL)
+
+                    _tDoMExpr = \
+                        sparkSQLFuncs.dayofmonth(tCol) \
+                        if _genTDoMCol \
+                        else sparkSQLFuncs.col(self._T_DoM_COL)
+
+                    _tHoDExpr = \
+                        sparkSQLFuncs.hour(tCol) \
+                        if _genTHoDCol \
+                        else sparkSQLFuncs.col(self._T_HoD_COL)
+
                     self._sparkDF = \
                         self._sparkDF.select(
                             *(_firstCols +
-                            
+
                               (# Half of Year
-                               (sparkSQLFuncs.when(sparkSQLFuncs.quarter(tCol) <= 2, 1).otherwise(2)
-                                        if _genTQoYCol
-                                        else sparkSQLFuncs.expr('IF({} <= 2, 1, 2)'.format(self._T_QoY_COL)))
+                               sparkSQLFuncs.when(_tQoYExpr <= 2, 1).otherwise(2)
                                     .alias(self._T_HoY_COL)
                                if _genTHoYCol
                                else self._T_HoY_COL,
 
                                # Quarter of Year
-                               sparkSQLFuncs.quarter(tCol)
+                               _tQoYExpr
                                     .alias(self._T_QoY_COL)
                                if _genTQoYCol
                                else self._T_QoY_COL,
 
                                # Month of Year
-                               sparkSQLFuncs.month(tCol)
+                               _tMoYExpr
                                     .alias(self._T_MoY_COL)
                                if _genTMoYCol
                                else self._T_MoY_COL,
@@ -779,55 +853,57 @@ class DistributedDataFrame(AbstractDataHandler):
                                # else self._T_DoY_COL,
 
                                # Part/Proportion/Fraction of Year
-                               ((sparkSQLFuncs.month(tCol) / 12)
-                                if _genTMoYCol
-                                else sparkSQLFuncs.expr('{} / 12'.format(self._T_MoY_COL)))
+                               (_tMoYExpr / 12)
                                     .alias(self._T_PoY_COL)
                                if _genTPoYCol
-                               else self._T_PoY_COL) +
+                               else self._T_PoY_COL,
 
-                              (# Quarter of Half-Year
-                               () if _genTQoHCol
-                                  else (self._T_QoH_COL,)) +
+                               # Quarter of Half-Year
+                               sparkSQLFuncs.when(_tQoYExpr.isin(1, 3), 1).otherwise(2)
+                                    .alias(self._T_QoH_COL)
+                               if _genTQoHCol
+                               else self._T_QoH_COL,
 
-                              (# Month of Half-Year
-                               () if _genTMoHCol
-                                  else (self._T_MoH_COL,)) +
+                               # Month of Half-Year
+                               _tMoHExpr
+                                    .alias(self._T_MoH_COL)
+                               if _genTMoHCol
+                               else self._T_MoH_COL,
 
-                              (# Part/Proportion/Fraction of Half-Year
-                               () if _genTPoHCol
-                                  else (self._T_PoH_COL,)) +
+                               # Part/Proportion/Fraction of Half-Year
+                               (_tMoHExpr / 6)
+                                    .alias(self._T_PoH_COL)
+                               if _genTPoHCol
+                               else self._T_PoH_COL,
 
-                              (# Month of Quarter
-                               () if _genTMoQCol
-                                  else (self._T_MoQ_COL,)) +
+                               # Month of Quarter
+                               _tMoQExpr
+                                    .alias(self._T_MoQ_COL)
+                               if _genTMoQCol
+                               else self._T_MoQ_COL,
 
-                              (# Part/Proportion/Fraction of Quarter
-                               () if _genTPoQCol
-                                  else (self._T_PoQ_COL,)) +
+                               # Part/Proportion/Fraction of Quarter
+                               (_tMoQExpr / 3)
+                                    .alias(self._T_PoQ_COL)
+                               if _genTPoQCol
+                               else self._T_PoQ_COL,
 
-                              (# Week of Month
+                               # Week of Month
                                sparkSQLFuncs.least(
-                                        (((sparkSQLFuncs.dayofmonth(tCol) - 1) / 7)
-                                                .cast(dataType=_INT_TYPE) + 1)
-                                            if _genTDoMCol
-                                            else sparkSQLFuncs.expr('(({} - 1) DIV 7) + 1'.format(self._T_DoM_COL)),
+                                        (((_tDoMExpr - 1) / 7).cast(dataType=_INT_TYPE) + 1),
                                         sparkSQLFuncs.lit(4))
                                     .alias(self._T_WoM_COL)
                                if _genTWoMCol
                                else self._T_WoM_COL,
 
                                # Day of Month
-                               sparkSQLFuncs.dayofmonth(tCol)
+                               _tDoMExpr
                                     .alias(self._T_DoM_COL)
                                if _genTDoMCol
                                else self._T_DoM_COL,
 
                                # Part/Proportion/Fraction of Month
-                               ((sparkSQLFuncs.dayofmonth(tCol)
-                                    if _genTDoMCol
-                                    else self[self._T_DoM_COL])
-                                / sparkSQLFuncs.dayofmonth(sparkSQLFuncs.last_day(tCol)))
+                               (_tDoMExpr / sparkSQLFuncs.dayofmonth(sparkSQLFuncs.last_day(tCol)))
                                     .alias(self._T_PoM_COL)
                                if _genTPoMCol
                                else self._T_PoM_COL,
@@ -846,15 +922,13 @@ class DistributedDataFrame(AbstractDataHandler):
                                else self._T_PoW_COL) +
 
                               ((# Hour of Day
-                                sparkSQLFuncs.hour(tCol)
+                                _tHoDExpr
                                     .alias(self._T_HoD_COL)
                                 if _genTHoDCol
                                 else self._T_HoD_COL,
 
                                 # Part/Proportion/Fraction of Day
-                                ((sparkSQLFuncs.hour(tCol)
-                                        if _genTHoDCol
-                                        else self[self._T_HoD_COL]) / 24)
+                                (_tHoDExpr / 24)
                                     .alias(self._T_PoD_COL)
                                 if _genTPoDCol
                                 else self._T_PoD_COL)
@@ -865,127 +939,29 @@ class DistributedDataFrame(AbstractDataHandler):
 
                 _schema = self._sparkDF.schema
 
-                _types[self._T_HoY_COL] = _type = _schema[self._T_HoY_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_QoY_COL] = _type = _schema[self._T_QoY_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_MoY_COL] = _type = _schema[self._T_MoY_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                # _types[self._T_WoY_COL] = _type = _schema[self._T_WoY_COL].dataType.simpleString()
-                # assert _type in _INT_TYPES
-
-                # _types[self._T_DoY_COL] = _type = _schema[self._T_DoY_COL].dataType.simpleString()
-                # assert _type in _INT_TYPES
-
-                _types[self._T_PoY_COL] = _type = _schema[self._T_PoY_COL].dataType.simpleString()
-                assert _type in _FLOAT_TYPES
-
-                _types[self._T_WoM_COL] = _type = _schema[self._T_WoM_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_DoM_COL] = _type = _schema[self._T_DoM_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_PoM_COL] = _type = _schema[self._T_PoM_COL].dataType.simpleString()
-                assert _type in _FLOAT_TYPES
-
-                _types[self._T_DoW_COL] = _type = _schema[self._T_DoW_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_PoW_COL] = _type = _schema[self._T_PoW_COL].dataType.simpleString()
-                assert _type in _FLOAT_TYPES
-
-                if _tDailyComponentColsApplicable:
-                    _types[self._T_HoD_COL] = _type = _schema[self._T_HoD_COL].dataType.simpleString()
-                    assert _type in _INT_TYPES
-
-                    _types[self._T_PoD_COL] = _type = _schema[self._T_PoD_COL].dataType.simpleString()
-                    assert _type in _FLOAT_TYPES
-
-                if _genTQoHCol or _genTMoHCol or _genTPoHCol or _genTMoQCol or _genTPoQCol:
-                    if contentCols is None:
-                        contentCols = self.contentCols
-
-                    self._sparkDF = \
-                        self._sparkDF.select(
-                            *(_firstCols +
-
-                              (self._T_HoY_COL,
-                               self._T_QoY_COL,
-                               self._T_MoY_COL,
-                               # self._T_WoY_COL,
-                               # self._T_DoY_COL,
-                               self._T_PoY_COL,
-
-                               # Quarter of Half-Year
-                               sparkSQLFuncs.expr('IF({} IN (1, 3), 1, 2)'.format(self._T_QoY_COL))
-                                .alias(self._T_QoH_COL)
-                               if _genTQoHCol
-                               else self._T_QoH_COL,
-
-                               # Month of Half-Year
-                               sparkSQLFuncs.when(self[self._T_MoY_COL] <= 6, self[self._T_MoY_COL])
-                                .otherwise(self[self._T_MoY_COL] - 6)
-                                .alias(self._T_MoH_COL)
-                               if _genTMoHCol
-                               else self._T_MoH_COL,
-
-                               # Part/Proportion/Fraction of Half-Year
-                               ((sparkSQLFuncs.when(self[self._T_MoY_COL] <= 6, self[self._T_MoY_COL])
-                                    .otherwise(self[self._T_MoY_COL] - 6)
-                                 if _genTMoHCol
-                                 else self[self._T_MoH_COL]) / 6)
-                                .alias(self._T_PoH_COL)
-                               if _genTPoHCol
-                               else self._T_PoH_COL,
-
-                               # Month of Quarter
-                               sparkSQLFuncs.expr('(({} - 1) % 3) + 1'.format(self._T_MoY_COL))
-                                .alias(self._T_MoQ_COL)
-                               if _genTMoQCol
-                               else self._T_MoQ_COL,
-
-                               # Part/Proportion/Fraction of Quarter
-                               ((sparkSQLFuncs.expr('(({} - 1) % 3) + 1'.format(self._T_MoY_COL))
-                                 if _genTMoQCol
-                                 else self[self._T_MoQ_COL]) / 3)
-                                .alias(self._T_PoQ_COL)
-                               if _genTPoQCol
-                               else self._T_PoQ_COL,
-
-                               self._T_WoM_COL,
-                               self._T_DoM_COL,
-                               self._T_PoM_COL,
-
-                               self._T_DoW_COL,
-                               self._T_PoW_COL) +
-
-                              ((self._T_HoD_COL,
-                                self._T_PoD_COL)
-                               if _tDailyComponentColsApplicable
-                               else ()) +
-
-                              contentCols))
-
-                _schema = self._sparkDF.schema
-
-                _types[self._T_QoH_COL] = _type = _schema[self._T_QoH_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_MoH_COL] = _type = _schema[self._T_MoH_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_PoH_COL] = _type = _schema[self._T_PoH_COL].dataType.simpleString()
-                assert _type in _FLOAT_TYPES
-
-                _types[self._T_MoQ_COL] = _type = _schema[self._T_MoQ_COL].dataType.simpleString()
-                assert _type in _INT_TYPES
-
-                _types[self._T_PoQ_COL] = _type = _schema[self._T_PoQ_COL].dataType.simpleString()
-                assert _type in _FLOAT_TYPES
+                for _tComponentCol, _tComponentTypes in \
+                        ((self._T_HoY_COL, _INT_TYPES),
+                         (self._T_QoY_COL, _INT_TYPES),
+                         (self._T_MoY_COL, _INT_TYPES),
+                         # (self._T_WoY_COL, _INT_TYPES),
+                         # (self._T_DoY_COL, _INT_TYPES),
+                         (self._T_PoY_COL, _FLOAT_TYPES),
+                         (self._T_QoH_COL, _INT_TYPES),
+                         (self._T_MoH_COL, _INT_TYPES),
+                         (self._T_PoH_COL, _FLOAT_TYPES),
+                         (self._T_MoQ_COL, _INT_TYPES),
+                         (self._T_PoQ_COL, _FLOAT_TYPES),
+                         (self._T_WoM_COL, _INT_TYPES),
+                         (self._T_DoM_COL, _INT_TYPES),
+                         (self._T_PoM_COL, _FLOAT_TYPES),
+                         (self._T_DoW_COL, _INT_TYPES),
+                         (self._T_PoW_COL, _FLOAT_TYPES)) + \
+                        (((self._T_HoD_COL, _INT_TYPES),
+                          (self._T_PoD_COL, _FLOAT_TYPES))
+                         if _tDailyComponentColsApplicable
+                         else ()):
+                    _types[_tComponentCol] = _type = _schema[_tComponentCol].dataType.simpleString()
+                    assert _type in _tComponentTypes
 
             if _typesCached:
                 self._cache.type.update(_types)
@@ -1004,6 +980,7 @@ class DistributedDataFrame(AbstractDataHandler):
                 firstRow=None, aRow=None,
 
                 reprSample=None,
+                reprSampleArrow=None,
 
                 count={}, distinct={},   # approx.
 
@@ -1013,6 +990,9 @@ class DistributedDataFrame(AbstractDataHandler):
 
                 sampleMin={}, sampleMax={}, sampleMean={}, sampleMedian={},
                 outlierRstMin={}, outlierRstMax={}, outlierRstMean={}, outlierRstMedian={},
+
+                quantile={},   # (col, prob, relErr) -> quantile
+                quantileSummary={},   # col -> (relErr, quantiles at _QUANTILE_SUMMARY_N_PROBS evenly-spaced probs)
                 
                 colWidth={})
 
@@ -1287,6 +1267,8 @@ class DistributedDataFrame(AbstractDataHandler):
     # sparkSession
     # create
     # unionAllCols
+    # _loadPath
+    # _binaryColsAsStr
     # load
     # save
 
@@ -1355,9 +1337,20 @@ class DistributedDataFrame(AbstractDataHandler):
 
     @classmethod
     def unionAllCols(cls, *adfs_and_or_sparkDFs, **kwargs):
+        """
+        Union ``DistributedDataFrame`` s and/or ``Spark SQL DataFrame`` s by column name,
+        filling missing columns with ``NULL`` s & casting each column to its first-seen type
+
+        Keyword Args:
+            _unionBy (str, default = 'name'): ``name`` for ``DataFrame.unionByName(..., allowMissingColumns=True)``,
+                which keeps the whole union within Catalyst; ``sql`` for the legacy padded ``UNION ALL`` *SQL* string
+        """
         _TMP_TABLE_PREFIX = '_tmp_tbl_'
 
-        _unionRDDs = kwargs.pop('_unionRDDs', False)
+        _unionBy = kwargs.pop('_unionBy', 'name')
+
+        assert _unionBy in ('name', 'sql'), \
+            '*** _unionBy must be "name" or "sql" ***'
 
         assert all(isinstance(adfs_and_or_sparkDF, (DistributedDataFrame, DataFrame))
                    for adfs_and_or_sparkDF in adfs_and_or_sparkDFs)
@@ -1372,6 +1365,32 @@ class DistributedDataFrame(AbstractDataHandler):
                     if structField.name not in colTypes:
                         colTypes[structField.name] = structField.dataType
 
+            if _unionBy == 'name':
+                sparkDF = None
+
+                for adf_or_sparkDF in adfs_and_or_sparkDFs:
+                    _sparkDF = \
+                        adf_or_sparkDF._sparkDF \
+                        if isinstance(adf_or_sparkDF, DistributedDataFrame) \
+                        else adf_or_sparkDF
+
+                    _sparkDF = _sparkDF.select(
+                        *((_sparkDF[structField.name]
+                           if structField.dataType == colTypes[structField.name]
+                           else _sparkDF[structField.name].cast(colTypes[structField.name])
+                                .alias(structField.name))
+                          for structField in _sparkDF.schema))
+
+                    sparkDF = \
+                        _sparkDF \
+                        if sparkDF is None \
+                        else sparkDF.unionByName(_sparkDF, allowMissingColumns=True)
+
+                return DistributedDataFrame(
+                    sparkDF=sparkDF.select(*colTypes),
+                    nRows=None,
+                    **kwargs)
+
             adfs = [(adf_or_sparkDF
                      if isinstance(adf_or_sparkDF, DistributedDataFrame)
                      else DistributedDataFrame(sparkDF=adf_or_sparkDF))
@@ -1381,37 +1400,21 @@ class DistributedDataFrame(AbstractDataHandler):
                        for col in colTypes))
                     for adf_or_sparkDF in adfs_and_or_sparkDFs]
 
-            if _unionRDDs:
-                _tmp_table_aliases = ['this']
-
-                for i in range(1, nDFs):
-                    adfs[i].alias = '{}{}'.format(_TMP_TABLE_PREFIX, i)
-                    _tmp_table_aliases.append(adfs[i].alias)
-
-                return adfs[0](
-                    "SELECT \
-                        * \
-                    FROM \
-                        ({})".format(
-                        ' UNION ALL '.join(
-                            '(SELECT * FROM {})'.format(_tmp_table_alias)
-                            for _tmp_table_alias in _tmp_table_aliases)),
-                    **kwargs)
+            _tmp_table_aliases = ['this']
 
-            else:
-                return DistributedDataFrame.create(
-                    data=arimo.util.data_backend.spark.sparkContext.union(
-                            [adf.rdd for adf in adfs]),
-                    schema=StructType(
-                            [StructField(
-                                name=colName,
-                                dataType=dataType,
-                                nullable=True,
-                                metadata=None)
-                             for colName, dataType in colTypes.items()]),
-                    samplingRatio=None,
-                    verifySchema=False,
-                    **kwargs)
+            for i in range(1, nDFs):
+                adfs[i].alias = '{}{}'.format(_TMP_TABLE_PREFIX, i)
+                _tmp_table_aliases.append(adfs[i].alias)
+
+            return adfs[0](
+                "SELECT \
+                    * \
+                FROM \
+                    ({})".format(
+                    ' UNION ALL '.join(
+                        '(SELECT * FROM {})'.format(_tmp_table_alias)
+                        for _tmp_table_alias in _tmp_table_aliases)),
+                **kwargs)
 
         else:
             df = adfs_and_or_sparkDFs[0]
@@ -1427,6 +1430,9 @@ class DistributedDataFrame(AbstractDataHandler):
 
     @classmethod
     def _test_hdfs_load(cls):
+        if cls._TEST_HDFS_LOAD is None:
+            cls._TEST_HDFS_LOAD = not fs._hdfs_available()
+
         if not cls._TEST_HDFS_LOAD:
             _TEST_PARQUET_NAME = 'tiny.parquet'
 
@@ -1457,6 +1463,48 @@ class DistributedDataFrame(AbstractDataHandler):
             
             cls._TEST_HDFS_LOAD = True
 
+    # file formats whose multiple paths can be read by 1 Spark DataFrameReader
+    _MULTI_PATH_LOAD_FORMATS = 'parquet', 'orc', 'json', 'csv', 'text'
+
+    # file formats whose schemas can be merged across files by Spark
+    _SCHEMA_MERGE_FORMATS = 'parquet', 'orc'
+
+    @classmethod
+    def _loadPath(cls, path, aws_access_key_id=None, aws_secret_access_key=None):
+        # S3 paths are read through S3A if HDFS is available, else from local copies
+        if path.startswith('s3'):
+            if fs._hdfs_available():
+                return s3.s3a_path_with_auth(
+                        s3_path=path,
+                        access_key_id=aws_access_key_id,
+                        secret_access_key=aws_secret_access_key)
+
+            else:
+                _path = tempfile.mkdtemp()
+
+                s3.sync(
+                    from_dir_path=path, to_dir_path=_path,
+                    delete=True, quiet=True,
+                    access_key_id=aws_access_key_id, secret_access_key=aws_secret_access_key)
+
+                return _path
+
+        else:
+            return path
+
+    @staticmethod
+    def _binaryColsAsStr(sparkDF):
+        _schema = sparkDF.schema
+
+        for colName in sparkDF.columns:
+            if _schema[colName].dataType.simpleString() == _BINARY_TYPE:
+                sparkDF = \
+                    sparkDF.withColumn(
+                    colName=colName,
+                    col=sparkDF[colName].astype(_STR_TYPE))
+
+        return sparkDF
+
     @classmethod
     @_docstr_adf_kwargs
     def load(cls, path, format='parquet', schema=None,
@@ -1468,9 +1516,9 @@ class DistributedDataFrame(AbstractDataHandler):
             ``DistributedDataFrame`` instance
 
         Args:
-            path (str): path to data source
+            path (str or list of str): path(s) to data source(s)
 
-            format (str): one of:
+            format (str, or list of str 1 per path): one of:
 
                 - ``parquet`` (default)
                 - ``orc``
@@ -1483,11 +1531,31 @@ class DistributedDataFrame(AbstractDataHandler):
 
             **options: and any data format-specific loading/reading options
                 (*ref:* http://spark.apache.org/docs/latest/api/python/pyspark.sql.html#pyspark.sql.DataFrameReader)
+
+        Multiple paths of the same file format are read together by 1 ``Spark DataFrameReader``,
+        with ``mergeSchema`` unifying *Parquet* / *ORC* schemas unless ``schema`` or ``mergeSchema`` is given;
+        paths that cannot be read together (e.g. due to conflicting column types) are loaded separately,
+        and data of different formats / loaded separately are then unioned by column name,
+        casting each column to its first-seen type.
         """
         if not arimo.util.data_backend.chkSpark():
             arimo.util.data_backend.initSpark(
                 sparkConf=sparkConf)
-        
+
+        if isinstance(path, str):
+            format = format.lower()
+
+        else:
+            path = list(path)
+
+            format = \
+                [format.lower()] * len(path) \
+                if isinstance(format, str) \
+                else [_format.lower() for _format in format]
+
+            assert len(format) == len(path), \
+                '*** {} FORMATS FOR {} PATHS ***'.format(len(format), len(path))
+
         if verbose:
             logger = cls.class_stdout_logger()
 
@@ -1495,11 +1563,12 @@ class DistributedDataFrame(AbstractDataHandler):
                 _path_str = '"{}"'.format(path)
 
             else:
-                path = list(path)
                 _path_str = '{} Paths e.g. {}'.format(len(path), path[:3])
 
             msg = 'Loading by {} Format from {}{}...'.format(
-                    format.upper(),
+                    format.upper()
+                        if isinstance(format, str)
+                        else '/'.join(sorted(set(format))).upper(),
                     _path_str,
                     ' (DB Table "{}")'.format(options['dbtable'])
                         if 'dbtable' in options
@@ -1511,25 +1580,12 @@ class DistributedDataFrame(AbstractDataHandler):
             {k: options.pop(k, cls._DEFAULT_KWARGS[k])
              for k in cls._DEFAULT_KWARGS}
 
-        format = format.lower()
-
         if isinstance(path, str):
             if path.startswith('s3'):
-                if fs._ON_LINUX_CLUSTER_WITH_HDFS:
-                    path = s3.s3a_path_with_auth(
-                        s3_path=path,
-                        access_key_id=aws_access_key_id,
-                        secret_access_key=aws_secret_access_key)
-
-                else:
-                    _path = tempfile.mkdtemp()
-
-                    s3.sync(
-                        from_dir_path=path, to_dir_path=_path,
-                        delete=True, quiet=True,
-                        access_key_id=aws_access_key_id, secret_access_key=aws_secret_access_key)
-
-                    path = _path
+                path = cls._loadPath(
+                    path,
+                    aws_access_key_id=aws_access_key_id,
+                    aws_secret_access_key=aws_secret_access_key)
 
             elif format == 'jdbc':
                 assert path[:5] == 'jdbc:'
@@ -1554,38 +1610,74 @@ class DistributedDataFrame(AbstractDataHandler):
                     schema=schema,
                     **options)
 
-            _schema = sparkDF.schema
+        else:
+            pathsByFormat = {}
 
-            for colName in sparkDF.columns:
-                if _schema[colName].dataType.simpleString() == _BINARY_TYPE:
-                    sparkDF = \
-                        sparkDF.withColumn(
-                        colName=colName,
-                        col=sparkDF[colName].astype(_STR_TYPE))
+            for _path, _format in zip(path, format):
+                pathsByFormat.setdefault(_format, []).append(_path)
 
-            adf = DistributedDataFrame(
-                sparkDF=sparkDF,
-                nRows=None,
-                **stdKwArgs)
+            sparkDFs = []
 
-        else:
-            _adfs = []
+            for _format, _paths in pathsByFormat.items():
+                if _format in cls._MULTI_PATH_LOAD_FORMATS:
+                    # resolved once, so that S3 data are not re-synced should separate loading be needed below
+                    _paths = [cls._loadPath(
+                                _path,
+                                aws_access_key_id=aws_access_key_id,
+                                aws_secret_access_key=aws_secret_access_key)
+                              for _path in _paths]
+
+                    _options = options.copy()
+
+                    if (schema is None) and (_format in cls._SCHEMA_MERGE_FORMATS):
+                        _options.setdefault('mergeSchema', True)
+
+                    try:
+                        # 1 scan over all paths, planned & optimized as a whole by Catalyst
+                        sparkDFs.append(
+                            arimo.util.data_backend.spark.read.load(
+                                path=_paths,
+                                format=_format,
+                                schema=schema,
+                                **_options))
+
+                        continue
 
-            for _path in path:
-                _adf = DistributedDataFrame.load(
+                    except (AnalysisException, Py4JJavaError) as err:
+                        # e.g. conflicting column types, which Spark's schema merging cannot reconcile:
+                        # load paths separately & union them below, casting columns to their first-seen types
+                        if verbose:
+                            logger.warning(
+                                '*** {} Paths Cannot Be Read Together ({}): Loading Them Separately ***'.format(
+                                    _format.upper(), str(err).split('\n')[0]))
+
+                    # already resolved, incl. S3A credentials
+                    _aws_access_key_id = _aws_secret_access_key = None
+
+                else:
+                    _aws_access_key_id, _aws_secret_access_key = aws_access_key_id, aws_secret_access_key
+
+                sparkDFs.extend(
+                    DistributedDataFrame.load(
                         path=_path,
-                        aws_access_key_id=aws_access_key_id,
-                        aws_secret_access_key=aws_secret_access_key,
-                        format=format,
+                        aws_access_key_id=_aws_access_key_id,
+                        aws_secret_access_key=_aws_secret_access_key,
+                        format=_format,
                         schema=schema,
                         verbose=False,
                         **options)
+                    ._sparkDF
+                    for _path in _paths)
 
-                _adfs.append(_adf)
+            sparkDF = \
+                sparkDFs[0] \
+                if len(sparkDFs) == 1 \
+                else DistributedDataFrame.unionAllCols(*sparkDFs)._sparkDF
 
-            adf = DistributedDataFrame.unionAllCols(
-                *_adfs,
-                **stdKwArgs)
+        adf = DistributedDataFrame(
+            sparkDF=cls._binaryColsAsStr(sparkDF),
+            nRows=None,
+            **stdKwArgs)
 
         if verbose:
             toc = time.time()
@@ -1595,7 +1687,7 @@ class DistributedDataFrame(AbstractDataHandler):
 
     def save(self, path, format='parquet',
              aws_access_key_id=None, aws_secret_access_key=None,
-             mode='overwrite', partitionBy=None,
+             mode='overwrite', partitionBy=None, clusterBy=None, sortBy=None,
              verbose=True, switch=False, **options):
         """
         Save/write ``DistributedDataFrame``'s content to permanent storage
@@ -1624,6 +1716,12 @@ class DistributedDataFrame(AbstractDataHandler):
 
             partitionBy: names of partitioning columns
 
+            clusterBy: names of columns by which to co-locate rows in the same files,
+                without directory partitioning; ignored if ``partitionBy`` applies
+
+            sortBy: names of columns by which to sort rows within each written file
+                (default: ``(iCol, tCol)`` for time-series data written with ``partitionBy`` or ``clusterBy``)
+
             **options: format-specific loading/reading options
                 (*ref:* http://spark.apache.org/docs/latest/api/python/pyspark.sql.html#pyspark.sql.DataFrameWriter)
         """
@@ -1635,13 +1733,16 @@ class DistributedDataFrame(AbstractDataHandler):
         if (partitionBy is None) and self._dCol and (self._dCol != self._tCol):
             partitionBy = self._dCol
 
-        if partitionBy:
+        if partitionBy or clusterBy:
             # repartition data according to partitionBy, in order to write 1 file per partition (usually efficient)
-            sparkDF = sparkDF.repartition(*to_iterable(partitionBy))
+            sparkDF = sparkDF.repartition(*to_iterable(partitionBy or clusterBy))
 
-            if self.hasTS:   # sort data within each file
+            if self.hasTS and (sortBy is None):   # sort data within each file
                 sparkDF = sparkDF.sortWithinPartitions(self._iCol, self._tCol, ascending=True)
 
+        if sortBy:   # sorted row groups give tighter Parquet min/max statistics for predicate push-down
+            sparkDF = sparkDF.sortWithinPartitions(*to_iterable(sortBy), ascending=True)
+
         if verbose:
             msg = 'Saving Columns {} by {} Format{}{} in {} Mode to "{}"{}...' \
                     .format(
@@ -1681,7 +1782,7 @@ class DistributedDataFrame(AbstractDataHandler):
                 secret_access_key=aws_secret_access_key)
 
         if path.startswith('s3'):
-            if fs._ON_LINUX_CLUSTER_WITH_HDFS:
+            if fs._hdfs_available():
                 if options.pop('getToLocal', True):   # *** HDFS-to-S3 transfers are SLOW ***
                     _path = tempfile.mkdtemp()
 
@@ -1833,22 +1934,127 @@ class DistributedDataFrame(AbstractDataHandler):
                 toc = time.time()
                 self.stdout_logger.info('Cached!   <{:,.1f} m>'.format((toc - tic) / 60))
 
-    def checkpoint(self, format='parquet', eager=True, verbose=True):
+    # logical plan leaves whose content is not identified by input files
+    _NON_FILE_PLAN_LEAVES = 'LocalRelation', 'LogicalRDD', 'ExternalRDD', 'OneRowRelation'
+
+    # physical plan nodes running Python code, which is not identified by the plan
+    _PYTHON_PLAN_NODES = \
+        'PythonUDF', 'BatchEvalPython', 'ArrowEvalPython', \
+        'FlatMapGroupsInPandas', 'FlatMapCoGroupsInPandas', 'MapInPandas', 'AggregateInPandas', 'WindowInPandas', \
+        'PythonMapInArrow', 'MapInArrow'
+
+    # large enough for plan strings never to elide fields
+    _PLAN_STR_MAX_N_FIELDS = 10 ** 6
+
+    def _checkpointKey(self, format):
+        """
+        Hash of the analyzed logical plan, schema & input file versions,
+        or ``None`` if the content cannot be identified that way
+        """
+        queryExecution = self._sparkDF._jdf.queryExecution()
+
+        if any(node in queryExecution.sparkPlan().toString() for node in self._PYTHON_PLAN_NODES):
+            return None
+
+        # plan strings elide fields beyond spark.sql.debug.maxToStringFields
+        sparkConf = arimo.util.data_backend.spark.conf
+        maxToStringFields = sparkConf.get('spark.sql.debug.maxToStringFields', None)
+        sparkConf.set('spark.sql.debug.maxToStringFields', self._PLAN_STR_MAX_N_FIELDS)
+
+        try:
+            # expression IDs differ from session to session
+            plan = re.sub(r'#\d+L?', '', queryExecution.analyzed().toString())
+
+        finally:
+            if maxToStringFields is None:
+                sparkConf.unset('spark.sql.debug.maxToStringFields')
+            else:
+                sparkConf.set('spark.sql.debug.maxToStringFields', maxToStringFields)
+
+        if any(leaf in plan for leaf in self._NON_FILE_PLAN_LEAVES):
+            return None
+
+        inputFileVersions = fs.file_versions(sorted(self._sparkDF.inputFiles()))
+
+        if inputFileVersions is None:
+            return None
+
+        return hash_args(
+            plan, self._sparkDF.schema.json(), inputFileVersions,
+            format=format,
+            cols=self.indexCols + self.contentCols)
+
+    def checkpoint(self, format='parquet', eager=True, reuse=False, verbose=True):
+        """
+        Materialize ``DistributedDataFrame``'s content & switch to it, truncating its lineage
+
+        Args:
+            format (str): file format (default: ``parquet``), or ``None`` to use ``Spark DataFrame.checkpoint``
+
+            eager (bool): *(only applicable when* ``format = None`` *)* whether to checkpoint immediately
+
+            reuse (bool, default = False): whether to reuse / keep a checkpoint keyed by the analyzed logical plan,
+                schema & input file versions, so that re-running an identical pipeline over unchanged files
+                switches to the existing checkpoint *(never applicable to pipelines involving Python UDFs)*
+        """
         if verbose:
             msg = 'Checkpointing Columns {}...'.format(self.columns)
             self.stdout_logger.info(msg)
             tic = time.time()
 
         if format:
-            self.save(
-                path=os.path.join(
-                    arimo.util.data_backend._SPARK_CKPT_DIR,
-                    str(uuid.uuid4())),
-                format=format,
-                partitionBy=None,
-                mode='overwrite',
-                verbose=verbose,
-                switch=True)
+            ckptKey = \
+                self._checkpointKey(format=format) \
+                if reuse \
+                else None
+
+            if ckptKey:
+                path = os.path.join(arimo.util.data_backend._SPARK_CKPT_STORE_DIR, ckptKey)
+
+                hdfs = fs._hdfs_available()
+
+                if fs.exist(path=os.path.join(path, '_SUCCESS'), hdfs=hdfs, dir=False):
+                    self._inplace(
+                        DistributedDataFrame.load(
+                            path=path,
+                            format=format,
+                            verbose=verbose,
+                            nRows=self._cache.nRows))
+
+                    if verbose:
+                        self.stdout_logger.info(msg + ' reusing "{}"'.format(path))
+
+                else:
+                    # rows of each entity co-located & time-sorted in the same files for per-entity processing
+                    self.save(
+                        path=path,
+                        format=format,
+                        partitionBy=None,
+                        clusterBy=self._iCol
+                            if self.hasTS
+                            else None,
+                        mode='overwrite',
+                        verbose=verbose,
+                        switch=True)
+
+                # recency for least-recently-used clean-up
+                fs.touch(path=os.path.join(path, '_LAST_USED'), hdfs=hdfs)
+
+                # never trimmed while this session may still read from it
+                arimo.util.data_backend._LIVE_SPARK_CKPT_STORE_ENTRIES.add(ckptKey)
+
+                arimo.util.data_backend.trimSparkCkPtStore()
+
+            else:
+                self.save(
+                    path=os.path.join(
+                        arimo.util.data_backend._SPARK_CKPT_DIR,
+                        str(uuid.uuid4())),
+                    format=format,
+                    partitionBy=None,
+                    mode='overwrite',
+                    verbose=verbose,
+                    switch=True)
 
         else:
             if arimo.debug.ON:
@@ -1881,7 +2087,11 @@ class DistributedDataFrame(AbstractDataHandler):
     # iCol
     # tCol
     # tChunkLen
+    # _reprSampleKey
+    # _reprSampleSparkDFFromArrow
+    # _reprSampleArrowFilePath
     # _assignReprSample
+    # reprSampleArrow
 
     @property
     @_docstr_settable_property
@@ -2017,12 +2227,139 @@ class DistributedDataFrame(AbstractDataHandler):
                 # set alias to update underlying table
                 self.alias = self._alias
 
+    def _reprSampleKey(self, size):
+        """
+        Hash of the data's identity & the repr sample's requested size, seed & columns,
+        or ``None`` if the data cannot be identified by its input files
+        """
+        dataKey = self._checkpointKey(format='reprSample')
+
+        return hash_args(
+                dataKey,
+                size=size,
+                seed=self._REPR_SAMPLE_SEED,
+                cols=self.possibleFeatureTAuxCols + self.contentCols) \
+            if dataKey \
+            else None
+
+    def _reprSampleSparkDFFromArrow(self, arrowTable):
+        # Vector columns are persisted as array<double> & converted back natively in the JVM
+        schema = self._sparkDF.schema
+
+        vectorCols = [col for col in arrowTable.column_names
+                      if isinstance(schema[col].dataType, VectorUDT)]
+
+        sparkDF = \
+            arimo.util.data_backend.spark.createDataFrame(
+                data=arrowTable.to_pandas(),
+                schema=StructType(
+                    [StructField(
+                        name=col,
+                        dataType=ArrayType(DoubleType())
+                            if col in vectorCols
+                            else schema[col].dataType,
+                        nullable=True)
+                     for col in arrowTable.column_names]))
+
+        return sparkDF.select(
+                *((arimo.util.data_backend.arrayToVector(sparkDF[col]).alias(col)
+                   if col in vectorCols
+                   else sparkDF[col])
+                  for col in sparkDF.columns)) \
+            if vectorCols \
+            else sparkDF
+
+    @classmethod
+    def _trimReprSampleDir(cls):
+        # least-recently-used first, always keeping the most recently used file & those used in this session
+        if not os.path.isdir(cls._REPR_SAMPLE_DIR_PATH):
+            return
+
+        files = []
+
+        for fileName in os.listdir(cls._REPR_SAMPLE_DIR_PATH):
+            filePath = os.path.join(cls._REPR_SAMPLE_DIR_PATH, fileName)
+
+            try:
+                stat = os.stat(filePath)
+
+            except OSError:   # e.g. removed by a concurrent session
+                continue
+
+            files.append((stat.st_mtime, stat.st_size, filePath))
+
+        totalBytes = sum(nBytes for _, nBytes, _ in files)
+
+        for _, nBytes, filePath in sorted(files)[:-1]:
+            if totalBytes <= cls._REPR_SAMPLE_DIR_MAX_BYTES:
+                break
+
+            if filePath in cls._LIVE_REPR_SAMPLE_FILE_PATHS:
+                continue
+
+            try:
+                os.remove(filePath)
+
+            except OSError:
+                pass
+
+            totalBytes -= nBytes
+
+    def _reprSampleArrowFilePath(self):
+        # requested rather than last-realized size, so that re-assignments find the same persisted sample
+        reprSampleKey = \
+            self._reprSampleKey(
+                size=self.__dict__.setdefault('_reprSampleReqSize', self._reprSampleSize))
+
+        return os.path.join(self._REPR_SAMPLE_DIR_PATH, reprSampleKey + '.feather') \
+            if reprSampleKey \
+            else None
+
     def _assignReprSample(self):
-        adf = self.sample(
-                n=self._reprSampleSize,
-                anon=True) \
-            .repartition(
-                1,
+        from pyarrow.feather import read_table
+
+        reprSampleReqSize = self.__dict__.setdefault('_reprSampleReqSize', self._reprSampleSize)
+
+        arrowFilePath = self._reprSampleArrowFilePath()
+
+        if arrowFilePath and os.path.isfile(arrowFilePath):
+            # reuse the repr sample persisted by an earlier session over the same data
+            arrowTable = read_table(arrowFilePath, memory_map=True)
+
+            # recency for least-recently-used clean-up
+            os.utime(arrowFilePath)
+
+            sparkDF = self._reprSampleSparkDFFromArrow(arrowTable)
+
+            nRows = arrowTable.num_rows
+
+            self.stdout_logger.info(
+                'Reusing Repr Sample "{}"'.format(arrowFilePath))
+
+            self._LIVE_REPR_SAMPLE_FILE_PATHS.add(arrowFilePath)
+
+            self._trimReprSampleDir()
+
+        else:
+            # on-driver Arrow table only built (& persisted) on first .reprSampleArrow access
+            arrowTable = None
+
+            sparkDF = \
+                self.sample(
+                    n=reprSampleReqSize,
+                    seed=self._REPR_SAMPLE_SEED,
+                    anon=True) \
+                ._sparkDF
+
+            nRows = None
+
+        adf = self._decorate(
+                obj=sparkDF.repartition(
+                    max(min(int(math.ceil(reprSampleReqSize / self._REPR_SAMPLE_N_ROWS_PER_PARTITION)),
+                            arimo.util.data_backend.spark.sparkContext.defaultParallelism),
+                        1)),
+                nRows=nRows,
+                iCol=self._iCol, tCol=None,   # *** SAMPLES are UNORDERED ***
                 alias=(self.alias + self._REPR_SAMPLE_ALIAS_SUFFIX)
                     if self.alias
                     else None)
@@ -2034,10 +2371,53 @@ class DistributedDataFrame(AbstractDataHandler):
         self._reprSampleSize = adf.nRows
 
         self._cache.reprSample = adf
+        self._cache.reprSampleArrow = arrowTable
 
         self._cache.nonNullProportion = {}
         self._cache.suffNonNull = {}
 
+    @property
+    def reprSampleArrow(self):
+        """
+        On-driver ``pyarrow.Table`` of the same rows as ``.reprSample``, for Pandas-side profiling
+        (Vector columns as ``list<double>``); collected from ``.reprSample`` on first access
+        & then persisted for reuse by later sessions if file-backed
+        """
+        if self._cache.reprSample is None:
+            self._assignReprSample()
+
+        if self._cache.reprSampleArrow is None:
+            from pyarrow import Table
+            from pyarrow.feather import read_table, write_feather
+
+            sparkDF = self._cache.reprSample._sparkDFWithVectorsAsArrays()
+
+            arrowTable = \
+                sparkDF.toArrow() \
+                if hasattr(sparkDF, 'toArrow') \
+                else Table.from_pandas(sparkDF.toPandas(), preserve_index=False)
+
+            arrowFilePath = self._reprSampleArrowFilePath()
+
+            if arrowFilePath:
+                fs.mkdir(dir=self._REPR_SAMPLE_DIR_PATH, hdfs=False)
+
+                # write then rename, so that concurrent sessions never read a partially-written file
+                tmpFilePath = '{}.{}'.format(arrowFilePath, uuid.uuid4())
+                write_feather(arrowTable, tmpFilePath, compression='uncompressed')
+                os.replace(tmpFilePath, arrowFilePath)
+
+                # memory-mapped rather than held in driver memory
+                arrowTable = read_table(arrowFilePath, memory_map=True)
+
+                self._LIVE_REPR_SAMPLE_FILE_PATHS.add(arrowFilePath)
+
+                self._trimReprSampleDir()
+
+            self._cache.reprSampleArrow = arrowTable
+
+        return self._cache.reprSampleArrow
+
     # *********************
     # ROWS, COLUMNS & TYPES
     # __len__ / nRows / nrow
@@ -2581,6 +2961,10 @@ class DistributedDataFrame(AbstractDataHandler):
             collect (bool): whether to return a ``pandas.DataFrame`` (``collect=True``) or a ``Spark SQL DataFrame``
 
             **kwargs:
+
+                - **n** *(int, default = column's* ``maxNCats`` *)*: max number of most frequent values to return;
+                    ``None`` / 0 for all; if not given, a cached result of more values is returned whole; the result's ``.attrs`` hold the approximate number of non-NULL distinct values
+                    (``approxNDistinct``) & whether values may have been left out (``truncated``)
         """
         if not cols:
             cols = self.contentCols
@@ -2593,8 +2977,26 @@ class DistributedDataFrame(AbstractDataHandler):
         else:
             col = cols[0]
 
-            if col in self._cache.distinct:
-                result = self._cache.distinct[col]
+            _nGiven = 'n' in kwargs
+
+            n = kwargs.pop(
+                'n',
+                self._maxNCats[col])
+
+            cached = self._cache.distinct.get(col)
+
+            # reuse cached result unless it was truncated to fewer values than now requested;
+            # sliced to n only if n is explicitly given, so that e.g. all values of forceCat columns cached by prep()
+            # are not cut back to the default maxNCats
+            if (cached is not None) and \
+                    ((not cached.attrs.get('truncated')) or
+                     (n and (n <= len(cached)))):
+                if _nGiven and n and (n < len(cached)):
+                    result = cached.iloc[:n].copy()
+                    result.attrs = dict(cached.attrs, truncated=True)
+
+                else:
+                    result = cached
 
             else:
                 verbose = True \
@@ -2606,63 +3008,47 @@ class DistributedDataFrame(AbstractDataHandler):
                     self.stdout_logger.info(msg)
                     tic = time.time()
 
+                # NaNs normalized to NULLs, so that they form 1 group with NULLs;
+                # top-n proportions & HyperLogLog distinct-count estimate computed in 1 query,
+                # returning at most n rows to the driver
                 df = self.reprSample(
                         'SELECT \
-                            `{0}`, \
-                            (COUNT(*) / {1}) AS __proportion__ \
+                            __topN__.*, \
+                            __approxNDistinct__.* \
                         FROM \
-                            this \
-                        GROUP BY \
-                            `{0}` \
-                        ORDER BY \
-                            __proportion__ DESC'
-                            .format(col, self.reprSampleSize),
+                            (SELECT \
+                                `{0}`, \
+                                (COUNT(*) / {2}) AS __proportion__ \
+                            FROM \
+                                (SELECT {1} AS `{0}` FROM this) AS __normalized__ \
+                            GROUP BY \
+                                `{0}` \
+                            ORDER BY \
+                                __proportion__ DESC \
+                            {3}) AS __topN__ \
+                        CROSS JOIN \
+                            (SELECT \
+                                APPROX_COUNT_DISTINCT(`{0}`) AS __approxNDistinct__ \
+                            FROM \
+                                (SELECT {1} AS `{0}` FROM this) AS __normalized__) AS __approxNDistinct__'
+                            .format(
+                                col,
+                                'IF(ISNAN(`{0}`), NULL, `{0}`)'.format(col)
+                                    if self.type(col) in _FLOAT_TYPES
+                                    else '`{}`'.format(col),
+                                self.reprSampleSize,
+                                'LIMIT {}'.format(n)
+                                    if n
+                                    else ''),
                         **kwargs) \
                     .toPandas()
 
-                df[col] = df[col].map(lambda v: None if pandas.isnull(v) else v)
-
-                dups = {v: cnt
-                        for v, cnt in Counter(df[col]).items()
-                        if cnt > 1}
-
-                if dups:
-                    assert {None, - maxsize - 1}.issuperset(dups), \
-                        '*** {}.distinct("{}"): DUPLICATES {} ***'.format(self, col, dups)
-
-                    first_row_indices = {}
-                    row_indices_to_delete = []
-
-                    for i, row in df.iterrows():
-                        value = row[col]
+                approxNDistinct = \
+                    int(df.__approxNDistinct__.iat[0]) \
+                    if len(df) \
+                    else 0
 
-                        if value in dups:
-                            if value in first_row_indices:
-                                df.at[first_row_indices[value], '__proportion__'] += df.at[i, '__proportion__']
-                                row_indices_to_delete.append(i)
-
-                            else:
-                                first_row_indices[value] = i
-
-                    df.drop(
-                        index=row_indices_to_delete,
-                        level=None,
-                        inplace=True,
-                        errors='raise')
-
-                    df.sort_values(
-                        by='__proportion__',
-                        ascending=False,
-                        inplace=True,
-                        kind='quicksort',
-                        na_position='last')
-
-                    df.reset_index(
-                        level=None,
-                        drop=True,
-                        inplace=True,
-                        col_level=0,
-                        col_fill='')
+                df[col] = df[col].map(lambda v: None if pandas.isnull(v) else v)
 
                 self._cache.distinct[col] = \
                     result = \
@@ -2673,45 +3059,155 @@ class DistributedDataFrame(AbstractDataHandler):
                             inplace=False,
                             verify_integrity=False).__proportion__
 
+                # number of non-NULL distinct values (approx.) & whether values beyond the top n may have been left out
+                result.attrs['approxNDistinct'] = approxNDistinct
+                result.attrs['truncated'] = bool(n) and (len(result) == n)
+
                 if verbose:
                     toc = time.time()
                     self.stdout_logger.info(msg + ' done!   <{:,.1f} s>'.format(toc - tic))
 
             return result
 
-    @lru_cache()
-    def quantile(self, *cols, **kwargs):   # make Spark SQL approxQuantile method NULL-resistant
-        if len(cols) > 1:
-            return Namespace(**
-                {col: self.quantile(col, **kwargs)
-                 for col in cols})
+    def _quantileFromSummary(self, col, q, relErr):
+        # a summary computed with relative error r answers evenly-spaced probabilities within r,
+        # & interpolates others within r + 1 grid step
+        if col in self._cache.quantileSummary:
+            summaryRelErr, summary = self._cache.quantileSummary[col]
 
-        else:
-            col = cols[0]
+            if summaryRelErr <= relErr:
+                gridStep = 1 / (self._QUANTILE_SUMMARY_N_PROBS - 1)
+                gridPos = q / gridStep
+
+                if abs(gridPos - round(gridPos)) < 1e-9:
+                    return summary[int(round(gridPos))]
+
+                elif summaryRelErr + gridStep <= relErr:
+                    return float(
+                        numpy.interp(
+                            q,
+                            numpy.linspace(0, 1, num=self._QUANTILE_SUMMARY_N_PROBS),
+                            summary))
+
+    def _quantiles(self, cols, probs, relErr=0.):
+        """
+        Batched, NULL- & NaN-resistant quantiles: 1 ``approxQuantile`` pass over all columns lacking cached results
+        (over at most ``_EXACT_QUANTILE_SCAN_MAX_N_COLS`` columns at a time if exact, i.e. ``relErr = 0``),
+        for all requested probabilities plus, if approximate, the summary grid
+
+        Return:
+            *dict* mapping (col, prob) to quantile
+        """
+        if 'quantile' not in self._cache:
+            self._cache.quantile = {}
+            self._cache.quantileSummary = {}
 
-            q = kwargs.get('q', .5)
-            _multiQs = isinstance(q, (list, tuple))
+        results = {}
+        colsToScan = []
 
-            relErr = kwargs.get('relativeError', 0.)
+        for col in cols:
+            for q in probs:
+                result = self._cache.quantile.get((col, q, relErr))
 
-            if self.count(col):
-                result = \
-                    self._nonNullCol(col=col) \
+                if result is None:
+                    result = self._quantileFromSummary(col, q, relErr)
+
+                    if result is None:
+                        colsToScan.append(col)
+                        break
+
+                    self._cache.quantile[(col, q, relErr)] = result
+
+                results[(col, q)] = result
+
+        if colsToScan:
+            summaryProbs = \
+                numpy.linspace(0, 1, num=self._QUANTILE_SUMMARY_N_PROBS).tolist() \
+                if relErr \
+                else []
+
+            scanProbs = summaryProbs + sorted(set(probs).difference(summaryProbs))
+
+            scanNCols = \
+                len(colsToScan) \
+                if relErr \
+                else self._EXACT_QUANTILE_SCAN_MAX_N_COLS
+
+            for i in range(0, len(colsToScan), scanNCols):
+                _colsToScan = colsToScan[i:(i + scanNCols)]
+
+                # NaNs are treated as NULLs, which approxQuantile ignores
+                quantiles = \
+                    self._sparkDF \
+                        .selectExpr(*("IF(STRING({0}) = 'NaN', NULL, {0}) AS {0}".format(col)
+                                      for col in _colsToScan)) \
                         .approxQuantile(
-                            col=col,
-                            probabilities=q
-                                if _multiQs
-                                else (q,),
+                            col=_colsToScan,
+                            probabilities=scanProbs,
                             relativeError=relErr)
 
-                return result \
-                    if _multiQs \
-                  else result[0]
+                for col, colQuantiles in zip(_colsToScan, quantiles):
+                    if colQuantiles:   # empty if all NULLs
+                        colQuantiles = dict(zip(scanProbs, colQuantiles))
 
-            else:
-                return len(q) * [numpy.nan] \
-                    if _multiQs \
-                  else numpy.nan
+                        if summaryProbs and \
+                                ((col not in self._cache.quantileSummary) or
+                                 (relErr < self._cache.quantileSummary[col][0])):
+                            self._cache.quantileSummary[col] = relErr, [colQuantiles[q] for q in summaryProbs]
+
+                        for q in probs:
+                            self._cache.quantile[(col, q, relErr)] = \
+                                results[(col, q)] = \
+                                colQuantiles[q]
+
+                    else:
+                        for q in probs:
+                            self._cache.quantile[(col, q, relErr)] = \
+                                results[(col, q)] = \
+                                numpy.nan
+
+        return results
+
+    @lru_cache()
+    def quantile(self, *cols, **kwargs):   # make Spark SQL approxQuantile method NULL-resistant
+        q = kwargs.get('q', .5)
+        _multiQs = isinstance(q, (list, tuple))
+
+        probs = q \
+            if _multiQs \
+            else (q,)
+
+        quantiles = \
+            self._quantiles(
+                cols=cols,
+                probs=probs,
+                relErr=kwargs.get('relativeError', 0.))
+
+        results = \
+            {col: [quantiles[(col, prob)] for prob in probs]
+                if _multiQs
+                else quantiles[(col, q)]
+             for col in cols}
+
+        return Namespace(**results) \
+            if len(cols) > 1 \
+            else results[cols[0]]
+
+    def _prefetchSampleQuantiles(self, cols):
+        # medians & outlier tail thresholds of all numerical columns from 1 pass over the repr sample
+        cols = [col for col in cols
+                if self.typeIsNum(col) and
+                   ((col not in self._cache.sampleMedian) or
+                    (col not in self._cache.outlierRstMin) or
+                    (col not in self._cache.outlierRstMax))]
+
+        if len(cols) > 1:
+            self.reprSample._quantiles(
+                cols=cols,
+                probs=sorted({.5}.union(
+                    *({self._outlierTailProportion[col], 1 - self._outlierTailProportion[col]}
+                      for col in cols))),
+                relErr=0.)
 
     @_docstr_verbose
     def sampleStat(self, *cols, **kwargs):
@@ -2792,6 +3288,8 @@ class DistributedDataFrame(AbstractDataHandler):
             cols = self.possibleNumContentCols
 
         if len(cols) > 1:
+            self._prefetchSampleQuantiles(cols)
+
             return Namespace(**
                 {col: self.sampleMedian(col, **kwargs)
                  for col in cols})
@@ -2913,6 +3411,8 @@ class DistributedDataFrame(AbstractDataHandler):
             cols = self.possibleNumContentCols
 
         if len(cols) > 1:
+            self._prefetchSampleQuantiles(cols)
+
             return Namespace(**
                 {col: self.outlierRstMin(col, **kwargs)
                  for col in cols})
@@ -2974,6 +3474,8 @@ class DistributedDataFrame(AbstractDataHandler):
             cols = self.possibleNumContentCols
 
         if len(cols) > 1:
+            self._prefetchSampleQuantiles(cols)
+
             return Namespace(**
                 {col: self.outlierRstMax(col, **kwargs)
                  for col in cols})
@@ -3586,7 +4088,7 @@ class DistributedDataFrame(AbstractDataHandler):
 
             fs.rm(
                 path=savePath,
-                hdfs=arimo.util.data_backend._ON_LINUX_CLUSTER_WITH_HDFS,
+                hdfs=fs._hdfs_available(),
                 is_dir=True,
                 hadoop_home=arimo.util.data_backend._HADOOP_HOME)
 
@@ -3608,6 +4110,7 @@ class DistributedDataFrame(AbstractDataHandler):
                  else cols))
 
         adf._cache.reprSample = self._cache.reprSample
+        adf._cache.reprSampleArrow = self._cache.reprSampleArrow
 
         if verbose:
             toc = time.time()
@@ -3764,7 +4267,7 @@ class DistributedDataFrame(AbstractDataHandler):
                     pipelineModelWithoutVectors = prepCache.pipelineModelWithoutVectors
 
             else:
-                if fs._ON_LINUX_CLUSTER_WITH_HDFS:
+                if fs._hdfs_available():
                     localDirExists = os.path.isdir(loadPath)
 
                     hdfsDirExists = \
@@ -3897,6 +4400,10 @@ class DistributedDataFrame(AbstractDataHandler):
                                                         if self.suffNonNull(possibleFeatureContentCol))
 
             if cols:
+                # forced categorical columns keep all their distinct values, not just the top maxNCats
+                for col in forceCat.intersection(cols):
+                    self.distinct(col, n=None, verbose=verbose)
+
                 profile = \
                     self.profile(
                         *cols,
@@ -4215,13 +4722,13 @@ class DistributedDataFrame(AbstractDataHandler):
             # *** NEED TO ENHANCE TO ALLOW OVERWRITING ***
             fs.rm(
                 path=savePath,
-                hdfs=arimo.util.data_backend._ON_LINUX_CLUSTER_WITH_HDFS,
+                hdfs=fs._hdfs_available(),
                 is_dir=True,
                 hadoop_home=arimo.util.data_backend._HADOOP_HOME)
 
             pipelineModelWithoutVectors.save(path=savePath)
 
-            if arimo.util.data_backend._ON_LINUX_CLUSTER_WITH_HDFS:
+            if fs._hdfs_available():
                 fs.get(
                     from_hdfs=savePath,
                     to_local=savePath,
@@ -4352,6 +4859,7 @@ class DistributedDataFrame(AbstractDataHandler):
                  else colsToKeep))
 
         adf._cache.reprSample = self._cache.reprSample
+        adf._cache.reprSampleArrow = self._cache.reprSampleArrow
 
         if verbose:
             toc = time.time()
@@ -4366,7 +4874,9 @@ class DistributedDataFrame(AbstractDataHandler):
     # *******************************
     # ITERATIVE GENERATION / SAMPLING
     # _collectCols
+    # _sparkDFWithVectorsAsArrays
     # collect
+    # _genOverTimeArraysByPandas
     # _prepareArgsForSampleOrGenOrPred
     # sample
     # gen
@@ -4420,11 +4930,18 @@ class DistributedDataFrame(AbstractDataHandler):
 
             colWidth = self._colWidth(col)
 
+            # over-time arrays from the Pandas engine come through Arrow as NumPy arrays,
+            # whose truth value is ambiguous
+            lists = [ls
+                     if (ls is not None) and len(ls)
+                     else None
+                     for ls in lists]
+
             try:
                 firstNonEmptyRow = \
                     next(lists[i]
                          for i in range(nRows)
-                         if lists[i])
+                         if lists[i] is not None)
 
                 firstValue = firstNonEmptyRow[0]
 
@@ -4440,11 +4957,11 @@ class DistributedDataFrame(AbstractDataHandler):
                                     nRows=padUpToNTimeSteps,
                                     padValue=padValue),
                                 axis=0)
-                             if ls
+                             if ls is not None
                              else arrayForEmptyRows)
                             for ls in lists)
 
-                elif isinstance(firstValue, (list, tuple)):
+                elif isinstance(firstValue, (list, tuple, numpy.ndarray)):
                     isVector = [isinstance(v, Vector) for v in firstValue]
                     isIterable = [isinstance(v, (list, tuple)) for v in firstValue]
 
@@ -4454,7 +4971,7 @@ class DistributedDataFrame(AbstractDataHandler):
                                     nRows=padUpToNTimeSteps,
                                     padValue=padValue),
                                 axis=0)
-                             if ls
+                             if ls is not None
                              else arrayForEmptyRows)
                             for ls in lists) \
                         if any(isVector) or any(isIterable) \
@@ -4464,17 +4981,19 @@ class DistributedDataFrame(AbstractDataHandler):
                                     nRows=padUpToNTimeSteps,
                                     padValue=padValue),
                                 axis=0)
-                             if ls
+                             if ls is not None
                              else arrayForEmptyRows)
                             for ls in lists)
 
                 else:
                     return numpy.vstack(
-                            numpy.expand_dims(
+                            (numpy.expand_dims(
                                 pad(array=numpy.expand_dims(ls, axis=1),
                                     nRows=padUpToNTimeSteps,
                                     padValue=padValue),
                                 axis=0)
+                             if ls is not None
+                             else arrayForEmptyRows)
                             for ls in lists)
 
             except StopIteration:
@@ -4487,21 +5006,27 @@ class DistributedDataFrame(AbstractDataHandler):
             isIterable = []
 
             if isinstance(pandasDF_or_rddRows, pandas.DataFrame):
+                # Vectors converted to arrays in Spark come through Arrow as NumPy arrays
+                isArray = []
+
                 for col in cols:
                     firstValue = pandasDF_or_rddRows[col].iat[0]
                     isVector.append(isinstance(firstValue, Vector))
+                    isArray.append(isinstance(firstValue, numpy.ndarray))
                     isIterable.append(isinstance(firstValue, (list, tuple)))
 
                 return numpy.hstack(
                         (numpy.vstack(v.toArray()
                                       for v in pandasDF_or_rddRows[col])
                          if isVector[i]
-                         else (numpy.vstack(flatten(v)
-                                            for v in pandasDF_or_rddRows[col])
-                               if isIterable[i]
-                               else pandasDF_or_rddRows[[col]].values))
+                         else (numpy.vstack(pandasDF_or_rddRows[col].tolist())
+                               if isArray[i]
+                               else (numpy.vstack(flatten(v)
+                                                  for v in pandasDF_or_rddRows[col])
+                                     if isIterable[i]
+                                     else pandasDF_or_rddRows[[col]].values)))
                         for i, col in enumerate(cols)) \
-                    if any(isVector) or any(isIterable) \
+                    if any(isVector) or any(isArray) or any(isIterable) \
                     else pandasDF_or_rddRows[cols].values
 
             else:
@@ -4520,6 +5045,27 @@ class DistributedDataFrame(AbstractDataHandler):
                             for i, col in enumerate(cols))
                         for row in pandasDF_or_rddRows)
 
+    def _sparkDFWithVectorsAsArrays(self, sparkDF=None):
+        """
+        Return:
+            ``Spark DataFrame`` with Vector columns converted to ``array<double>`` natively in the JVM,
+            so that they can be collected through Arrow & without per-row Python deserialization
+        """
+        if sparkDF is None:
+            sparkDF = self._sparkDF
+
+        vectorCols = [field.name
+                      for field in sparkDF.schema.fields
+                      if isinstance(field.dataType, VectorUDT)]
+
+        return sparkDF.select(
+                *((arimo.util.data_backend.vectorToArray(sparkDF[col]).alias(col)
+                   if col in vectorCols
+                   else sparkDF[col])
+                  for col in sparkDF.columns)) \
+            if vectorCols \
+            else sparkDF
+
     def collect(self, *colsLists, **kwargs):
         anon = kwargs.get('anon', False)
         asPandas = kwargs.get('pandas', True)
@@ -4532,7 +5078,12 @@ class DistributedDataFrame(AbstractDataHandler):
                 list(colsLists)
 
             df = self._sparkDF \
-                .select(*set(flatten(colsLists))) \
+                .select(*set(flatten(colsLists)))
+
+            # Pandas results keep Vector objects
+            df = (df
+                  if asPandas
+                  else self._sparkDFWithVectorsAsArrays(df)) \
                 .toPandas()
 
             return [self._collectCols(df, cols, asPandas=asPandas)
@@ -4548,6 +5099,132 @@ class DistributedDataFrame(AbstractDataHandler):
                     else self.columns,
                 asPandas=asPandas)
 
+    def _genOverTimeArraysByPandas(self, cols, overTimeSpecs, padValue=None, filterCol=None, keepOrigRows=False):
+        """
+        Alternative to ``COLLECT_LIST(NAMED_STRUCT(...)) OVER (PARTITION BY iCol, tChunk ORDER BY tOrd ROWS BETWEEN ...)``:
+        each (iCol, tChunk) group is sorted once in a Pandas worker (via Arrow),
+        all windows are taken as NumPy stride-trick views,
+        and each over-time result column comes out as an ``array<array<double>>`` (time steps x features)
+        rather than an array of structs; as with the SQL engine, windows of rows near the chunk's boundaries
+        are shorter if ``padValue`` is ``None``, else padded to fixed shape with ``padValue``
+
+        Args:
+            cols: non-over-time columns to carry over
+
+            overTimeSpecs: series of (result column, numerical columns, relative row from, relative row to) tuples
+
+            padValue: value for positions beyond the chunk's boundaries (default: None, i.e. no padding)
+
+            filterCol (str): optional Boolean column: over-time results are NULL where it is false
+
+            keepOrigRows (bool): whether to keep rows where ``filterCol`` is false (otherwise they are dropped)
+
+        Return:
+            ``DistributedDataFrame``
+        """
+        tOrdCol = self._T_ORD_COL
+
+        inCols = list(cols)
+
+        for col in {self._iCol, self._T_CHUNK_COL, tOrdCol} \
+                .union(col for _, specCols, _, _ in overTimeSpecs for col in specCols) \
+                .difference(inCols):
+            inCols.append(col)
+
+        if filterCol:
+            inCols.append(filterCol)
+
+        outCols = list(cols)
+
+        dropExcluded = filterCol and (not keepOrigRows)
+
+        schema = self._sparkDF.schema
+
+        outSchema = \
+            StructType(
+                [schema[col] for col in outCols] +
+                [StructField(
+                    name=resultCol,
+                    dataType=ArrayType(ArrayType(DoubleType())),
+                    nullable=True)
+                 for resultCol, _, _, _ in overTimeSpecs])
+
+        fillValue = \
+            numpy.nan \
+            if padValue is None \
+            else float(padValue)
+
+        # *** self-contained: executed by Python workers ***
+        def overTimeArrays(pandasDF):
+            from numpy.lib.stride_tricks import sliding_window_view
+
+            pandasDF = pandasDF.sort_values(by=tOrdCol, ignore_index=True)
+
+            nRows = len(pandasDF)
+
+            result = pandasDF[outCols]
+
+            excluded = \
+                ~pandasDF[filterCol].fillna(False).to_numpy(dtype=bool) \
+                if filterCol \
+                else None
+
+            for resultCol, specCols, rowFrom, rowTo in overTimeSpecs:
+                nTimeSteps = rowTo - rowFrom + 1
+
+                # row i's window is padded[(i + rowFrom + nBefore):(i + rowTo + nBefore + 1)]
+                nBefore = max(-rowFrom, 0)
+
+                padded = \
+                    numpy.full(
+                        shape=(nBefore + nRows + max(rowTo, 0), len(specCols)),
+                        fill_value=fillValue)
+
+                padded[nBefore:(nBefore + nRows)] = \
+                    pandasDF[list(specCols)].to_numpy(dtype=float, na_value=numpy.nan)
+
+                # (nRows, nFeatures, nTimeSteps) view, no copy
+                windows = \
+                    sliding_window_view(padded, window_shape=nTimeSteps, axis=0)[
+                        (rowFrom + nBefore):(rowFrom + nBefore + nRows)]
+
+                arrays = windows.transpose(0, 2, 1).tolist()
+
+                if padValue is None:
+                    # like the SQL engine: windows of rows near the chunk's boundaries are shorter, not padded
+                    for i in range(min(max(-rowFrom, 0), nRows)):
+                        arrays[i] = arrays[i][(-rowFrom - i):]
+
+                    for i in range(max(nRows - max(rowTo, 0), 0), nRows):
+                        nBeyond = i + rowTo - (nRows - 1)
+
+                        if nBeyond > 0:
+                            arrays[i] = arrays[i][:max(len(arrays[i]) - nBeyond, 0)]
+
+                if (excluded is not None) and (not dropExcluded):
+                    for i in numpy.flatnonzero(excluded):
+                        arrays[i] = None
+
+                result = result.assign(**{resultCol: arrays})
+
+            return result.loc[~excluded] \
+                if dropExcluded \
+                else result
+
+        adf = self._decorate(
+            obj=self._sparkDF
+                .select(*inCols)
+                .groupBy(self._iCol, self._T_CHUNK_COL)
+                .applyInPandas(overTimeArrays, schema=outSchema),
+            nRows=None
+                if dropExcluded
+                else self._cache.nRows)
+
+        if not dropExcluded:
+            adf._inheritCache(self)
+
+        return adf
+
     @lru_cache()
     def _prepareArgsForSampleOrGenOrPred(self, *args, **kwargs):
         def cols_rowFrom_rowTo(x):
@@ -4588,6 +5265,8 @@ class DistributedDataFrame(AbstractDataHandler):
             # only relevant for Time Series scoring use cases
             keepOrigRows = kwargs.get('keepOrigRows')
 
+        overTimeEngine = kwargs.get('overTimeEngine', 'sql')
+
         overTimeColWidths = {}
         
         finalTotalNRows = None
@@ -4600,6 +5279,9 @@ class DistributedDataFrame(AbstractDataHandler):
 
                 sqlItems = set(self.indexCols + self.tAuxCols)
 
+                plainCols = set(sqlItems)
+                overTimeSpecs = []
+
                 if filterCondition:
                     _FILTER_COL_NAME = '__FILTER__'
 
@@ -4624,6 +5306,7 @@ class DistributedDataFrame(AbstractDataHandler):
                 for cols, rowFrom, rowTo in map(cols_rowFrom_rowTo, args):
                     if (rowFrom is None) and (rowTo is None):
                         sqlItems.update(cols)
+                        plainCols.update(cols)
                         colsLists.append(cols)
                         colsOverTime.append(False)
                         padUpToNTimeSteps.append(None)
@@ -4682,6 +5365,8 @@ class DistributedDataFrame(AbstractDataHandler):
                                 sqlItem,
                                 resultCol))
 
+                        overTimeSpecs.append((resultCol, tuple(cols), rowFrom, rowTo))
+
                         colsLists.append([resultCol])
                         colsOverTime.append(True)
                         padUpToNTimeSteps.append(rowTo - rowFrom + 1)
@@ -4689,7 +5374,30 @@ class DistributedDataFrame(AbstractDataHandler):
                         overTimeColWidths[resultCol] = \
                             sum(self._colWidth(*cols, asDict=True).values())
 
-                if filterCondition:
+                # the Pandas engine only handles numerical over-time columns,
+                # and cannot carry Vector columns through Arrow
+                if (overTimeEngine == 'pandas') and overTimeSpecs and \
+                        all(self.typeIsNum(col)
+                            for _, cols, _, _ in overTimeSpecs
+                            for col in cols) and \
+                        all(self.type(col) != _VECTOR_TYPE
+                            for col in plainCols):
+                    adf = (adf if filterCondition else self) \
+                        ._genOverTimeArraysByPandas(
+                            cols=sorted(plainCols),
+                            overTimeSpecs=overTimeSpecs,
+                            padValue=padValue,
+                            filterCol=_FILTER_COL_NAME
+                                if filterCondition
+                                else None,
+                            keepOrigRows=keepOrigRows
+                                if filterCondition
+                                else False)
+
+                    if filterCondition and (not keepOrigRows):
+                        finalTotalNRows = adf.nRows
+
+                elif filterCondition:
                     if keepOrigRows:
                         adf('SELECT {} FROM this {}'.format(
                                 ', '.join(sqlItems),
@@ -4816,18 +5524,31 @@ class DistributedDataFrame(AbstractDataHandler):
 
                 - **padValue**: *(only applicable to time-series data)* value to pad short extracted series to desired max series length
 
+                - **overTimeEngine** *(str, default = 'sql')*: *(only applicable to time-series data)* how to extract over-time series:
+                    - ``sql``: ``COLLECT_LIST`` of ``NAMED_STRUCT`` s over *SQL* windows
+                    - ``pandas``: 1 sort per (``.iCol``, time chunk) in Pandas workers, with NumPy stride-trick windows,
+                      producing ``array<array<double>>`` (time steps x features) over-time columns
+                      instead of arrays of structs; only used when all over-time columns are numerical
+
                 - **alias** *(str, default = None)*: name of the resulting sampled ``DistributedDataFrame``; only applicable when ``*args`` is empty and ``collect = False``
         """
         preparedArgs = self._prepareArgsForSampleOrGenOrPred(*args, **kwargs)
 
         if preparedArgs.collect:
+            asPandas = preparedArgs.collect.lower() == 'pandas'
+
             df = ()
 
             while not len(df):
                 df = preparedArgs.adf._sparkDF.sample(
                         withReplacement=preparedArgs.withReplacement,
                         fraction=preparedArgs.fraction,
-                        seed=preparedArgs.seed) \
+                        seed=preparedArgs.seed)
+
+                # Pandas results keep Vector objects
+                df = (df
+                      if asPandas
+                      else preparedArgs.adf._sparkDFWithVectorsAsArrays(df)) \
                     .toPandas()
 
             if not preparedArgs.anon:
@@ -4836,8 +5557,6 @@ class DistributedDataFrame(AbstractDataHandler):
                 preparedArgs.padUpToNTimeSteps.insert(0, None)
                 preparedArgs.padBefore.insert(0, None)
 
-            asPandas = preparedArgs.collect.lower() == 'pandas'
-
             if len(preparedArgs.colsLists) > 1:
                 return [df[cols] for cols in preparedArgs.colsLists] \
                     if asPandas \
@@ -4953,13 +5672,18 @@ class DistributedDataFrame(AbstractDataHandler):
                 self.stdout_logger.debug(
                     msg='*** CACHED FOR STREAMING: {} ROWS   <{:,.1f} m> ***'.format(adf.nRows, (toc - tic) / 60))
 
-        g = adf.toLocalIterator()
+        # Pandas results keep Vector objects
+        sparkDF = adf._sparkDF \
+            if asPandas \
+            else adf._sparkDFWithVectorsAsArrays()
+
+        g = sparkDF.toLocalIterator()
         
         while True:
             rows = list(itertools.islice(g, preparedArgs.n))
 
             while len(rows) < preparedArgs.n:
-                g = adf.toLocalIterator()
+                g = sparkDF.toLocalIterator()
                 rows += list(itertools.islice(g, preparedArgs.n - len(rows)))
 
             yield [adf._collectCols(
@@ -5020,7 +5744,7 @@ class DistributedDataFrame(AbstractDataHandler):
 
         Return:
             - If ``DistributedDataFrame``'s ``.tCol`` property is set, implying the data contains time series, return deterministic
-                partitions per ``id`` through time
+                partitions per ``id`` through time, assigning each (``id``, time chunk) combo by its hash
 
             - If ``DistributedDataFrame`` does not contain time series, randomly shuffle the data and return shuffled sub-``DistributedDataFrame``'s
 
@@ -5029,60 +5753,41 @@ class DistributedDataFrame(AbstractDataHandler):
 
             **kwargs:
 
-                - **seed** (int): randomizer seed; *ignored* in the case of deterministic splitting when ``.tCol`` is set
+                - **seed** (int): randomizer seed; in the case of deterministic splitting when ``.tCol`` is set,
+                    hash seed (same seed, same splits)
         """
         if (not weights) or weights == (1,):
             return self
 
         elif self.hasTS:
-            nWeights = len(weights)
-            cumuWeights = numpy.cumsum(weights) / sum(weights)
+            # assign each (id, chunk) combo to a split by hashing it into 2 ^ k buckets
+            # & comparing the bucket against the cumulative weights:
+            # deterministic, & each split is a cheap per-partition predicate (no collection of combos to the driver)
+            seed = kwargs.pop('seed', None)
 
-            _TS_CHUNK_ID_COL = '__TS_CHUNK_ID__'
+            bucketExpr = \
+                'PMOD(XXHASH64({}, {}, {}), {})'.format(
+                    self._iCol,
+                    self._T_CHUNK_COL,
+                    int(seed) if seed else 0,
+                    self._TS_SPLIT_N_HASH_BUCKETS)
 
-            adf = self(
-                '*',
-                "CONCAT(STRING({}), '---', STRING({})) AS {}"
-                    .format(
-                        self._iCol,
-                        self._T_CHUNK_COL,
-                        _TS_CHUNK_ID_COL),
-                inheritCache=True,
-                inheritNRows=True)
-
-            tsChunkIDs = \
-                adf('SELECT \
-                        DISTINCT({}) \
-                    FROM \
-                        this'.format(_TS_CHUNK_ID_COL),
-                    inheritCache=False,
-                    inheritNRows=False) \
-                    .toPandas()[_TS_CHUNK_ID_COL] \
-                    .unique().tolist()
-
-            nTSChunkIDs = len(tsChunkIDs)
+            cumuBuckets = \
+                [0] + \
+                [int(round(cumuWeight * self._TS_SPLIT_N_HASH_BUCKETS))
+                 for cumuWeight in numpy.cumsum(weights) / sum(weights)]
 
             if arimo.debug.ON:
                 self.stdout_logger.debug(
-                    msg='*** SPLITTING BY ID-AND-CHUNK-NUMBER / PARTITION-AND-ID COMBOS ({} COMBOS IN TOTAL) ***'
-                        .format(nTSChunkIDs))
-
-            cumuIndices = \
-                [0] + \
-                [int(round(cumuWeights[i] * nTSChunkIDs))
-                 for i in range(nWeights)]
-
-            random.shuffle(tsChunkIDs)
-
-            adfs = [adf.filter(
-                        condition=
-                            '{} IN ({})'.format(
-                                _TS_CHUNK_ID_COL,
-                                ', '.join(
-                                    "'{0}'".format(_)
-                                    for _ in tsChunkIDs[cumuIndices[i]:cumuIndices[i + 1]])))
-                        .drop(_TS_CHUNK_ID_COL)
-                    for i in range(nWeights)]
+                    msg='*** SPLITTING BY ID-AND-CHUNK-NUMBER COMBOS INTO HASH BUCKET RANGES {} ***'
+                        .format(cumuBuckets))
+
+            adfs = [self.filter(
+                        condition='({0} >= {1}) AND ({0} < {2})'.format(
+                            bucketExpr,
+                            cumuBuckets[i],
+                            cumuBuckets[i + 1]))
+                    for i in range(len(weights))]
 
         else:
             seed = kwargs.pop('seed', None)
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import math
 import numpy
 import os
@@ -51,11 +52,33 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
 
     _CACHE = {}
 
+    # number of threads reading piece footers to decide whether Spark needs to merge schemas
+    _SCHEMA_MERGE_CHECK_N_THREADS = 32
+
     # *****************
     # METHODS TO CREATE
+    # _srcSchemasDiffer
     # __init__
     # load
 
+    @classmethod
+    def _srcSchemasDiffer(cls, arrowDS):
+        """
+        Compare Arrow schemas from the footers of all pieces
+        (metadata only, read concurrently)
+        """
+        if len(arrowDS.pieces) < 2:
+            return False
+
+        with ThreadPoolExecutor(max_workers=cls._SCHEMA_MERGE_CHECK_N_THREADS) as executor:
+            schemas = list(
+                executor.map(
+                    lambda piece: piece.get_metadata().schema.to_arrow_schema(),
+                    arrowDS.pieces))
+
+        return any(not schema.equals(schemas[0])
+                   for schema in schemas[1:])
+
     def __init__(
             self, path, aws_access_key_id=None, aws_secret_access_key=None, reCache=False,
             _initSparkDF=None, _sparkDFTransforms=[], _sparkDF=None,
@@ -94,9 +117,9 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
                             key=aws_access_key_id,
                             secret=aws_secret_access_key)
                         if path.startswith('s3')
-                        else (self._HDFS_ARROW_FS
-                              if fs._ON_LINUX_CLUSTER_WITH_HDFS
-                              else self._LOCAL_ARROW_FS),
+                        else (self._hdfsArrowFS()
+                              if fs._hdfs_available()
+                              else self._localArrowFS()),
                     schema=None, validate_schema=False, metadata=None,
                     split_row_groups=False)
 
@@ -132,6 +155,17 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
                 _cache.pieceSubPaths = {os.path.basename(path)}
                 _cache._partitionedByDateOnly = False
 
+            # Spark-side schema merging reads all footers, so only do it when piece schemas actually differ
+            _cache._mergeSchema = self._srcSchemasDiffer(_cache._srcArrowDS)
+
+            arimo.util.data_backend._reportSparkConf(
+                'spark.sql.parquet.mergeSchema[{}]'.format(self.path),
+                _cache._mergeSchema,
+                'piece schemas {}'.format(
+                    'differ'
+                    if _cache._mergeSchema
+                    else 'identical'))
+
             if path.startswith('s3'):
                 _cache.s3Client = \
                     s3.client(
@@ -169,7 +203,8 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
             _srcSparkDF = \
                 arimo.util.data_backend.spark.read.load(
                     path=path,
-                    format='parquet')
+                    format='parquet',
+                    mergeSchema=_cache._mergeSchema)
 
             _schema = _srcSparkDF.schema
 
@@ -679,14 +714,22 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
                                 self.tmpDirPath,
                                 str(uuid.uuid4()))
 
-                        for pieceSubPath in \
-                                (tqdm.tqdm(pieceSubPaths)
-                                 if verbose
-                                 else pieceSubPaths):
-                            fs.cp(
-                                from_path=os.path.join(self.path, pieceSubPath),
-                                to_path=os.path.join(subsetPath, pieceSubPath),
-                                hdfs=fs._ON_LINUX_CLUSTER_WITH_HDFS, is_dir=False)
+                        _progressBar = \
+                            tqdm.tqdm(total=len(pieceSubPaths)) \
+                            if verbose \
+                            else None
+
+                        fs.batch_cp(
+                            ((os.path.join(self.path, pieceSubPath),
+                              os.path.join(subsetPath, pieceSubPath))
+                             for pieceSubPath in pieceSubPaths),
+                            hdfs=fs._hdfs_available(), is_dir=False,
+                            callback=(lambda *paths: _progressBar.update(1))
+                                if verbose
+                                else None)
+
+                        if verbose:
+                            _progressBar.close()
 
                         aws_access_key_id = aws_secret_access_key = None
 
@@ -982,6 +1025,7 @@ class S3ParquetDistributedDataFrame(AbstractS3ParquetDataHandler, DDF):
         self._reprSampleSize = adf.nRows
 
         self._cache.reprSample = adf
+        self._cache.reprSampleArrow = None   # re-collected on next .reprSampleArrow access
 
         self._cache.nonNullProportion = {}
         self._cache.suffNonNull = {}
@@ -8,8 +8,6 @@ import os
 import pandas
 import random
 import re
-from sklearn.exceptions import DataConversionWarning
-from sklearn.preprocessing import MaxAbsScaler, MinMaxScaler, StandardScaler
 import tempfile
 import time
 import tqdm
@@ -17,10 +15,7 @@ from urllib.parse import urlparse
 import uuid
 import warnings
 
-from pyarrow.filesystem import LocalFileSystem
-from pyarrow.hdfs import HadoopFileSystem
 from pyarrow.parquet import ParquetDataset, read_metadata, read_schema, read_table
-from s3fs import S3FileSystem
 
 from arimo.util import DefaultDict, fs, Namespace
 from arimo.util.aws import s3
@@ -28,41 +23,49 @@ from arimo.util.date_time import gen_aux_cols, DATE_COL
 from arimo.util.decor import enable_inplace, _docstr_verbose
 from arimo.util.iterables import to_iterable
 from arimo.util.types.arrow import \
-    _ARROW_INT_TYPE, _ARROW_DOUBLE_TYPE, _ARROW_STR_TYPE, _ARROW_DATE_TYPE, \
+    _ARROW_INT_TYPE, _ARROW_DOUBLE_TYPE, _ARROW_STR_TYPE, _ARROW_DATE_TYPE, _STR_TYPE, \
     is_binary, is_boolean, is_complex, is_num, is_possible_cat, is_string
 from arimo.util.types.numpy_pandas import NUMPY_FLOAT_TYPES, NUMPY_INT_TYPES, PY_NUM_TYPES
-from arimo.util.types.spark_sql import _STR_TYPE
 import arimo.debug
 
 from . import AbstractDataHandler
-from .distributed import DDF
 
 
 _NUM_CLASSES = int, float
 
 
-# filter out DataConversionWarning re: int64 in DL training
-warnings.filterwarnings(
-    action='ignore',
-    category=DataConversionWarning)
-
-
 class AbstractS3ParquetDataHandler(AbstractDataHandler):
     _SCHEMA_MIN_N_PIECES = 10
     _REPR_SAMPLE_MIN_N_PIECES = 100
 
     # file systems
-    _LOCAL_ARROW_FS = LocalFileSystem()
-
-    _HDFS_ARROW_FS = \
-        HadoopFileSystem(
-            host='default',
-            port=0,
-            user=None,
-            kerb_ticket=None,
-            driver='libhdfs') \
-        if fs._ON_LINUX_CLUSTER_WITH_HDFS \
-        else None
+    _LOCAL_ARROW_FS = None   # created on first use, not at import time
+
+    _HDFS_ARROW_FS = None   # connected on first use, not at import time
+
+    @classmethod
+    def _localArrowFS(cls):
+        if AbstractS3ParquetDataHandler._LOCAL_ARROW_FS is None:
+            from pyarrow.filesystem import LocalFileSystem
+
+            AbstractS3ParquetDataHandler._LOCAL_ARROW_FS = LocalFileSystem()
+
+        return AbstractS3ParquetDataHandler._LOCAL_ARROW_FS
+
+    @classmethod
+    def _hdfsArrowFS(cls):
+        if (AbstractS3ParquetDataHandler._HDFS_ARROW_FS is None) and fs._hdfs_available():
+            from pyarrow.hdfs import HadoopFileSystem
+
+            AbstractS3ParquetDataHandler._HDFS_ARROW_FS = \
+                HadoopFileSystem(
+                    host='default',
+                    port=0,
+                    user=None,
+                    kerb_ticket=None,
+                    driver='libhdfs')
+
+        return AbstractS3ParquetDataHandler._HDFS_ARROW_FS
 
     @property
     def reprSampleMinNPieces(self):
@@ -250,6 +253,15 @@ class _S3ParquetDataFeeder__prep__pandasDFTransform:
 
         self.numScaler = numOrigToPrepColMap['__SCALER__']
 
+        if self.numScaler:
+            from sklearn.exceptions import DataConversionWarning
+            from sklearn.preprocessing import MaxAbsScaler, MinMaxScaler, StandardScaler
+
+            # filter out DataConversionWarning re: int64 in DL training
+            warnings.filterwarnings(
+                action='ignore',
+                category=DataConversionWarning)
+
         if self.numScaler == 'standard':
             self.numScaler = \
                 StandardScaler(
@@ -880,6 +892,8 @@ class S3ParquetDataFeeder(AbstractS3ParquetDataHandler):
                     access_key_id=aws_access_key_id, secret_access_key=aws_secret_access_key,
                     verbose=False)
 
+                from s3fs import S3FileSystem
+
                 _cache._srcArrowDS = \
                     ParquetDataset(
                         path_or_paths=path,
@@ -897,9 +911,9 @@ class S3ParquetDataFeeder(AbstractS3ParquetDataHandler):
                             if isinstance(path, tuple)
                             else path,
                         filesystem=
-                            self._HDFS_ARROW_FS
+                            self._hdfsArrowFS()
                             if self.fromHDFS
-                            else self._LOCAL_ARROW_FS,
+                            else self._localArrowFS(),
                         schema=None, validate_schema=False, metadata=None,
                         split_row_groups=False)
 
@@ -3139,6 +3153,8 @@ class S3ParquetDataFeeder(AbstractS3ParquetDataHandler):
                     before='after',
                     after='before')
 
+            from .distributed import DDF
+
             _TS_WINDOW_DEFS = \
                 Namespace(
                     partition=
@@ -3553,7 +3569,7 @@ class S3ParquetDataFeeder(AbstractS3ParquetDataHandler):
                 pipelineModelWithoutVectors = prepCache.pipelineModelWithoutVectors
 
             else:
-                if fs._ON_LINUX_CLUSTER_WITH_HDFS:
+                if fs._hdfs_available():
                     localDirExists = os.path.isdir(loadPath)
 
                     hdfsDirExists = \
@@ -60,97 +60,242 @@ def import_obj(name):
         obj_name)
 
 
-def interpolate(series, method='mean', inplace=False):
-    if isinstance(series, pandas.Series):
-        is_pandas_series = True
-        values = series.values
+_LAZY_SUBMODULES = {
+    'aws', 'cache', 'data_backend', 'date_time', 'decor', 'dl', 'eval_metrics',
+    'fs', 'hashing', 'iterables', 'log', 'pkl', 'types'
+}
+
+
+def __getattr__(name):
+    # PEP 562: after a bare "import arimo.util", sub-modules such as "arimo.util.fs"
+    # are imported on first attribute access rather than up front
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module('{}.{}'.format(__name__, name))
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+_INTERPOLATE_METHODS = 'mean', 'avg', 'average', 'before', 'after', 'linear'
+
+
+def _fill_indices(null, group_start=None, group_end=None):
+    """
+    Return, for every position, the index of the nearest non-null position before / after it
+    (or of a null position, where there is none), not crossing group boundaries
+    """
+    import numpy
+
+    n = len(null)
+    positions = numpy.arange(n)
+
+    # a group's 1st / last position anchors the propagation, so that it never leaks across groups
+    prev_idx = \
+        numpy.maximum.accumulate(
+            numpy.where(
+                ~null if group_start is None else (~null | group_start),
+                positions,
+                0))
+
+    next_idx = \
+        numpy.minimum.accumulate(
+            numpy.where(
+                ~null if group_end is None else (~null | group_end),
+                positions,
+                n - 1)[::-1])[::-1]
+
+    return prev_idx, next_idx
+
+
+def _interpolate_values(values, null, method, x=None, group_start=None, group_end=None):
+    import numpy
+
+    if not null.any():
+        return values
+
+    if method in ('before', 'after'):
+        fill_idx = _fill_indices(null, group_start=group_start, group_end=group_end)[method == 'after']
+        return values[fill_idx]
+
+    prev_idx, next_idx = _fill_indices(null, group_start=group_start, group_end=group_end)
+
+    # interior gaps only: leading / trailing NULLs have no neighbour on 1 side & stay NULL
+    gaps = numpy.flatnonzero(null & ~null[prev_idx] & ~null[next_idx])
+
+    if not len(gaps):
+        return values
+
+    values = values.astype(float)
+    prev_vals = values[prev_idx[gaps]]
+    next_vals = values[next_idx[gaps]]
+
+    if method == 'linear':
+        if x is None:
+            x = numpy.arange(len(values), dtype=float)
+
+        if (group_start is None) and ((len(x) < 2) or (numpy.diff(x) > 0).all()):
+            non_null = numpy.flatnonzero(~null)
+            values[gaps] = numpy.interp(x[gaps], x[non_null], values[non_null])
+
+        else:
+            # non-monotonic index or grouped: interpolate between each gap's own neighbours
+            x_range = x[next_idx[gaps]] - x[prev_idx[gaps]]
+            with numpy.errstate(divide='ignore', invalid='ignore'):
+                values[gaps] = \
+                    numpy.where(
+                        x_range != 0,
+                        prev_vals + (x[gaps] - x[prev_idx[gaps]]) / x_range * (next_vals - prev_vals),
+                        (prev_vals + next_vals) / 2)
+
     else:
-        is_pandas_series = False
-        values = list(series)
+        values[gaps] = (prev_vals + next_vals) / 2
 
-    n_items = len(series)
-    method = method.lower()
+    return values
 
-    if method in ('mean', 'avg', 'average'):
-        i = 0
-        i_must_be_less_than = n_items - 2
-        j_must_be_less_than = n_items
-        while i < i_must_be_less_than:
-            while not (pandas.notnull(values[i]) and pandas.isnull(values[i + 1])) and (i < i_must_be_less_than):
-                i += 1
-            if i < i_must_be_less_than:
-                j = i + 2
-                while pandas.isnull(values[j]) and (j < j_must_be_less_than):
-                    j += 1
-                if j < j_must_be_less_than:
-                    values[(i + 1):j] = (j - i - 1) * ((values[i] + values[j]) / 2,)
-                i = j
-
-    elif method == 'before':
-        for i in range(1, n_items):
-            if pandas.isnull(values[i]):
-                values[i] = values[i - 1]
-
-    elif method == 'after':
-        for i in reversed(range(n_items - 1)):
-            if pandas.isnull(values[i]):
-                values[i] = values[i + 1]
-
-    elif method == 'linear':
-        pandas_series_by_num = False
-        pandas_series_by_datetime = False
-        pandas_series_by_pandas_timestamp = False
-        if is_pandas_series:
-            first_index = series.index[0]
-            if isinstance(first_index, (int, float)):
-                pandas_series_by_num = True
-            elif isinstance(first_index, (datetime.date, datetime.datetime)):
-                pandas_series_by_datetime = True
-            elif isinstance(first_index, pandas.tslib.Timestamp):
-                pandas_series_by_pandas_timestamp = True
-
-        i = 0
-        i_must_be_less_than = n_items - 2
-        j_must_be_less_than = n_items
-        while i < i_must_be_less_than:
-            while not (pandas.notnull(values[i]) and pandas.isnull(values[i + 1])) and (i < i_must_be_less_than):
-                i += 1
-            if i < i_must_be_less_than:
-                j = i + 2
-                while pandas.isnull(values[j]) and (j < j_must_be_less_than):
-                    j += 1
-                if j < j_must_be_less_than:
-                    if pandas_series_by_num or pandas_series_by_datetime or pandas_series_by_pandas_timestamp:
-                        index_range = series.index[j] - series.index[i]
-                        value_range = values[j] - values[i]
-                        if index_range:
-                            for k in range(i + 1, j):
-                                values[k] = \
-                                    values[i] + \
-                                    (((series.index[k] - series.index[i]).total_seconds() / index_range.total_second())
-                                     if pandas_series_by_datetime
-                                     else ((series.index[k] - series.index[i]) / index_range)) * value_range
-                        else:
-                            values[(i + 1):j] = (j - i - 1) * ((values[i] + values[j]) / 2,)
-                    else:
-                        values[i:(j + 1)] = \
-                            numpy.linspace(
-                                start=values[i],
-                                stop=values[j],
-                                num=j - i + 1,
-                                endpoint=True,
-                                retstep=False)
-                i = j
 
-    if inplace:
-        if is_pandas_series:
+def _interpolate_x(series):
+    # positions to interpolate linearly against: numerical or date-time index of a Pandas series, else ordinal
+    import pandas
+
+    index = series.index
+
+    if pandas.api.types.is_numeric_dtype(index.dtype):
+        return index.to_numpy(dtype=float)
+
+    elif pandas.api.types.is_datetime64_any_dtype(index.dtype) or \
+            (len(index) and isinstance(index[0], (datetime.date, datetime.datetime))):
+        return pandas.to_datetime(index).to_numpy(dtype='datetime64[ns]').astype('int64').astype(float)
+
+
+def _interpolate_result(series, values, inplace):
+    import numpy
+    import pandas
+
+    from .iterables import to_iterable
+
+    if isinstance(series, pandas.Series):
+        if inplace:
+            series[:] = values
+        else:
+            return pandas.Series(index=series.index, data=values, name=series.name)
+
+    elif isinstance(series, numpy.ndarray):
+        if inplace:
             series[:] = values
         else:
-            series = values
+            return values
+
+    elif inplace:
+        series[:] = values.tolist()
+
     else:
-        return pandas.Series(index=series.index, data=values) \
-            if is_pandas_series \
-            else iterables.to_iterable(x=values, iterable_type=type(series))
+        return to_iterable(x=values.tolist(), iterable_type=type(series))
+
+
+def interpolate(series, method='mean', inplace=False):
+    """
+    Fill ``NULL``/``NaN`` values of a series (Pandas series, NumPy array or list)
+
+    Args:
+        method (str):
+            - ``'mean'``/``'avg'``/``'average'``: mean of the nearest non-``NULL`` values before & after each gap
+            - ``'before'``: last non-``NULL`` value before (forward fill)
+            - ``'after'``: next non-``NULL`` value after (backward fill)
+            - ``'linear'``: linear interpolation, against the index of a numerically- or date-time-indexed
+                Pandas series, else against position
+
+        inplace (bool): whether to fill ``series`` in place (else return filled copy)
+    """
+    import numpy
+    import pandas
+
+    method = method.lower()
+
+    assert method in _INTERPOLATE_METHODS, \
+        '*** method MUST BE ONE OF {} ***'.format(_INTERPOLATE_METHODS)
+
+    is_pandas_series = isinstance(series, pandas.Series)
+
+    values = \
+        series.to_numpy(copy=True) \
+        if is_pandas_series \
+        else numpy.array(series)
+
+    values = \
+        _interpolate_values(
+            values=values,
+            null=numpy.asarray(pandas.isnull(values)),
+            method=method,
+            x=_interpolate_x(series)
+                if is_pandas_series and (method == 'linear')
+                else None)
+
+    return _interpolate_result(series, values, inplace)
+
+
+def grouped_interpolate(series, by, method='mean', inplace=False):
+    """
+    Fill ``NULL``/``NaN`` values of a series of many entities' series, per entity
+
+    Same as ``interpolate(...)``, but values never propagate across entities;
+    rows of each entity need not be contiguous but must be in time order within the entity
+
+    Args:
+        by: entity / group labels aligned with ``series`` (array-like or name of a Pandas series' index level)
+    """
+    import numpy
+    import pandas
+
+    method = method.lower()
+
+    assert method in _INTERPOLATE_METHODS, \
+        '*** method MUST BE ONE OF {} ***'.format(_INTERPOLATE_METHODS)
+
+    is_pandas_series = isinstance(series, pandas.Series)
+
+    if is_pandas_series and isinstance(by, str):
+        by = series.index.get_level_values(by)
+
+    values = \
+        series.to_numpy(copy=True) \
+        if is_pandas_series \
+        else numpy.array(series)
+
+    n = len(values)
+
+    assert len(by) == n, \
+        '*** by MUST HAVE SAME LENGTH AS series ***'
+
+    x = _interpolate_x(series) \
+        if is_pandas_series and (method == 'linear') \
+        else None
+
+    # stably sort rows by entity, so that each entity's rows are contiguous & still in order
+    codes = pandas.factorize(numpy.asarray(by), sort=False)[0]
+    order = numpy.argsort(codes, kind='stable')
+    sorted_codes = codes[order]
+
+    group_start = numpy.empty(n, dtype=bool)
+    group_end = numpy.empty(n, dtype=bool)
+
+    if n:
+        group_start[0] = group_end[-1] = True
+        group_start[1:] = group_end[:-1] = sorted_codes[1:] != sorted_codes[:-1]
+
+    sorted_values = values[order]
+
+    filled = \
+        _interpolate_values(
+            values=sorted_values,
+            null=numpy.asarray(pandas.isnull(sorted_values)),
+            method=method,
+            x=None if x is None else x[order],
+            group_start=group_start,
+            group_end=group_end)
+
+    values = numpy.empty_like(filled)
+    values[order] = filled
+
+    return _interpolate_result(series, values, inplace)
 
 
 class Namespace(argparse.Namespace):
@@ -442,51 +587,152 @@ class Namespace(argparse.Namespace):
             indent=2)
 
 
-def pandas_fillna(df, *cols, **kwargs):
-    _REVERSE_METHOD_MAP = \
-        dict(ffill='bfill',
-             pad='bfill',
-             bfill='ffill',
-             backfill='ffill')
+_FILLNA_METHOD_MAP = \
+    dict(ffill='ffill',
+         pad='ffill',
+         bfill='bfill',
+         backfill='bfill')
+
+_REVERSE_FILLNA_METHOD_MAP = \
+    dict(ffill='bfill',
+         bfill='ffill')
 
+
+def pandas_fillna(df, *cols, **kwargs):
+    """
+    Fill ``NULL``/``NaN`` values of a Pandas data frame's columns
+
+    Args:
+        *cols (str): columns to fill (default: all columns other than ``i_col``)
+
+        **kwargs:
+            - ``method`` (str): ``'ffill'``/``'pad'`` or ``'bfill'``/``'backfill'``;
+                if ``None``, other ``kwargs`` (e.g. ``value``) are passed to ``DataFrame.fillna(...)``
+            - ``fill_tail`` (bool, default ``True``): also fill in the reverse direction,
+                so that NULLs at the start (forward fill) / end (backward fill) are filled too
+            - ``i_col`` (str, default ``None``): entity column; if given, values never propagate across entities
+            - ``inplace`` (bool): whether to modify ``df`` (only the filled columns are replaced),
+                else return a new frame with the filled columns replaced
+            - ``limit`` (int): max number of consecutive NULLs to fill
+    """
     method = kwargs.pop('method')
     fill_tail = \
         kwargs.pop('fill_tail', True) \
         if method \
         else False
+    i_col = kwargs.pop('i_col', None)
+    inplace = kwargs.pop('inplace')
+
+    cols = \
+        list(cols) \
+        if cols \
+        else [col for col in df.columns if col != i_col]
 
-    if not kwargs.pop('inplace'):
-        df = df.copy(deep=True)
+    if not cols:
+        return df \
+            if inplace \
+            else df.assign()
 
-    if cols:
-        cols = list(cols)
+    if method:
+        method = _FILLNA_METHOD_MAP[method]
 
-        df[cols] = \
-            df[cols].fillna(
-                inplace=False,
-                method=method,
-                **kwargs)
+        filled = df[cols]
 
-        if fill_tail:
-            df[cols] = \
-                df[cols].fillna(
-                    inplace=False,
-                    method=_REVERSE_METHOD_MAP[method],
-                    **kwargs)
+        for _method in ((method, _REVERSE_FILLNA_METHOD_MAP[method])
+                        if fill_tail
+                        else (method,)):
+            filled = getattr(
+                    filled.groupby(df[i_col], sort=False)
+                    if i_col
+                    else filled,
+                    _method)(**kwargs)
 
     else:
-        df.fillna(
-            inplace=True,
-            method=method,
-            **kwargs)
+        filled = df[cols].fillna(**kwargs)
+
+    if inplace:
+        for col in cols:
+            df[col] = filled[col]
+
+        return df
+
+    else:
+        # new frame with the filled columns, never writing into blocks shared with the original frame
+        return df.assign(**{col: filled[col] for col in cols})
+
+
+def arrow_fillna(data, *cols, **kwargs):
+    """
+    Fill ``NULL`` values of an Arrow table / record batch's columns by forward / backward propagation,
+    without a round trip through Pandas
+
+    Args:
+        *cols (str): columns to fill (default: all columns other than ``i_col``)
+
+        **kwargs:
+            - ``method`` (str): ``'ffill'``/``'pad'`` or ``'bfill'``/``'backfill'``
+            - ``fill_tail`` (bool, default ``True``): also fill in the reverse direction
+            - ``i_col`` (str, default ``None``): entity column; values never propagate across changes in it,
+                so each entity's rows must be contiguous (as in time-series-sorted Parquet pieces)
+
+    Return:
+        new table / record batch of the same type
+    """
+    import numpy
+    import pyarrow
+    import pyarrow.compute
+
+    method = _FILLNA_METHOD_MAP[kwargs.pop('method')]
+    fill_tail = kwargs.pop('fill_tail', True)
+    i_col = kwargs.pop('i_col', None)
+
+    assert not kwargs, \
+        '*** UNSUPPORTED KWARGS {} ***'.format(kwargs)
+
+    if not cols:
+        cols = [col for col in data.schema.names if col != i_col]
+
+    n_rows = data.num_rows
+
+    if i_col and n_rows:
+        entities = data.column(i_col)
+        if isinstance(entities, pyarrow.ChunkedArray):
+            entities = entities.combine_chunks()
+
+        changed = \
+            numpy.asarray(
+                pyarrow.compute.not_equal(entities.slice(1), entities.slice(0, n_rows - 1))
+                .fill_null(True))
+
+        group_start = numpy.concatenate(([True], changed))
+        group_end = numpy.concatenate((changed, [True]))
+
+    else:
+        group_start = group_end = None
+
+    columns = list(data.columns)
+
+    for col in cols:
+        i = data.schema.get_field_index(col)
+        column = columns[i]
+
+        if not column.null_count:
+            continue
+
+        null = numpy.asarray(column.is_null())
+
+        for _method in ((method, _REVERSE_FILLNA_METHOD_MAP[method])
+                        if fill_tail
+                        else (method,)):
+            fill_idx = \
+                _fill_indices(null, group_start=group_start, group_end=group_end)[_method == 'bfill']
+
+            null = null[fill_idx]
+            column = column.take(pyarrow.array(fill_idx))
 
-        if fill_tail:
-            df.fillna(
-                inplace=True,
-                method=_REVERSE_METHOD_MAP[method],
-                **kwargs)
+        columns[i] = column
 
-    return df
+    return type(data).from_arrays(columns, schema=data.schema)
 
 
 def python_module_base_name(python_module):
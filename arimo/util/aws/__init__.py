@@ -1,24 +1,82 @@
-import botocore
-import boto3
 import configparser
+from functools import lru_cache
 import os
+import threading
 import warnings
 
 
 CREDS_FILE_PATH = os.path.expanduser('~/.aws/credentials')
 
-if os.path.isfile(CREDS_FILE_PATH):
-    CREDS = configparser.ConfigParser()
-    CREDS.read_file(open(CREDS_FILE_PATH))
 
-else:
-    CREDS = None
+@lru_cache(maxsize=None)
+def _read_creds():
+    # parsed on first use (& cached) rather than when the package is imported
+    if os.path.isfile(CREDS_FILE_PATH):
+        creds = configparser.ConfigParser()
 
+        with open(CREDS_FILE_PATH) as f:
+            creds.read_file(f)
 
+        return creds
+
+
+def __getattr__(name):
+    # PEP 562: "CREDS" stays available as a module attribute, loaded lazily
+    if name == 'CREDS':
+        return _read_creds()
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+
+
+# CLIENT POOL
+# Boto3 clients must not be shared across forked processes (their connection pools would be),
+# but are thread-safe once created, so 1 client is shared per (process, service, region, credentials, config);
+# Boto3 sessions are not thread-safe, so clients are created under a lock,
+# and the pool is reset in forked child processes
 _CLIENTS = {}
 
+_CLIENTS_LOCK = threading.Lock()
+
+# default client config, overridable via ``configure(...)`` or per ``client(...)`` call
+_CLIENT_CONFIG = dict(
+    connect_timeout=9,   # seconds
+    read_timeout=9,   # seconds
+    max_attempts=5,   # incl. initial attempt
+    retry_mode='standard',   # 'legacy', 'standard' or 'adaptive'
+    max_pool_connections=10)
+
+
+def _reset_clients():
+    global _CLIENTS, _CLIENTS_LOCK
+
+    _CLIENTS = {}
+
+    # the parent's lock may have been held by another thread at fork time
+    _CLIENTS_LOCK = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_clients)
+
+
+def configure(**config):
+    """
+    Update default client config (``connect_timeout``, ``read_timeout``, ``max_attempts``,
+    ``retry_mode``, ``max_pool_connections``); clients already created are dropped from the pool
+    """
+    unknown = set(config).difference(_CLIENT_CONFIG)
+
+    assert not unknown, \
+        '*** UNKNOWN CLIENT CONFIG KEY(S) {} ***'.format(unknown)
+
+    with _CLIENTS_LOCK:
+        _CLIENT_CONFIG.update(config)
+        _CLIENTS.clear()
+
 
 def key_pair(profile='default'):
+    CREDS = _read_creds()
+
     if CREDS:
         if profile in CREDS:
             return CREDS[profile]['aws_access_key_id'], \
@@ -47,19 +105,53 @@ def key_pair(profile='default'):
         return None, None
 
 
-def client(service, access_key_id=None, secret_access_key=None):
-    global _CLIENTS
+def client(service, access_key_id=None, secret_access_key=None, region=None, **config):
+    """
+    Get a pooled Boto3 client for the current process, shared by all its threads
+
+    Args:
+        service (str): e.g. ``'s3'``
+
+        access_key_id, secret_access_key (str): credentials; default credential chain if not given
+
+        region (str): AWS region; default region if not given
+
+        **config: overrides of the default client config (see ``configure(...)``)
+    """
+    unknown = set(config).difference(_CLIENT_CONFIG)
+
+    assert not unknown, \
+        '*** UNKNOWN CLIENT CONFIG KEY(S) {} ***'.format(unknown)
+
+    config = dict(_CLIENT_CONFIG, **config)
+
+    tup = os.getpid(), \
+        service, region, access_key_id, secret_access_key, \
+        tuple(sorted(config.items()))
+
+    _client = _CLIENTS.get(tup)
+
+    if _client is None:
+        # Boto3 & Botocore take a while to import, so only do so once a client is needed
+        import boto3.session
+        import botocore.client
 
-    tup = service, access_key_id, secret_access_key
+        with _CLIENTS_LOCK:
+            _client = _CLIENTS.get(tup)
 
-    if tup not in _CLIENTS:
-        _CLIENTS[tup] = \
-            boto3.client(
-                service,
-                aws_access_key_id=access_key_id,
-                aws_secret_access_key=secret_access_key,
-                config=botocore.client.Config(
-                    connect_timeout=9,
-                    read_timeout=9))
+            if _client is None:
+                _client = _CLIENTS[tup] = \
+                    boto3.session.Session().client(
+                        service,
+                        region_name=region,
+                        aws_access_key_id=access_key_id,
+                        aws_secret_access_key=secret_access_key,
+                        config=botocore.client.Config(
+                            connect_timeout=config['connect_timeout'],
+                            read_timeout=config['read_timeout'],
+                            retries=dict(
+                                max_attempts=config['max_attempts'],
+                                mode=config['retry_mode']),
+                            max_pool_connections=config['max_pool_connections']))
 
-    return _CLIENTS[tup]
+    return _client
@@ -1,19 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import lru_cache
 import os
+import shutil
 import time
 
 from ..iterables import to_iterable
 from . import client as aws_client
 
 
-_AWS_ACCESS_KEY_ID_ENV_VAR_NAME = 'AWS_ACCESS_KEY_ID'
-_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME = 'AWS_SECRET_ACCESS_KEY'
+_S3_PATH_PREFIXES = 's3://', 's3a://', 's3n://'
 
+_DELETE_BATCH_SIZE = 1000   # max keys per DeleteObjects request
+
+# parallelism over keys, on top of per-object multipart concurrency
+_N_THREADS = 32
+
+_MULTIPART_CONCURRENCY = 10
+
+# enough HTTP connections for all concurrent transfers to share 1 client without blocking
+_MAX_POOL_CONNECTIONS = _N_THREADS * _MULTIPART_CONCURRENCY
+
+
+@lru_cache(maxsize=None)
+def _transfer_config():
+    # built on first transfer, so that importing this module does not import Boto3
+    from boto3.s3.transfer import TransferConfig
+
+    return TransferConfig(
+            multipart_threshold=64 * 2 ** 20,
+            multipart_chunksize=64 * 2 ** 20,
+            max_concurrency=_MULTIPART_CONCURRENCY,
+            use_threads=True)
+
+
+def client(access_key_id=None, secret_access_key=None, region=None, **config):
+    config.setdefault('max_pool_connections', _MAX_POOL_CONNECTIONS)
 
-def client(access_key_id=None, secret_access_key=None):
     return aws_client(
             service='s3',
             access_key_id=access_key_id,
-            secret_access_key=secret_access_key)
+            secret_access_key=secret_access_key,
+            region=region,
+            **config)
 
 
 def s3a_path_with_auth(
@@ -28,91 +57,228 @@ def s3a_path_with_auth(
             s3_path.split('://')[1])
 
 
+def is_s3_path(path):
+    return path.startswith(_S3_PATH_PREFIXES)
+
+
+def split_s3_path(s3_path):
+    """
+    Split "s3://bucket/key" into ("bucket", "key")
+    """
+    assert is_s3_path(s3_path), \
+        '*** "{}" IS NOT AN S3 PATH ***'.format(s3_path)
+
+    bucket, _, key = s3_path.split('://', 1)[1].partition('/')
+    return bucket, key
+
+
+def _dir_prefix(key):
+    return key.rstrip('/') + '/' \
+        if key \
+        else ''
+
+
+def _list_s3(s3_client, bucket, prefix, dir_markers=False):
+    # relative key -> (size, ETag, last-modified timestamp), from 1 paginated listing;
+    # zero-byte directory-marker keys (ending in '/') are not files & are skipped unless dir_markers
+    objs = {}
+
+    for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=bucket, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            if dir_markers or (not obj['Key'].endswith('/')):
+                objs[obj['Key'][len(prefix):]] = \
+                    obj['Size'], obj['ETag'], obj['LastModified'].timestamp()
+
+    return objs
+
+
+def _list_local(dir_path):
+    # relative path -> (size, None, modification timestamp)
+    files = {}
+
+    for _dir_path, _, file_names in os.walk(dir_path):
+        for file_name in file_names:
+            file_path = os.path.join(_dir_path, file_name)
+            stat = os.stat(file_path)
+            files[os.path.relpath(file_path, dir_path).replace(os.sep, '/')] = \
+                stat.st_size, None, stat.st_mtime
+
+    return files
+
+
+def _delete_keys(s3_client, bucket, keys):
+    keys = list(keys)
+
+    for i in range(0, len(keys), _DELETE_BATCH_SIZE):
+        response = \
+            s3_client.delete_objects(
+                Bucket=bucket,
+                Delete=dict(
+                    Objects=[dict(Key=key) for key in keys[i:(i + _DELETE_BATCH_SIZE)]],
+                    Quiet=True))
+
+        if response.get('Errors'):
+            raise IOError(
+                '*** FAILED TO DELETE {:,} S3 OBJECT(S) e.g. {} ***'.format(
+                    len(response['Errors']), response['Errors'][:3]))
+
+    return len(keys)
+
+
+def _transfer_func(s3_client, from_path, to_path):
+    if is_s3_path(from_path):
+        from_bucket, from_key = split_s3_path(from_path)
+
+        if is_s3_path(to_path):
+            to_bucket, to_key = split_s3_path(to_path)
+
+            # server-side (multipart) copy: no bytes pass through this process
+            return lambda: \
+                s3_client.copy(
+                    CopySource=dict(Bucket=from_bucket, Key=from_key),
+                    Bucket=to_bucket,
+                    Key=to_key,
+                    Config=_transfer_config())
+
+        else:
+            def download():
+                to_dir_path = os.path.dirname(to_path)
+                if to_dir_path:
+                    os.makedirs(to_dir_path, exist_ok=True)
+
+                s3_client.download_file(
+                    Bucket=from_bucket,
+                    Key=from_key,
+                    Filename=to_path,
+                    Config=_transfer_config())
+
+            return download
+
+    elif is_s3_path(to_path):
+        to_bucket, to_key = split_s3_path(to_path)
+
+        return lambda: \
+            s3_client.upload_file(
+                Filename=from_path,
+                Bucket=to_bucket,
+                Key=to_key,
+                Config=_transfer_config())
+
+    else:
+        raise ValueError(
+            '*** NEITHER "{}" NOR "{}" IS AN S3 PATH ***'.format(from_path, to_path))
+
+
+def _join(dir_path, rel_path):
+    return '{}/{}'.format(dir_path.rstrip('/'), rel_path) \
+        if is_s3_path(dir_path) \
+        else os.path.join(dir_path, *rel_path.split('/'))
+
+
+def _list(s3_client, dir_path):
+    if is_s3_path(dir_path):
+        bucket, key = split_s3_path(dir_path)
+        return _list_s3(s3_client, bucket, _dir_prefix(key))
+
+    else:
+        return _list_local(dir_path) \
+            if os.path.isdir(dir_path) \
+            else {}
+
+
+def _transfer(s3_client, from_and_to_paths, quiet=True, op='copy'):
+    from_and_to_paths = list(from_and_to_paths)
+
+    def transfer(from_and_to_path):
+        from_path, to_path = from_and_to_path
+
+        _transfer_func(s3_client, from_path, to_path)()
+
+        if not quiet:
+            print('{}: {} to {}'.format(op, from_path, to_path))
+
+    with ThreadPoolExecutor(max_workers=_N_THREADS) as executor:
+        # consuming the results re-raises any transfer error
+        for _ in executor.map(transfer, from_and_to_paths):
+            pass
+
+    return len(from_and_to_paths)
+
+
+def _rm_paths(s3_client, paths):
+    s3_keys_by_bucket = {}
+
+    for path in paths:
+        if is_s3_path(path):
+            bucket, key = split_s3_path(path)
+            s3_keys_by_bucket.setdefault(bucket, []).append(key)
+
+        else:
+            os.remove(path)
+
+    for bucket, keys in s3_keys_by_bucket.items():
+        _delete_keys(s3_client, bucket, keys)
+
+
 def cp(from_path, to_path, is_dir=True,
        quiet=True,
        access_key_id=None, secret_access_key=None,
        verbose=True):
-    if access_key_id and secret_access_key:
-        _ORIG_AWS_ACCESS_KEY_ID = os.environ.get(_AWS_ACCESS_KEY_ID_ENV_VAR_NAME)
-        _ORIG_AWS_SECRET_ACCESS_KEY = os.environ.get(_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME)
-
-        os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = access_key_id
-        os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = secret_access_key
+    s3_client = client(access_key_id=access_key_id, secret_access_key=secret_access_key)
 
     if verbose:
         msg = 'Copying "{}" to "{}"...'.format(from_path, to_path)
         print(msg + '\n')
         tic = time.time()
 
-    os.system(
-        'aws s3 cp {} {} {} {}'.format(
-            from_path, to_path,
-            '--recursive' if is_dir else '',
-            '--quiet' if quiet else ''))
+    _transfer(
+        s3_client,
+        ((_join(from_path, rel_path), _join(to_path, rel_path))
+         for rel_path in _list(s3_client, from_path))
+            if is_dir
+            else [(from_path, to_path)],
+        quiet=quiet,
+        op='copy')
 
     if verbose:
         toc = time.time()
         print(msg + ' done!   <{:,.1f} s>\n'.format(toc - tic))
 
-    if access_key_id and secret_access_key:
-        if _ORIG_AWS_ACCESS_KEY_ID:
-            os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = _ORIG_AWS_ACCESS_KEY_ID
-        else:
-            del os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME]
-
-        if _ORIG_AWS_SECRET_ACCESS_KEY:
-            os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = _ORIG_AWS_SECRET_ACCESS_KEY
-        else:
-            del os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME]
-
 
 def mv(from_path, to_path, is_dir=True,
        quiet=True,
        access_key_id=None, secret_access_key=None,
        verbose=True):
-    if access_key_id and secret_access_key:
-        _ORIG_AWS_ACCESS_KEY_ID = os.environ.get(_AWS_ACCESS_KEY_ID_ENV_VAR_NAME)
-        _ORIG_AWS_SECRET_ACCESS_KEY = os.environ.get(_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME)
-
-        os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = access_key_id
-        os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = secret_access_key
+    s3_client = client(access_key_id=access_key_id, secret_access_key=secret_access_key)
 
     if verbose:
         msg = 'Moving "{}" to "{}"...'.format(from_path, to_path)
         print(msg + '\n')
         tic = time.time()
 
-    os.system(
-        'aws s3 mv {} {} {} {}'.format(
-            from_path, to_path,
-            '--recursive' if is_dir else '',
-            '--quiet' if quiet else ''))
+    from_and_to_paths = \
+        [(_join(from_path, rel_path), _join(to_path, rel_path))
+         for rel_path in _list(s3_client, from_path)] \
+        if is_dir \
+        else [(from_path, to_path)]
+
+    _transfer(s3_client, from_and_to_paths, quiet=quiet, op='move')
+
+    # only delete sources once everything has been copied
+    _rm_paths(s3_client, (from_path for from_path, _ in from_and_to_paths))
+
+    if is_dir and (not is_s3_path(from_path)) and os.path.isdir(from_path):
+        shutil.rmtree(from_path, ignore_errors=True)
 
     if verbose:
         toc = time.time()
         print(msg + ' done!   <{:,.1f} s>\n'.format(toc - tic))
 
-    if access_key_id and secret_access_key:
-        if _ORIG_AWS_ACCESS_KEY_ID:
-            os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = _ORIG_AWS_ACCESS_KEY_ID
-        else:
-            del os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME]
-
-        if _ORIG_AWS_SECRET_ACCESS_KEY:
-            os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = _ORIG_AWS_SECRET_ACCESS_KEY
-        else:
-            del os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME]
-
 
 def rm(path, dir=True, globs=None, quiet=True,
        access_key_id=None, secret_access_key=None,
        verbose=True):
-    if access_key_id and secret_access_key:
-        _ORIG_AWS_ACCESS_KEY_ID = os.environ.get(_AWS_ACCESS_KEY_ID_ENV_VAR_NAME)
-        _ORIG_AWS_SECRET_ACCESS_KEY = os.environ.get(_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME)
-
-        os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = access_key_id
-        os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = secret_access_key
+    s3_client = client(access_key_id=access_key_id, secret_access_key=secret_access_key)
 
     if verbose:
         msg = 'Deleting {}"{}"...'.format(
@@ -125,67 +291,82 @@ def rm(path, dir=True, globs=None, quiet=True,
 
         print(msg)
 
-    os.system(
-        'aws s3 rm {}{}{}'.format(
-            path,
-            ' --recursive{}'.format(
-                    ' --exclude "*" {}'.format(
-                        ' '.join('--include "{}"'.format(glob)
-                                 for glob in to_iterable(globs)))
-                    if globs
-                    else '')
-                if dir
-                else '',
-            ' --quiet' if quiet else ''))
+    bucket, key = split_s3_path(path)
 
-    if verbose:
-        print(msg + ' done!')
+    if dir:
+        prefix = _dir_prefix(key)
+        globs = to_iterable(globs) if globs else None
 
-    if access_key_id and secret_access_key:
-        if _ORIG_AWS_ACCESS_KEY_ID:
-            os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = _ORIG_AWS_ACCESS_KEY_ID
-        else:
-            del os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME]
+        keys = [prefix + rel_key
+                for rel_key in _list_s3(s3_client, bucket, prefix, dir_markers=globs is None)
+                if (globs is None) or any(fnmatch(rel_key, glob) for glob in globs)]
 
-        if _ORIG_AWS_SECRET_ACCESS_KEY:
-            os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = _ORIG_AWS_SECRET_ACCESS_KEY
-        else:
-            del os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME]
+    else:
+        keys = [key]
+
+    _delete_keys(s3_client, bucket, keys)
+
+    if not quiet:
+        for key in keys:
+            print('delete: s3://{}/{}'.format(bucket, key))
+
+    if verbose:
+        print(msg + ' done!')
 
 
 def sync(from_dir_path, to_dir_path,
          delete=True, quiet=True,
          access_key_id=None, secret_access_key=None,
          verbose=True):
-    if access_key_id and secret_access_key:
-        _ORIG_AWS_ACCESS_KEY_ID = os.environ.get(_AWS_ACCESS_KEY_ID_ENV_VAR_NAME)
-        _ORIG_AWS_SECRET_ACCESS_KEY = os.environ.get(_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME)
+    """
+    Make ``to_dir_path`` mirror ``from_dir_path`` (either or both on S3),
+    transferring only files that are new or differ:
+    by size & ETag between S3 locations (by size & modification time for multipart objects),
+    by size & modification time between S3 & local disk
+    """
+    assert is_s3_path(from_dir_path) or os.path.isdir(from_dir_path), \
+        '*** "{}" IS NOT A DIRECTORY ***'.format(from_dir_path)
 
-        os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = access_key_id
-        os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = secret_access_key
+    s3_client = client(access_key_id=access_key_id, secret_access_key=secret_access_key)
 
     if verbose:
         msg = 'Syncing "{}" to "{}"...'.format(from_dir_path, to_dir_path)
         print(msg + '\n')
         tic = time.time()
 
-    os.system(
-        'aws s3 sync {} {} {} {}'.format(
-            from_dir_path, to_dir_path,
-            '--delete' if delete else '',
-            '--quiet' if quiet else ''))
+    from_files = _list(s3_client, from_dir_path)
+    to_files = _list(s3_client, to_dir_path)
+
+    s3_to_s3 = is_s3_path(from_dir_path) and is_s3_path(to_dir_path)
+
+    def changed(rel_path):
+        if rel_path not in to_files:
+            return True
+
+        from_size, from_etag, from_time = from_files[rel_path]
+        to_size, to_etag, to_time = to_files[rel_path]
+
+        # multipart ETags ("<hash>-<n parts>") depend on part sizes, so server-side copies of equal bytes differ:
+        # fall back to modification times for them
+        return (from_size != to_size) or \
+            ((from_etag != to_etag)
+             if s3_to_s3 and not ('-' in from_etag or '-' in to_etag)
+             else (from_time > to_time))
+
+    _transfer(
+        s3_client,
+        ((_join(from_dir_path, rel_path), _join(to_dir_path, rel_path))
+         for rel_path in from_files
+         if changed(rel_path)),
+        quiet=quiet,
+        op='copy')
+
+    if delete:
+        _rm_paths(
+            s3_client,
+            (_join(to_dir_path, rel_path)
+             for rel_path in set(to_files).difference(from_files)))
 
     if verbose:
         toc = time.time()
         print(msg + ' done!   <{:,.1f} s>\n'.format(toc - tic))
-
-    if access_key_id and secret_access_key:
-        if _ORIG_AWS_ACCESS_KEY_ID:
-            os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME] = _ORIG_AWS_ACCESS_KEY_ID
-        else:
-            del os.environ[_AWS_ACCESS_KEY_ID_ENV_VAR_NAME]
-
-        if _ORIG_AWS_SECRET_ACCESS_KEY:
-            os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME] = _ORIG_AWS_SECRET_ACCESS_KEY
-        else:
-            del os.environ[_AWS_SECRET_ACCESS_KEY_ENV_VAR_NAME]
@@ -1,12 +1,18 @@
 from __future__ import print_function
 
 import abc
+from botocore.exceptions import ClientError
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import joblib
 import json
 import os
 import six
+import sys
+import time
+import uuid
 
-from . import fs, pkl
+from . import fs, hashing, pkl
 from .aws import s3
 
 
@@ -16,6 +22,575 @@ _STR_CLASSES = \
     else str
 
 
+# SERIALIZER PROFILES
+# (read from / write to a local file path)
+
+_ARROW_MAGIC = b'ARROW1'
+_NUMPY_MAGIC = b'\x93NUMPY'
+
+SERIALIZERS = 'json', 'joblib', 'pickle', 'pickle5', 'feather', 'npy', 'auto'
+
+
+def _read_json(file_path, **kwargs):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_json(obj, file_path, **kwargs):
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(
+            obj=obj,
+            fp=f,
+            ensure_ascii=False,
+            allow_nan=True,
+            indent=4)
+
+
+def _read_joblib(file_path, **kwargs):
+    return joblib.load(filename=file_path)
+
+
+def _write_joblib(obj, file_path, **kwargs):
+    joblib.dump(
+        obj,
+        filename=file_path,
+        compress=(pkl.COMPAT_COMPRESS, pkl.MAX_COMPRESS_LVL),
+        protocol=pkl.COMPAT_PROTOCOL)
+
+
+def _read_pickle5(file_path, **kwargs):
+    return pkl.load_oob(file_path)
+
+
+def _write_pickle5(obj, file_path, compress=None, compress_lvl=pkl.DEFAULT_COMPRESS_LVL):
+    pkl.dump_oob(
+        obj,
+        file_path=file_path,
+        compress=compress,
+        compress_lvl=compress_lvl)
+
+
+def _read_feather(file_path, **kwargs):
+    from pyarrow.feather import read_feather
+    return read_feather(file_path, memory_map=True)
+
+
+def _write_feather(obj, file_path, compress=None, compress_lvl=pkl.DEFAULT_COMPRESS_LVL):
+    from pyarrow.feather import write_feather
+    write_feather(
+        obj,
+        file_path,
+        compression=compress if compress else 'uncompressed',
+        compression_level=compress_lvl if compress else None)
+
+
+def _read_npy(file_path, **kwargs):
+    import numpy
+    return numpy.load(file_path, mmap_mode='r', allow_pickle=False)
+
+
+def _write_npy(obj, file_path, **kwargs):
+    import numpy
+    with open(file_path, 'wb') as f:
+        numpy.save(f, obj, allow_pickle=False)
+
+
+def _is_feather_able(obj):
+    pandas = sys.modules.get('pandas')
+    return (pandas is not None) and \
+        isinstance(obj, pandas.DataFrame) and \
+        all(isinstance(col, str) for col in obj.columns)
+
+
+def _is_npy_able(obj):
+    numpy = sys.modules.get('numpy')
+    return (numpy is not None) and \
+        isinstance(obj, numpy.ndarray) and \
+        (not obj.dtype.hasobject)
+
+
+def _read_auto(file_path, **kwargs):
+    with open(file_path, 'rb') as f:
+        magic = f.read(len(pkl.OOB_MAGIC))
+
+    if magic.startswith(_ARROW_MAGIC):
+        return _read_feather(file_path)
+
+    elif magic.startswith(_NUMPY_MAGIC):
+        return _read_npy(file_path)
+
+    elif magic == pkl.OOB_MAGIC:
+        return _read_pickle5(file_path)
+
+    else:
+        return _read_joblib(file_path)
+
+
+def _write_auto(obj, file_path, **kwargs):
+    if _is_feather_able(obj):
+        _write_feather(obj, file_path, **kwargs)
+
+    elif _is_npy_able(obj):
+        _write_npy(obj, file_path)
+
+    elif pkl.OOB_PROTOCOL_AVAILABLE:
+        _write_pickle5(obj, file_path, **kwargs)
+
+    else:
+        _write_joblib(obj, file_path)
+
+
+_SERIALIZER_FUNCS = \
+    dict(json=(_read_json, _write_json),
+         joblib=(_read_joblib, _write_joblib),
+         pickle=(_read_joblib, _write_joblib),
+         pickle5=(_read_pickle5, _write_pickle5),
+         feather=(_read_feather, _write_feather),
+         npy=(_read_npy, _write_npy),
+         auto=(_read_auto, _write_auto))
+
+
+# S3 OBJECT METADATA HELPERS
+
+_S3_NOT_FOUND_ERR_CODES = '404', 'NoSuchKey', 'NotFound'
+_S3_NOT_MODIFIED_ERR_CODES = '304', 'NotModified'
+
+_S3_META_SIDECAR_SUFFIX = '.s3meta.json'
+
+# (bucket, key) -> expiry time of "known to be absent" lookups
+_S3_NEGATIVE_LOOKUPS = {}
+DEFAULT_NEGATIVE_LOOKUP_TTL = 60   # seconds
+
+
+def _s3_err_code(err):
+    return str(err.response.get('Error', {}).get('Code'))
+
+
+def _s3_known_absent(s3_bucket, s3_key):
+    expiry = _S3_NEGATIVE_LOOKUPS.get((s3_bucket, s3_key))
+
+    if expiry is None:
+        return False
+
+    elif expiry > time.time():
+        return True
+
+    else:
+        _S3_NEGATIVE_LOOKUPS.pop((s3_bucket, s3_key), None)
+        return False
+
+
+def _s3_mark_absent(s3_bucket, s3_key, ttl):
+    if ttl:
+        _S3_NEGATIVE_LOOKUPS[(s3_bucket, s3_key)] = time.time() + ttl
+
+
+def _s3_unmark_absent(s3_bucket, s3_key):
+    _S3_NEGATIVE_LOOKUPS.pop((s3_bucket, s3_key), None)
+
+
+def _s3_head(s3_client, s3_bucket, s3_key, negative_lookup_ttl=DEFAULT_NEGATIVE_LOOKUP_TTL):
+    """
+    Return the ``head_object`` response for ``s3_key``, or ``None`` if absent
+    (absence is remembered for ``negative_lookup_ttl`` seconds)
+    """
+    if _s3_known_absent(s3_bucket, s3_key):
+        return None
+
+    try:
+        return s3_client.head_object(
+            Bucket=s3_bucket,
+            Key=s3_key)
+
+    except ClientError as err:
+        if _s3_err_code(err) in _S3_NOT_FOUND_ERR_CODES:
+            _s3_mark_absent(s3_bucket, s3_key, ttl=negative_lookup_ttl)
+            return None
+
+        raise
+
+
+def _s3_meta_sidecar_path(local_file_path):
+    return local_file_path + _S3_META_SIDECAR_SUFFIX
+
+
+def _local_file_stamp(local_file_path):
+    stat = os.stat(local_file_path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _read_s3_meta(local_file_path):
+    # sidecar metadata is only trusted if the local file has not changed since it was recorded
+    sidecar_path = _s3_meta_sidecar_path(local_file_path)
+
+    if os.path.isfile(local_file_path) and os.path.isfile(sidecar_path):
+        try:
+            with open(sidecar_path, 'r') as f:
+                s3_meta = json.load(f)
+
+        except ValueError:
+            return None
+
+        if s3_meta.get('LocalStamp') == _local_file_stamp(local_file_path):
+            return s3_meta
+
+
+def _write_s3_meta(local_file_path, s3_obj_meta):
+    with open(_s3_meta_sidecar_path(local_file_path), 'w') as f:
+        json.dump(
+            dict(ETag=s3_obj_meta['ETag'],
+                 LastModified=str(s3_obj_meta['LastModified']),
+                 Metadata=s3_obj_meta.get('Metadata', {}),
+                 LocalStamp=_local_file_stamp(local_file_path)),
+            f)
+
+
+def _s3_get_if_changed(
+        s3_client, s3_bucket, s3_key, local_file_path,
+        negative_lookup_ttl=DEFAULT_NEGATIVE_LOOKUP_TTL):
+    """
+    Conditionally download ``s3_key`` to ``local_file_path``,
+    sending the locally-recorded ETag as ``IfNoneMatch``
+
+    Returns ``True`` if new bytes were downloaded,
+    ``False`` if the local copy is current (HTTP 304, zero bytes transferred),
+    and ``None`` if the object does not exist.
+    """
+    if _s3_known_absent(s3_bucket, s3_key):
+        return None
+
+    local_meta = _read_s3_meta(local_file_path)
+
+    kwargs = dict(Bucket=s3_bucket, Key=s3_key)
+    if local_meta:
+        kwargs['IfNoneMatch'] = local_meta['ETag']
+
+    try:
+        response = s3_client.get_object(**kwargs)
+
+    except ClientError as err:
+        err_code = _s3_err_code(err)
+
+        if err_code in _S3_NOT_MODIFIED_ERR_CODES:
+            return False
+
+        elif err_code in _S3_NOT_FOUND_ERR_CODES:
+            _s3_mark_absent(s3_bucket, s3_key, ttl=negative_lookup_ttl)
+            return None
+
+        raise
+
+    tmp_file_path = '{}.{}.tmp'.format(local_file_path, uuid.uuid4())
+
+    with open(tmp_file_path, 'wb') as f:
+        for chunk in response['Body'].iter_chunks(chunk_size=8 * 2 ** 20):
+            f.write(chunk)
+
+    os.replace(tmp_file_path, local_file_path)
+
+    _write_s3_meta(local_file_path, response)
+
+    return True
+
+
+# ENTRY METADATA (EXPIRY / VERSIONING / TAGS) & BULK INVALIDATION
+# (stored as S3 user metadata on each entry, mirrored in the local sidecars)
+
+_S3_DELETE_BATCH_SIZE = 1000   # max keys per DeleteObjects request
+
+_TAGS_DIR_NAME = '_tags'
+
+_MANIFEST_FILE_NAME = '_MANIFEST.json'
+_SPARK_SUCCESS_FILE_NAME = '_SUCCESS'
+
+_N_LOCAL_SWEEP_THREADS = 16
+
+
+def _entry_meta(ttl=None, version=None, tags=()):
+    meta = dict(created=repr(time.time()))
+
+    if ttl:
+        meta['ttl'] = repr(float(ttl))
+
+    if version is not None:
+        meta['version'] = str(version)
+
+    if tags:
+        meta['tags'] = ','.join(sorted(tags))
+
+    return meta
+
+
+def _entry_stale(meta, version=None):
+    """
+    Whether an entry's metadata says it has expired or was written by a different version
+    """
+    if 'ttl' in meta:
+        if float(meta['created']) + float(meta['ttl']) < time.time():
+            return True
+
+    return (version is not None) and (meta.get('version') != str(version))
+
+
+def _s3_list_keys(s3_client, s3_bucket, prefix, with_sizes=False):
+    for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=s3_bucket, Prefix=prefix):
+        for obj in page.get('Contents', []):
+            yield (obj['Key'], obj['Size']) \
+                if with_sizes \
+                else obj['Key']
+
+
+def _s3_delete_keys(s3_client, s3_bucket, keys):
+    keys = sorted(set(keys))
+
+    for i in range(0, len(keys), _S3_DELETE_BATCH_SIZE):
+        s3_client.delete_objects(
+            Bucket=s3_bucket,
+            Delete=dict(
+                Objects=[dict(Key=key) for key in keys[i:(i + _S3_DELETE_BATCH_SIZE)]],
+                Quiet=True))
+
+    for key in keys:
+        _S3_NEGATIVE_LOOKUPS.pop((s3_bucket, key), None)
+
+    return len(keys)
+
+
+def _put_tag_markers(s3_client, s3_bucket, s3_cache_dir_prefix, entry_name, tags):
+    for tag in tags:
+        s3_client.put_object(
+            Bucket=s3_bucket,
+            Key=os.path.join(s3_cache_dir_prefix, _TAGS_DIR_NAME, tag, entry_name),
+            Body=b'')
+
+
+def _rm_local_files(file_paths):
+    def rm(file_path):
+        for path in (file_path, _s3_meta_sidecar_path(file_path)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    with ThreadPoolExecutor(max_workers=_N_LOCAL_SWEEP_THREADS) as executor:
+        for _ in executor.map(rm, file_paths):
+            pass
+
+
+def _invalidate(
+        s3_client, s3_bucket, s3_cache_dir_prefix,
+        entries_dir_name='', local_cache_dir_path=None,
+        tags=(), prefix=None, entries_are_dirs=False, verbose=False):
+    """
+    Delete all cache entries carrying any of ``tags`` and/or whose names start with ``prefix``,
+    together with all of their tag markers,
+    from S3 (in batched ``delete_objects`` requests) and from the local cache directory
+    """
+    assert tags or (prefix is not None), \
+        '*** tags and/or prefix must be specified ***'
+
+    if verbose:
+        msg = 'Invalidating cache entries {}{}under "s3://{}/{}"...'.format(
+            'tagged {} '.format(tags) if tags else '',
+            'with prefix "{}" '.format(prefix) if prefix is not None else '',
+            s3_bucket, s3_cache_dir_prefix)
+        print(msg)
+        tic = time.time()
+
+    entry_names = set()
+    s3_keys = set()
+
+    # "<tags dir>/<tag>/<entry name>" markers of all tags, from 1 paginated listing
+    tags_key_prefix = os.path.join(s3_cache_dir_prefix, _TAGS_DIR_NAME, '')
+    tag_keys = list(_s3_list_keys(s3_client, s3_bucket, tags_key_prefix))
+
+    for tag in tags:
+        tag_key_prefix = tags_key_prefix + tag + '/'
+
+        entry_names.update(
+            tag_key[len(tag_key_prefix):]
+            for tag_key in tag_keys
+            if tag_key.startswith(tag_key_prefix))
+
+    if prefix is not None:
+        entries_key_prefix = os.path.join(s3_cache_dir_prefix, entries_dir_name, '')
+
+        for key in _s3_list_keys(s3_client, s3_bucket, entries_key_prefix + prefix):
+            entry_name = key[len(entries_key_prefix):]
+
+            if not entry_name.startswith(_TAGS_DIR_NAME + '/'):
+                entry_names.add(
+                    entry_name.split('/')[0]
+                    if entries_are_dirs
+                    else entry_name)
+
+    for entry_name in entry_names:
+        entry_key = os.path.join(s3_cache_dir_prefix, entries_dir_name, entry_name)
+
+        if entries_are_dirs:
+            s3_keys.update(_s3_list_keys(s3_client, s3_bucket, entry_key + '/'))
+
+        else:
+            s3_keys.add(entry_key)
+
+    # also delete the markers of every tag of the deleted entries (not only of ``tags``),
+    # lest a later invalidation by tag delete newer entries written under the same names without that tag
+    for tag_key in tag_keys:
+        tag_and_entry_name = tag_key[len(tags_key_prefix):].split('/')
+
+        if any('/'.join(tag_and_entry_name[i:]) in entry_names
+               for i in range(1, len(tag_and_entry_name))):
+            s3_keys.add(tag_key)
+
+    n_deleted = _s3_delete_keys(s3_client, s3_bucket, s3_keys)
+
+    if local_cache_dir_path:
+        local_entries_dir_path = os.path.join(local_cache_dir_path, entries_dir_name)
+
+        local_file_paths = \
+            {os.path.join(local_entries_dir_path, entry_name)
+             for entry_name in entry_names}
+
+        # also sweep local-only entries matching the prefix
+        if (prefix is not None) and os.path.isdir(local_entries_dir_path):
+            for dir_path, _, file_names in os.walk(local_entries_dir_path):
+                for file_name in file_names:
+                    file_path = os.path.join(dir_path, file_name)
+
+                    if os.path.relpath(file_path, local_entries_dir_path).startswith(prefix) and \
+                            not file_name.endswith(_S3_META_SIDECAR_SUFFIX):
+                        local_file_paths.add(file_path)
+
+        _rm_local_files(local_file_paths)
+
+    if verbose:
+        toc = time.time()
+        print(msg + ' {:,} S3 object(s) deleted!   <{:,.1f} s>'.format(n_deleted, toc - tic))
+
+    return entry_names
+
+
+# IN-SESSION REGISTRY OF CACHE()'D SPARK RESULTS
+# (s3 bucket, s3 key) -> (DistributedDataFrame, entry metadata), least recently used first;
+# least-recently-used results are unpersisted once the limit is exceeded
+
+_MAX_N_SESSION_CACHED_DDFS = 10
+
+_SESSION_CACHED_DDFS = OrderedDict()
+
+
+def _cache_in_session(s3_bucket, s3_key, ddf, meta):
+    if not ddf.sparkDF.is_cached:
+        ddf.cache(eager=False, verbose=False)
+
+    _SESSION_CACHED_DDFS[(s3_bucket, s3_key)] = ddf, meta
+    _SESSION_CACHED_DDFS.move_to_end((s3_bucket, s3_key))
+
+    while len(_SESSION_CACHED_DDFS) > _MAX_N_SESSION_CACHED_DDFS:
+        _uncache_in_session(*next(iter(_SESSION_CACHED_DDFS)))
+
+
+def _cached_in_session(s3_bucket, s3_key, version=None):
+    ddf_and_meta = _SESSION_CACHED_DDFS.get((s3_bucket, s3_key))
+
+    if ddf_and_meta is None:
+        return None
+
+    ddf, meta = ddf_and_meta
+
+    if ddf.sparkDF.is_cached and (not _entry_stale(meta, version=version)):
+        _SESSION_CACHED_DDFS.move_to_end((s3_bucket, s3_key))
+        return ddf
+
+    _uncache_in_session(s3_bucket, s3_key)
+
+
+def _uncache_in_session(s3_bucket, s3_key):
+    ddf_and_meta = _SESSION_CACHED_DDFS.pop((s3_bucket, s3_key), None)
+
+    if ddf_and_meta is not None:
+        ddf, _ = ddf_and_meta
+
+        try:
+            ddf.sparkDF.unpersist()
+
+        except Exception:   # e.g. Spark session already stopped
+            pass
+
+
+# AUTOMATIC (CONTENT-ADDRESSED) CACHE KEYS
+
+# kwargs that only control caching & must not affect cache keys
+_CACHE_CONTROL_KWARGS = '_force_compute', '_cache_verbose'
+
+_CA_REFS_DIR_NAME = 'refs'
+_CA_BLOBS_DIR_NAME = 'blobs'
+
+# unreferenced blobs younger than this may be about to be referenced by a concurrent write
+_CA_BLOB_SWEEP_GRACE_PERIOD = 3600   # seconds
+
+
+def _sweep_unreferenced_blobs(
+        s3_client, s3_bucket, s3_cache_dir_prefix, local_cache_dir_path=None, verbose=False):
+    """
+    Delete content-addressed blobs that no ref points to any more,
+    from S3 & from the local cache directory
+    """
+    if verbose:
+        msg = 'Sweeping unreferenced blobs under "s3://{}/{}"...'.format(s3_bucket, s3_cache_dir_prefix)
+        print(msg)
+        tic = time.time()
+
+    refs_key_prefix = os.path.join(s3_cache_dir_prefix, _CA_REFS_DIR_NAME, '')
+    blobs_key_prefix = os.path.join(s3_cache_dir_prefix, _CA_BLOBS_DIR_NAME, '')
+
+    def read_ref(ref_key):
+        return s3_client.get_object(Bucket=s3_bucket, Key=ref_key)['Body'].read().decode('utf-8').strip()
+
+    with ThreadPoolExecutor(max_workers=_N_LOCAL_SWEEP_THREADS) as executor:
+        referenced_digests = set(executor.map(read_ref, _s3_list_keys(s3_client, s3_bucket, refs_key_prefix)))
+
+    grace_period_start = time.time() - _CA_BLOB_SWEEP_GRACE_PERIOD
+
+    unreferenced_blob_keys = \
+        [obj['Key']
+         for page in s3_client.get_paginator('list_objects_v2').paginate(Bucket=s3_bucket, Prefix=blobs_key_prefix)
+         for obj in page.get('Contents', [])
+         if (obj['Key'][len(blobs_key_prefix):] not in referenced_digests) and
+            (obj['LastModified'].timestamp() < grace_period_start)]
+
+    n_deleted = _s3_delete_keys(s3_client, s3_bucket, unreferenced_blob_keys)
+
+    if local_cache_dir_path:
+        local_blobs_dir_path = os.path.join(local_cache_dir_path, _CA_BLOBS_DIR_NAME)
+
+        if os.path.isdir(local_blobs_dir_path):
+            _rm_local_files(
+                file_path
+                for file_path in (os.path.join(local_blobs_dir_path, file_name)
+                                  for file_name in os.listdir(local_blobs_dir_path)
+                                  if not (file_name.startswith('.') or
+                                          file_name.endswith(_S3_META_SIDECAR_SUFFIX) or
+                                          (file_name in referenced_digests)))
+                if os.path.getmtime(file_path) < grace_period_start)
+
+    if verbose:
+        toc = time.time()
+        print(msg + ' {:,} S3 object(s) deleted!   <{:,.1f} s>'.format(n_deleted, toc - tic))
+
+    return n_deleted
+
+
+def _auto_cache_key(func, func_fingerprint, args, kwargs):
+    return '{}-{}'.format(
+        getattr(func, '__name__', 'func'),
+        hashing.hash_args(
+            func_fingerprint,
+            *args,
+            **{k: v for k, v in kwargs.items()
+               if k not in _CACHE_CONTROL_KWARGS}))
+
+
 class _CacheDecorABC(object):
     __metaclass__ = abc.ABCMeta
 
@@ -33,17 +608,31 @@ class _CacheDecorABC(object):
 
 
 class SparkXDFonS3CacheDecor(_CacheDecorABC):
+    """
+    Cache ``DistributedDataFrame`` results on S3 as (optionally partitioned & sorted) Parquet
+
+    Each cached data set is written to a fresh ``<name>/<attempt id>/`` directory
+    and only becomes visible once its ``<name>/_MANIFEST.json`` is written,
+    after Spark's ``_SUCCESS`` marker, so partially-written caches are never read.
+    """
     def __init__(
             self,
             s3_bucket,
             s3_cache_dir_prefix,
             aws_access_key_id,
             aws_secret_access_key,
-            name_lambda,
+            name_lambda=None,
             format='parquet',
             pre_condition_lambda=None,
             validation_lambda=None,
             post_process_lambda=None,
+            negative_lookup_ttl=DEFAULT_NEGATIVE_LOOKUP_TTL,
+            ttl=None,
+            version=None,
+            tags=(),
+            partition_by=None,
+            sort_by=None,
+            cache_in_session=False,
             verbose=False):
         self.s3_bucket = s3_bucket
 
@@ -73,6 +662,20 @@ class SparkXDFonS3CacheDecor(_CacheDecorABC):
 
         self.post_process_lambda = post_process_lambda
 
+        self.negative_lookup_ttl = negative_lookup_ttl
+
+        self.ttl = ttl
+        self.version = version
+        self.tags = tuple(tags)
+
+        # partitioned output lets Spark prune partitions when downstream code filters on these columns
+        self.partition_by = partition_by
+        self.sort_by = sort_by
+
+        # keep loaded / computed results cache()'d in the Spark session & reuse them without S3 round trips
+        # (opt-in: at most _MAX_N_SESSION_CACHED_DDFS results across decorators, least recently used unpersisted first)
+        self.cache_in_session = cache_in_session
+
         self._verbose = verbose
 
     @property
@@ -87,12 +690,97 @@ class SparkXDFonS3CacheDecor(_CacheDecorABC):
     def verbose(self):
         return self._verbose
 
+    def invalidate(self, tags=(), prefix=None, verbose=None):
+        """
+        Delete cached data sets carrying any of ``tags`` and/or whose names start with ``prefix``
+        """
+        names = \
+            _invalidate(
+                s3_client=self.s3_client,
+                s3_bucket=self.s3_bucket,
+                s3_cache_dir_prefix=self.s3_cache_dir_prefix,
+                tags=tags,
+                prefix=prefix,
+                entries_are_dirs=True,
+                verbose=self.verbose if verbose is None else verbose)
+
+        for name in names:
+            _uncache_in_session(self.s3_bucket, os.path.join(self.s3_cache_dir_prefix, name))
+
+        return names
+
+    def _read_manifest(self, s3_key):
+        if _s3_known_absent(self.s3_bucket, s3_key):
+            return None
+
+        try:
+            response = \
+                self.s3_client.get_object(
+                    Bucket=self.s3_bucket,
+                    Key=os.path.join(s3_key, _MANIFEST_FILE_NAME))
+
+        except ClientError as err:
+            if _s3_err_code(err) in _S3_NOT_FOUND_ERR_CODES:
+                return None
+
+            raise
+
+        manifest = json.loads(response['Body'].read().decode('utf-8'))
+        manifest['Metadata'] = response.get('Metadata', {})
+        return manifest
+
+    def _commit(self, s3_key, attempt_id):
+        attempt_key_prefix = os.path.join(s3_key, attempt_id, '')
+
+        files = \
+            {key[len(attempt_key_prefix):]: size
+             for key, size in _s3_list_keys(self.s3_client, self.s3_bucket, attempt_key_prefix, with_sizes=True)}
+
+        assert _SPARK_SUCCESS_FILE_NAME in files, \
+            '*** "s3://{}/{}" HAS NO {} MARKER: WRITE INCOMPLETE ***'.format(
+                self.s3_bucket, attempt_key_prefix, _SPARK_SUCCESS_FILE_NAME)
+
+        # the manifest is written last, in 1 atomic PUT: this is the commit point
+        self.s3_client.put_object(
+            Bucket=self.s3_bucket,
+            Key=os.path.join(s3_key, _MANIFEST_FILE_NAME),
+            Body=json.dumps(
+                dict(data_dir=attempt_id,
+                     format=self.format,
+                     partition_by=self.partition_by,
+                     sort_by=self.sort_by,
+                     files=files)).encode('utf-8'),
+            ContentType='application/json',
+            Metadata=_entry_meta(ttl=self.ttl, version=self.version, tags=self.tags))
+
+        _s3_unmark_absent(self.s3_bucket, s3_key)
+
+        # clean up superseded attempts & legacy un-manifested data
+        _s3_delete_keys(
+            self.s3_client,
+            self.s3_bucket,
+            (key
+             for key in _s3_list_keys(self.s3_client, self.s3_bucket, os.path.join(s3_key, ''))
+             if not (key.startswith(attempt_key_prefix) or
+                     (key == os.path.join(s3_key, _MANIFEST_FILE_NAME)))))
+
     def __call__(self, func):
+        # name_lambda=None: derive names from hashes of the function's code & arguments
+        _func_fingerprint = \
+            hashing.func_fingerprint(func) \
+            if self.name_lambda is None \
+            else None
+
         def decor_func(*args, **kwargs):
+            from arimo.data.distributed import DDF
+
             _force_compute = kwargs.get('_force_compute', False)
             verbose = kwargs.get('_cache_verbose', self.verbose)
 
-            name = self.name_lambda(*args, **kwargs)
+            name = \
+                _auto_cache_key(func, _func_fingerprint, args, kwargs) \
+                if self.name_lambda is None \
+                else self.name_lambda(*args, **kwargs)
 
             s3_key = \
                 os.path.join(
@@ -104,52 +792,107 @@ class SparkXDFonS3CacheDecor(_CacheDecorABC):
                     self.s3_cache_dir_path,
                     name)
 
-            if not _force_compute:
-                _force_compute = \
-                    'Contents' not in \
-                        self.s3_client.list_objects(
-                            Bucket=self.s3_bucket,
-                            Prefix=s3_key)
+            result = None
 
             if not _force_compute:
-                if verbose:
-                    print('Reading Cached Data from {}... '.format(s3_path), end='')
+                result = _cached_in_session(self.s3_bucket, s3_key, version=self.version)
 
-                from arimo.df.spark import SparkXDF
+                if (result is not None) and verbose:
+                    print('Reusing Session-Cached Data of {}'.format(s3_path))
 
-                result = SparkXDF.load(
-                    path=s3_path,
-                    format=self.format,
-                    schema=None,
-                    aws_access_key_id=self.aws_access_key_id,
-                    aws_secret_access_key=self.aws_secret_access_key,
-                    verbose=verbose)
+            if (result is None) and (not _force_compute):
+                manifest = self._read_manifest(s3_key)
 
-                if self.validation_lambda:
-                    if self.validation_lambda(result):
-                        if verbose:
-                            print('done!')
+                if manifest is None:
+                    _load_path = None
+
+                    # legacy caches without manifest: only trust completed Spark writes
+                    if (self.version is None) and \
+                            _s3_head(
+                                s3_client=self.s3_client,
+                                s3_bucket=self.s3_bucket,
+                                s3_key=os.path.join(s3_key, _SPARK_SUCCESS_FILE_NAME),
+                                negative_lookup_ttl=None):
+                        _load_path = s3_path
 
                     else:
-                        _force_compute = True
+                        _s3_mark_absent(self.s3_bucket, s3_key, ttl=self.negative_lookup_ttl)
 
-                        if verbose:
-                            print('INVALID CACHED DATA TO BE RE-COMPUTED!')
+                elif _entry_stale(manifest['Metadata'], version=self.version):
+                    _load_path = None
+
+                else:
+                    _load_path = os.path.join(s3_path, manifest['data_dir'])
+
+                if _load_path is None:
+                    _force_compute = True
+
+                else:
+                    if verbose:
+                        print('Reading Cached Data from {}... '.format(_load_path), end='')
+
+                    result = DDF.load(
+                        path=_load_path,
+                        format=manifest['format'] if manifest else self.format,
+                        schema=None,
+                        aws_access_key_id=self.aws_access_key_id,
+                        aws_secret_access_key=self.aws_secret_access_key,
+                        verbose=verbose)
+
+                    if self.validation_lambda:
+                        if self.validation_lambda(result):
+                            if verbose:
+                                print('done!')
+
+                        else:
+                            _force_compute = True
+
+                            if verbose:
+                                print('INVALID CACHED DATA TO BE RE-COMPUTED!')
+
+                    if self.cache_in_session and (not _force_compute):
+                        _cache_in_session(
+                            self.s3_bucket, s3_key, result,
+                            meta=manifest['Metadata'] if manifest else {})
+
+            elif (result is not None) and self.validation_lambda and (not self.validation_lambda(result)):
+                _uncache_in_session(self.s3_bucket, s3_key)
+                _force_compute = True
 
             if _force_compute:
+                _uncache_in_session(self.s3_bucket, s3_key)
+
                 result = func(*args, **kwargs)
 
                 if self.validation_lambda:
                     assert self.validation_lambda(result)
 
                 if (self.pre_condition_lambda is None) or self.pre_condition_lambda(*args, **kwargs):
+                    attempt_id = '_attempt={}'.format(uuid.uuid4().hex)
+
                     result.save(
-                        path=s3_path,
+                        path=os.path.join(s3_path, attempt_id),
                         format=self.format,
                         aws_access_key_id=self.aws_access_key_id,
                         aws_secret_access_key=self.aws_secret_access_key,
+                        partitionBy=self.partition_by,
+                        sortBy=self.sort_by,
                         verbose=verbose)
 
+                    self._commit(s3_key, attempt_id)
+
+                    _put_tag_markers(
+                        s3_client=self.s3_client,
+                        s3_bucket=self.s3_bucket,
+                        s3_cache_dir_prefix=self.s3_cache_dir_prefix,
+                        entry_name=name,
+                        tags=self.tags)
+
+                    if self.cache_in_session:
+                        _cache_in_session(
+                            self.s3_bucket, s3_key, result,
+                            meta=_entry_meta(ttl=self.ttl, version=self.version, tags=self.tags))
+
             return self.post_process_lambda(result, **kwargs) \
                 if self.post_process_lambda \
                 else result
@@ -164,11 +907,18 @@ class S3CacheDecor(_CacheDecorABC):
             s3_bucket,
             s3_cache_dir_prefix,
             local_cache_dir_path,
-            file_name_lambda,
+            file_name_lambda=None,
             serializer='joblib',
+            compress=None,
+            compress_lvl=pkl.DEFAULT_COMPRESS_LVL,
             pre_condition_lambda=None,
             validation_lambda=None,
             post_process_lambda=None,
+            negative_lookup_ttl=DEFAULT_NEGATIVE_LOOKUP_TTL,
+            content_addressed=None,
+            ttl=None,
+            version=None,
+            tags=(),
             verbose=False):
         self.s3_client = s3_client
 
@@ -183,38 +933,49 @@ class S3CacheDecor(_CacheDecorABC):
 
         self.file_name_lambda = file_name_lambda
 
+        # content-addressed layout: "refs/<key>" files hold the digest of a "blobs/<digest>" file,
+        # so that identical results are stored only once; default on with automatic keys
+        self.content_addressed = \
+            (file_name_lambda is None) \
+            if content_addressed is None \
+            else content_addressed
+
+        if self.content_addressed:
+            for dir_name in (_CA_REFS_DIR_NAME, _CA_BLOBS_DIR_NAME):
+                fs.mkdir(
+                    dir=os.path.join(local_cache_dir_path, dir_name),
+                    hdfs=False)
+
         if isinstance(serializer, _STR_CLASSES):
-            if serializer == 'json':
-                self.file_read_lambda = \
-                    lambda file_name: \
-                        json.load(
-                            open(os.path.join(local_cache_dir_path, file_name), 'r'),
-                            encoding='utf-8')
-
-                self.file_write_lambda = \
-                    lambda obj, file_name: \
-                        json.dump(
-                            obj=obj,
-                            fp=open(os.path.join(local_cache_dir_path, file_name), 'w'),
-                            ensure_ascii=False,
-                            allow_nan=True,
-                            indent=4,
-                            encoding='utf-8')
-
-            elif serializer in ('joblib', 'pickle'):
-                self.file_read_lambda = \
-                    lambda file_name: \
-                        joblib.load(filename=os.path.join(local_cache_dir_path, file_name))
-
-                self.file_write_lambda = \
-                    lambda obj, file_name: \
-                        joblib.dump(
-                            obj,
-                            filename=os.path.join(local_cache_dir_path, file_name),
-                            compress=(pkl.COMPAT_COMPRESS, pkl.MAX_COMPRESS_LVL),
-                            protocol=pkl.COMPAT_PROTOCOL)
+            assert serializer in SERIALIZERS, \
+                '*** serializer must be one of {} ***'.format(SERIALIZERS)
+
+            if compress:
+                assert serializer in ('pickle5', 'feather', 'auto'), \
+                    '*** compress only applies to "pickle5", "feather" & "auto" serializers ***'
+
+                assert compress in pkl.FAST_COMPRESSORS, \
+                    '*** compress must be one of {} ***'.format(pkl.FAST_COMPRESSORS)
+
+            self.serializer = serializer
+
+            _read, _write = _SERIALIZER_FUNCS[serializer]
+
+            self.file_read_lambda = \
+                lambda file_name: \
+                    _read(os.path.join(local_cache_dir_path, file_name))
+
+            self.file_write_lambda = \
+                lambda obj, file_name: \
+                    _write(
+                        obj,
+                        os.path.join(local_cache_dir_path, file_name),
+                        compress=compress,
+                        compress_lvl=compress_lvl)
 
         else:
+            self.serializer = serializer
+
             self.file_read_lambda = \
                 lambda file_name: \
                     serializer.load(
@@ -232,6 +993,12 @@ class S3CacheDecor(_CacheDecorABC):
 
         self.post_process_lambda = post_process_lambda
 
+        self.negative_lookup_ttl = negative_lookup_ttl
+
+        self.ttl = ttl
+        self.version = version
+        self.tags = tuple(tags)
+
         self._verbose = verbose
 
     @property
@@ -246,12 +1013,161 @@ class S3CacheDecor(_CacheDecorABC):
     def verbose(self):
         return self._verbose
 
+    def invalidate(self, tags=(), prefix=None, verbose=None):
+        """
+        Delete cached results carrying any of ``tags`` and/or whose file names start with ``prefix``,
+        both on S3 & in the local cache directory
+        """
+        if verbose is None:
+            verbose = self.verbose
+
+        entry_names = \
+            _invalidate(
+                s3_client=self.s3_client,
+                s3_bucket=self.s3_bucket,
+                s3_cache_dir_prefix=self.s3_cache_dir_prefix,
+                entries_dir_name=_CA_REFS_DIR_NAME if self.content_addressed else '',
+                local_cache_dir_path=self.local_cache_dir_path,
+                tags=tags,
+                prefix=prefix,
+                verbose=verbose)
+
+        # blobs are shared among refs, so they can only go once no ref points to them
+        if self.content_addressed and entry_names:
+            self.sweep_blobs(verbose=verbose)
+
+        return entry_names
+
+    def sweep_blobs(self, verbose=None):
+        """
+        Delete content-addressed blobs no longer pointed to by any ref, both on S3 & in the local cache directory
+        """
+        return _sweep_unreferenced_blobs(
+            s3_client=self.s3_client,
+            s3_bucket=self.s3_bucket,
+            s3_cache_dir_prefix=self.s3_cache_dir_prefix,
+            local_cache_dir_path=self.local_cache_dir_path,
+            verbose=self.verbose if verbose is None else verbose)
+
+    def _entry_stale(self, entry_file_name):
+        # answered from the local sidecar, without any S3 round trip
+        s3_meta = _read_s3_meta(os.path.join(self.local_cache_dir_path, entry_file_name))
+
+        return bool(s3_meta) and \
+            _entry_stale(s3_meta.get('Metadata', {}), version=self.version)
+
+    def _fetch_if_absent(self, file_name):
+        # returns whether the file is available locally afterwards
+        return os.path.isfile(os.path.join(self.local_cache_dir_path, file_name)) or \
+            (_s3_get_if_changed(
+                s3_client=self.s3_client,
+                s3_bucket=self.s3_bucket,
+                s3_key=os.path.join(self.s3_cache_dir_prefix, file_name),
+                local_file_path=os.path.join(self.local_cache_dir_path, file_name),
+                negative_lookup_ttl=self.negative_lookup_ttl) is not None)
+
+    def _upload(self, file_name, entry=False):
+        s3_file_key = os.path.join(self.s3_cache_dir_prefix, file_name)
+        local_file_path = os.path.join(self.local_cache_dir_path, file_name)
+
+        self.s3_client.upload_file(
+            Filename=local_file_path,
+            Bucket=self.s3_bucket,
+            Key=s3_file_key,
+            ExtraArgs=dict(Metadata=_entry_meta(ttl=self.ttl, version=self.version, tags=self.tags))
+                if entry
+                else None)
+
+        if entry:
+            _put_tag_markers(
+                s3_client=self.s3_client,
+                s3_bucket=self.s3_bucket,
+                s3_cache_dir_prefix=self.s3_cache_dir_prefix,
+                entry_name=os.path.relpath(
+                    file_name,
+                    _CA_REFS_DIR_NAME if self.content_addressed else ''),
+                tags=self.tags)
+
+        _s3_unmark_absent(self.s3_bucket, s3_file_key)
+
+        _write_s3_meta(
+            local_file_path,
+            self.s3_client.head_object(
+                Bucket=self.s3_bucket,
+                Key=s3_file_key))
+
+    def _resolve_ref(self, ref_file_name):
+        if not self._fetch_if_absent(ref_file_name):
+            return None
+
+        with open(os.path.join(self.local_cache_dir_path, ref_file_name), 'r') as f:
+            return os.path.join(_CA_BLOBS_DIR_NAME, f.read().strip())
+
+    def _write_blob_and_ref(self, obj, ref_file_name):
+        tmp_file_name = \
+            os.path.join(
+                _CA_BLOBS_DIR_NAME,
+                '.tmp-{}'.format(uuid.uuid4()))
+
+        self.file_write_lambda(
+            obj=obj,
+            file_name=tmp_file_name)
+
+        tmp_file_path = os.path.join(self.local_cache_dir_path, tmp_file_name)
+
+        digest = hashing.hash_file(tmp_file_path)
+
+        blob_file_name = os.path.join(_CA_BLOBS_DIR_NAME, digest)
+        blob_file_path = os.path.join(self.local_cache_dir_path, blob_file_name)
+
+        os.replace(tmp_file_path, blob_file_path)
+
+        # identical results share 1 blob: only upload if not already there
+        blob_meta = \
+            _s3_head(
+                s3_client=self.s3_client,
+                s3_bucket=self.s3_bucket,
+                s3_key=os.path.join(self.s3_cache_dir_prefix, blob_file_name),
+                negative_lookup_ttl=None)
+
+        if blob_meta is None:
+            self._upload(blob_file_name)
+
+        else:
+            _write_s3_meta(blob_file_path, blob_meta)
+
+        with open(os.path.join(self.local_cache_dir_path, ref_file_name), 'w') as f:
+            f.write(digest)
+
+        self._upload(ref_file_name, entry=True)
+
     def __call__(self, func):
+        # file_name_lambda=None: derive names from hashes of the function's code & arguments
+        _func_fingerprint = \
+            hashing.func_fingerprint(func) \
+            if self.file_name_lambda is None \
+            else None
+
         def decor_func(*args, **kwargs):
             _force_compute = kwargs.get('_force_compute', False)
             verbose = kwargs.get('_cache_verbose', self.verbose)
 
-            file_name = self.file_name_lambda(*args, **kwargs)
+            file_name = \
+                _auto_cache_key(func, _func_fingerprint, args, kwargs) \
+                if self.file_name_lambda is None \
+                else self.file_name_lambda(*args, **kwargs)
+
+            if self.content_addressed:
+                ref_file_name = os.path.join(_CA_REFS_DIR_NAME, file_name)
+
+                if not _force_compute:
+                    blob_file_name = self._resolve_ref(ref_file_name)
+
+                    if (blob_file_name is None) or self._entry_stale(ref_file_name):
+                        _force_compute = True
+
+                    else:
+                        file_name = blob_file_name
 
             local_cache_file_path = \
                 os.path.join(
@@ -270,18 +1186,17 @@ class S3CacheDecor(_CacheDecorABC):
                 else:
                     _local_cache_file_exists = False
 
-                    if 'Contents' in \
-                            self.s3_client.list_objects(
-                                Bucket=self.s3_bucket,
-                                Prefix=s3_file_key):
-                        self.s3_client.download_file(
-                            Bucket=self.s3_bucket,
-                            Key=s3_file_key,
-                            Filename=local_cache_file_path)
-
-                    else:
+                    if _s3_get_if_changed(
+                            s3_client=self.s3_client,
+                            s3_bucket=self.s3_bucket,
+                            s3_key=s3_file_key,
+                            local_file_path=local_cache_file_path,
+                            negative_lookup_ttl=self.negative_lookup_ttl) is None:
                         _force_compute = True
 
+                if (not _force_compute) and (not self.content_addressed) and self._entry_stale(file_name):
+                    _force_compute = True
+
             if not _force_compute:
                 if verbose:
                     print('Reading cached result from {0}...'.format(local_cache_file_path), end=' ')
@@ -296,16 +1211,14 @@ class S3CacheDecor(_CacheDecorABC):
                             print('done!')
 
                     else:
+                        # only re-read if S3 has different bytes than the local copy
                         if _local_cache_file_exists and \
-                                ('Contents' in
-                                    self.s3_client.list_objects(
-                                        Bucket=self.s3_bucket,
-                                        Prefix=s3_file_key)):
-                            self.s3_client.download_file(
-                                Bucket=self.s3_bucket,
-                                Key=s3_file_key,
-                                Filename=local_cache_file_path)
-
+                                _s3_get_if_changed(
+                                    s3_client=self.s3_client,
+                                    s3_bucket=self.s3_bucket,
+                                    s3_key=s3_file_key,
+                                    local_file_path=local_cache_file_path,
+                                    negative_lookup_ttl=self.negative_lookup_ttl):
                             result = \
                                 self.file_read_lambda(
                                     file_name=file_name)
@@ -325,7 +1238,7 @@ class S3CacheDecor(_CacheDecorABC):
 
                             if verbose:
                                 print('INVALID CACHED RESULT TO BE RE-COMPUTED!')
-                    
+
             if _force_compute:
                 result = func(*args, **kwargs)
 
@@ -333,14 +1246,17 @@ class S3CacheDecor(_CacheDecorABC):
                     assert self.validation_lambda(result)
 
                 if (self.pre_condition_lambda is None) or self.pre_condition_lambda(*args, **kwargs):
-                    self.file_write_lambda(
-                        obj=result,
-                        file_name=file_name)
+                    if self.content_addressed:
+                        self._write_blob_and_ref(
+                            obj=result,
+                            ref_file_name=ref_file_name)
+
+                    else:
+                        self.file_write_lambda(
+                            obj=result,
+                            file_name=file_name)
 
-                    self.s3_client.upload_file(
-                        Filename=local_cache_file_path,
-                        Bucket=self.s3_bucket,
-                        Key=s3_file_key)
+                        self._upload(file_name, entry=True)
 
             return self.post_process_lambda(result, **kwargs) \
                 if self.post_process_lambda \
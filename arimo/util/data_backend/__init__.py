@@ -1,23 +1,16 @@
+from functools import lru_cache
+import importlib
 import logging
 import os
 import psutil
 import subprocess
 import sys
 
-import ray
-from ray import ray_constants
-import pyarrow
-
-import tensorflow
-import keras
-
-import pyspark
-
-from arimo.util import __path__ as arimo_util_paths
+from arimo.util import __path__ as arimo_util_paths, fs
 from arimo.util.decor import _docstr_verbose
-from arimo.util.fs import hdfs_client as hdfs, exist, put, rm, \
+from arimo.util.fs import dir_usage, exist, put, rm, \
     _HADOOP_HOME, _HADOOP_CONF_DIR_ENV_VAR_NAME, \
-    _ON_LINUX_CLUSTER, _ON_LINUX_CLUSTER_WITH_HDFS
+    _ON_LINUX_CLUSTER, _hdfs_available
 from arimo.util.log import STDOUT_HANDLER
 
 from ..aws.ec2.instance_types import INSTANCE_TYPES_INFO, MEMORY_GiB_KEY, N_CPUS_KEY
@@ -32,21 +25,49 @@ assert sys.version_info >= _MIN_PY_VER, \
 
 
 _MIN_ARROW_VER = '1.0.1'
-assert pyarrow.__version__ >= _MIN_ARROW_VER, \
-    f'*** PyArrow >= {_MIN_ARROW_VER} required, but {pyarrow.__version__} installed ***'
-
 
 _MIN_SPARK_VER = '3.0.1'
 
-
 _MIN_TF_VER = '2.2.1'   # works with multiprocessing training
-assert tensorflow.__version__ >= _MIN_TF_VER, \
-    f'*** TensorFlow >= {_MIN_TF_VER} required, but {tensorflow.__version__} installed ***'
-
 
 _MIN_KERAS_VER = '2.3.1'   # works with multiprocessing training
-assert keras.__version__ >= _MIN_KERAS_VER, \
-    f'*** Keras >= {_MIN_KERAS_VER} required, but Currently {keras.__version__} installed ***'
+
+
+# heavy back-ends are imported (& their versions verified) on first use, not when this module is imported
+_LAZY_MODULES = {
+    'pyarrow': ('PyArrow', _MIN_ARROW_VER),
+    'pyspark': ('Spark', _MIN_SPARK_VER),
+    'ray': ('Ray', None),
+    'tensorflow': ('TensorFlow', _MIN_TF_VER),
+    'keras': ('Keras', _MIN_KERAS_VER)
+}
+
+
+@lru_cache(maxsize=None)
+def _import(module_name):
+    module = importlib.import_module(module_name)
+
+    lib_name, min_ver = _LAZY_MODULES[module_name]
+
+    if min_ver:
+        assert module.__version__ >= min_ver, \
+            f'*** {lib_name} >= {min_ver} required, but {module.__version__} installed ***'
+
+    return module
+
+
+def __getattr__(name):
+    # PEP 562: "data_backend.pyspark", "data_backend.hdfs", etc. resolved on first access
+    if name in _LAZY_MODULES:
+        return _import(name)
+
+    elif name == 'hdfs':
+        return fs.hdfs_client
+
+    elif name == '_ON_LINUX_CLUSTER_WITH_HDFS':
+        return _hdfs_available()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 # Java Home
@@ -234,6 +255,78 @@ _SPARK_CONF = \
      'spark.yarn.am.memory': '512m',
      'spark.yarn.am.cores': 1}
 
+
+# ADAPTIVE SPARK CONFIGS
+# derived in initSpark(adaptive=True) from the started session's executor cores & executor memory,
+# over-riding the static _SPARK_CONF above at runtime;
+# Adaptive Query Execution then coalesces shuffle partitions & splits skewed ones according to actual data volume
+_ADAPTIVE_SHUFFLE_PARTITIONS_PER_CORE = 3
+_ADAPTIVE_MIN_SHUFFLE_PARTITIONS = 200
+_ADAPTIVE_MAX_SHUFFLE_PARTITIONS = 2001   # > 2000: highly-compressed MapStatus
+
+_ADAPTIVE_ADVISORY_PARTITION_BYTES = 128 * 2 ** 20
+
+_ADAPTIVE_ARROW_BATCH_MEM_PROPORTION = 1 / 32   # of executor memory per core
+_ADAPTIVE_ARROW_ASSUMED_ROW_BYTES = 2 ** 10
+_ADAPTIVE_ARROW_MIN_RECORDS_PER_BATCH = 10 ** 3
+_ADAPTIVE_ARROW_MAX_RECORDS_PER_BATCH = 10 ** 5
+
+# config key -> (value, reason) for each adaptive choice made
+_SPARK_CONF_REPORT = {}
+
+
+def _reportSparkConf(key, value, reason):
+    _SPARK_CONF_REPORT[key] = value, reason
+
+
+def sparkConfReport():
+    """
+    Return:
+        dict mapping config keys (or per-dataset choices) to (value, reason) for each adaptive Spark config choice made
+    """
+    return dict(_SPARK_CONF_REPORT)
+
+
+def _adaptiveSparkConf(nCores, executorMemGiB, nCoresPerExecutor):
+    nShufflePartitions = \
+        min(max(_ADAPTIVE_SHUFFLE_PARTITIONS_PER_CORE * nCores,
+                _ADAPTIVE_MIN_SHUFFLE_PARTITIONS),
+            _ADAPTIVE_MAX_SHUFFLE_PARTITIONS)
+
+    executorMemBytesPerCore = executorMemGiB * 2 ** 30 / max(nCoresPerExecutor, 1)
+
+    arrowMaxRecordsPerBatch = \
+        min(max(int(_ADAPTIVE_ARROW_BATCH_MEM_PROPORTION * executorMemBytesPerCore /
+                    _ADAPTIVE_ARROW_ASSUMED_ROW_BYTES),
+                _ADAPTIVE_ARROW_MIN_RECORDS_PER_BATCH),
+            _ADAPTIVE_ARROW_MAX_RECORDS_PER_BATCH)
+
+    return {
+        'spark.sql.adaptive.enabled':
+            (True, 'Adaptive Query Execution re-plans stages from runtime statistics'),
+        'spark.sql.adaptive.coalescePartitions.enabled':
+            (True, 'merge small shuffle partitions according to actual data volume'),
+        'spark.sql.adaptive.coalescePartitions.initialPartitionNum':
+            (nShufflePartitions, 'initial shuffle partitions before coalescing'),
+        'spark.sql.adaptive.advisoryPartitionSizeInBytes':
+            (_ADAPTIVE_ADVISORY_PARTITION_BYTES, 'target post-coalescing shuffle partition size'),
+        'spark.sql.adaptive.skewJoin.enabled':
+            (True, 'split skewed shuffle partitions in sort-merge joins'),
+
+        'spark.sql.shuffle.partitions':
+            (nShufflePartitions,
+             '{}x {:,} cores, within [{:,}, {:,}]'.format(
+                _ADAPTIVE_SHUFFLE_PARTITIONS_PER_CORE, nCores,
+                _ADAPTIVE_MIN_SHUFFLE_PARTITIONS, _ADAPTIVE_MAX_SHUFFLE_PARTITIONS)),
+
+        'spark.sql.execution.arrow.maxRecordsPerBatch':
+            (arrowMaxRecordsPerBatch,
+             '{:.3f} of {:,.0f} MiB executor memory per core at ~{:,} bytes per row, within [{:,}, {:,}]'.format(
+                _ADAPTIVE_ARROW_BATCH_MEM_PROPORTION, executorMemBytesPerCore / 2 ** 20,
+                _ADAPTIVE_ARROW_ASSUMED_ROW_BYTES,
+                _ADAPTIVE_ARROW_MIN_RECORDS_PER_BATCH, _ADAPTIVE_ARROW_MAX_RECORDS_PER_BATCH))
+    }
+
 _SPARK_REPOS = \
     {'http://redshift-maven-repository.s3-website-us-east-1.amazonaws.com/release'}
 
@@ -476,12 +569,24 @@ _SPARK_ARIMO_PACKAGE_PY_FILE_PATHS = os.path.join(arimo_util_paths[0], 'dl.py'),
 
 _SPARK_CKPT_DIR = '/tmp/.spark/ckpt'
 
+# content-keyed DistributedDataFrame checkpoints, kept across Spark sessions
+# & cleaned up least-recently-used first once over the size limit
+_SPARK_CKPT_STORE_DIR = '/tmp/.spark/ckpt-store'
+
+_SPARK_CKPT_STORE_MAX_BYTES = 100 * 2 ** 30
+
+# names of store entries switched to in this session, which DataFrames may still read from
+_LIVE_SPARK_CKPT_STORE_ENTRIES = set()
+
 
 def chkRay() -> bool:
-    return ray.is_initialized()
+    return ('ray' in sys.modules) and _import('ray').is_initialized()
 
 
 def initRay(*, verbose: bool = False) -> None:
+    ray = _import('ray')
+    ray_constants = importlib.import_module('ray.ray_constants')
+
     ray.init(
         address=None,
             # str
@@ -648,7 +753,7 @@ def chkSpark():
 
 
 def updateYARNJARs():
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
+    if _hdfs_available():
         put(from_local=_SPARK_JARS_DIR_PATH_ON_ARIMO_LINUX_CLUSTER,
             to_hdfs=_YARN_JARS_DIR_NAME,
             is_dir=True,
@@ -661,11 +766,41 @@ def rmSparkCkPts():
     Clean up Spark Checkpoint directory
     """
     rm(path=_SPARK_CKPT_DIR,
-       hdfs=_ON_LINUX_CLUSTER_WITH_HDFS,
+       hdfs=_hdfs_available(),
        is_dir=True,
        hadoop_home=_HADOOP_HOME)
 
 
+def trimSparkCkPtStore(maxBytes=None):
+    """
+    Remove least-recently-used content-keyed checkpoints until the checkpoint store is within ``maxBytes``
+    (default: ``_SPARK_CKPT_STORE_MAX_BYTES``), always keeping the most recently used one
+    & those switched to in this session
+    """
+    if maxBytes is None:
+        maxBytes = _SPARK_CKPT_STORE_MAX_BYTES
+
+    hdfs = _hdfs_available()
+
+    usage = dir_usage(_SPARK_CKPT_STORE_DIR, hdfs=hdfs)
+
+    totalBytes = sum(nBytes for nBytes, _ in usage.values())
+
+    for ckptName, (nBytes, _) in sorted(usage.items(), key=lambda item: item[1][1])[:-1]:
+        if totalBytes <= maxBytes:
+            break
+
+        if ckptName in _LIVE_SPARK_CKPT_STORE_ENTRIES:
+            continue
+
+        rm(path=os.path.join(_SPARK_CKPT_STORE_DIR, ckptName),
+           hdfs=hdfs,
+           is_dir=True,
+           hadoop_home=_HADOOP_HOME)
+
+        totalBytes -= nBytes
+
+
 @_docstr_verbose
 def initSpark(
         sparkApp=None,
@@ -678,7 +813,8 @@ def initSpark(
         yarnConfDir=None,
         yarnUpdateJARs=False,
         dataIO={'avro', 'pg', 'redshift', 'sftp'},
-        executor_aws_ec2_instance_type='c5n.9xlarge'):
+        executor_aws_ec2_instance_type='c5n.9xlarge',
+        adaptive=False):
     """
     Launch new ``SparkSession`` or connect to existing one, and binding it to ``arimo.data_backend.spark``
 
@@ -699,9 +835,13 @@ def initSpark(
         ckptDir (str): path to default Spark checkpoint directory
 
         dataIO (set): additional data IO support options
+
+        adaptive (bool, default = False): whether to enable Adaptive Query Execution & derive shuffle partitions,
+            Arrow batch size, etc. from the started session's executor cores (``defaultParallelism``) & executor memory
+            (see ``sparkConfReport()``; explicitly-given ``sparkConf`` items take precedence)
     """
-    assert (pyspark.__version__ >= _MIN_SPARK_VER), \
-        f'*** Spark >= {_MIN_SPARK_VER} required, but {pyspark.__version__} installed ***'
+    pyspark = _import('pyspark')
+    importlib.import_module('pyspark.sql')
 
     # initialize logger
     logger = logging.getLogger(__name__)
@@ -723,7 +863,7 @@ def initSpark(
     if sparkHome:
         os.environ[_SPARK_HOME_ENV_VAR_NAME] = sparkHome
 
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
+    if _hdfs_available():
         os.environ[_HADOOP_CONF_DIR_ENV_VAR_NAME] = \
             hadoopConfDir \
             if hadoopConfDir \
@@ -799,7 +939,7 @@ def initSpark(
                 executor_aws_ec2_instance_type_info[MEMORY_GiB_KEY], executor_aws_ec2_instance_type_info[N_CPUS_KEY],
                 optim_alloc_details['avail_for_driver_mem_gib']))
 
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
+    if _hdfs_available():
         if exist(path=_YARN_JARS_DIR_NAME,
                  hdfs=True,
                  dir=True):
@@ -823,8 +963,10 @@ def initSpark(
        hdfs=False,
        is_dir=True)
 
-    # clean up existing Spark checkpoints
+    # clean up existing Spark checkpoints, which cannot be reused across sessions,
+    # and trim content-keyed checkpoints, which can
     rmSparkCkPts()
+    trimSparkCkPtStore()
 
     # get / create SparkSession
     spark = pyspark.sql.SparkSession.builder \
@@ -840,6 +982,28 @@ def initSpark(
 
     spark.sparkContext.setLogLevel('WARN')   # ALL, DEBUG, ERROR, FATAL, INFO, OFF, TRACE or WARN
 
+    if adaptive:
+        # cores of executors actually registered (the scheduler waits for them on start-up),
+        # rather than of the static, over-requested spark.executor.instances
+        nCores = spark.sparkContext.defaultParallelism
+
+        _SPARK_CONF_REPORT.clear()
+
+        for k, (v, reason) in \
+                _adaptiveSparkConf(
+                    nCores=nCores,
+                    executorMemGiB=optim_alloc_details['executor_mem_gib'],
+                    nCoresPerExecutor=n_cpus_per_executor).items():
+            if k in sparkConf:
+                v, reason = sparkConf[k], 'explicitly given'
+
+            else:
+                spark.conf.set(k, v)
+
+            _reportSparkConf(k, v, reason)
+
+            logger.info(msg='{} = {}   ({})'.format(k, v, reason))
+
     spark.sparkContext.setCheckpointDir(dirName=_SPARK_CKPT_DIR)
 
     # set Hadoop Conf in Spark Context
@@ -848,6 +1012,8 @@ def initSpark(
         spark.sparkContext._jsc.hadoopConfiguration().set("fs.s3a.awsSecretAccessKey", os.environ.get('AWS_SECRET_ACCESS_KEY'))
 
     # register Uder-Defined Functions (UDFs)
+    # for use in SQL strings: DataFrame code paths use the JVM-native vectorToArray(...) & arrayToVector(...) below,
+    # as Vectors cannot go through Arrow-based Pandas UDFs
     from pyspark.ml.linalg import DenseVector, VectorUDT
     from pyspark.sql.types import ArrayType, DoubleType
 
@@ -870,6 +1036,38 @@ def initSpark(
         logger.info(msg + ' done!')
 
 
+def vectorToArray(col):
+    """
+    Return:
+        ``Spark SQL`` ``Column`` converting Vector column ``col`` to ``array<double>``
+        natively in the JVM, instead of row-at-a-time by the ``_VECTOR_TO_ARRAY`` Python UDF
+    """
+    return importlib.import_module('pyspark.ml.functions').vector_to_array(col)
+
+
+@lru_cache(maxsize=None)
+def _arrayToVectorFunc():
+    pyspark_ml_functions = importlib.import_module('pyspark.ml.functions')
+
+    if hasattr(pyspark_ml_functions, 'array_to_vector'):   # Spark >= 3.1
+        return pyspark_ml_functions.array_to_vector
+
+    else:
+        from pyspark.ml.linalg import DenseVector, VectorUDT
+        from pyspark.sql.functions import udf
+
+        return udf(lambda a: DenseVector(a), returnType=VectorUDT())
+
+
+def arrayToVector(col):
+    """
+    Return:
+        ``Spark SQL`` ``Column`` converting numerical array column ``col`` to dense Vector,
+        natively in the JVM where supported (Spark >= 3.1), else by a Python UDF
+    """
+    return _arrayToVectorFunc()(col)
+
+
 def setSpark1Partition1File(on=True):
     assert chkSpark()
 
@@ -948,7 +1146,7 @@ def setSpark1Partition1File(on=True):
 
 
 def runSparkWorkerCmd(cmd, n=9):
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
+    if _hdfs_available():
         def run(_):
             return subprocess.Popen(
                     cmd,
@@ -975,7 +1173,7 @@ def runSparkWorkerCmd(cmd, n=9):
 
 
 def installSparkWorkerDeps(*deps, **kwargs):
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
+    if _hdfs_available():
         def installDeps(_, deps=deps):
             import os
             os.system('pip install --upgrade {}'.format(' '.join(deps)))
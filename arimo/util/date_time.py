@@ -21,7 +21,6 @@ __all__ = (
 
 import datetime
 from dateutil.relativedelta import relativedelta
-import pandas
 
 
 DATE_COL = 'date'
@@ -108,9 +107,11 @@ _PRED_VARS_INCL_T_AUX_COLS = _PRED_VARS_INCL_T_CAT_AUX_COLS + _PRED_VARS_INCL_T_
 
 
 def gen_aux_cols(
-        df: pandas.DataFrame,   # TODO Py3.8: positional-only
+        df: 'pandas.DataFrame',   # TODO Py3.8: positional-only
         *, i_col: str = None, t_col: str = 't')\
-        -> pandas.DataFrame:
+        -> 'pandas.DataFrame':
+    import pandas   # deferred so that importing column-name constants does not import Pandas
+
     assert t_col in df.columns, \
         '*** "{}" NOT AMONG {} ***'.format(t_col, df.columns.tolist())
 
@@ -7,54 +7,73 @@ if six.PY2:
 from . import iterables
 
 
-_SELF_ONLY_METHOD_ARG_SPEC = \
-    inspect.ArgSpec(
-        args=['self'],
-        varargs=None,
-        keywords=None,
-        defaults=None)
+# (names of keyword args accepted, or None if accepting **kwargs; whether taking "self" only) by code object,
+# so that signatures are introspected once per function rather than on every call
+_ARG_SPECS = {}
 
 
-def _arg_spec(obj):   # for Py2 compatibility, using inspect.getargspec instead of .getfullargspec / .signature
-    try:
-        return inspect.getargspec(func=obj)
-    except TypeError:
-        pass
+def _arg_spec(func):
+    code = getattr(getattr(func, '__func__', func), '__code__', None)
+
+    arg_spec = _ARG_SPECS.get(code)
+
+    if arg_spec is None:
+        try:
+            full_arg_spec = inspect.getfullargspec(func)
+
+        except TypeError:
+            return None, False
+
+        arg_spec = \
+            (None
+             if full_arg_spec.varkw
+             else frozenset(full_arg_spec.args + full_arg_spec.kwonlyargs)), \
+            ((full_arg_spec.args == ['self']) and
+             (not (full_arg_spec.varargs or full_arg_spec.varkw or
+                   full_arg_spec.defaults or full_arg_spec.kwonlyargs)))
+
+        if code is not None:
+            _ARG_SPECS[code] = arg_spec
+
+    return arg_spec
+
+
+def _accepted_kwargs(kwargs, arg_names):
+    # pass kwargs through as-is unless some must be dropped
+    return kwargs \
+        if (arg_names is None) or arg_names.issuperset(kwargs) \
+        else {k: v for k, v in kwargs.items() if k in arg_names}
 
 
 def enable_inplace(Class):
     def enable_inplace(method):
+        method_arg_names = _arg_spec(method)[0]
+
         def method_with_inplace(*args, **kwargs):
             """
             inplace (bool): whether to update the instance in-place;
                 *IMPORTANT NOTE 1:* please specify all other arguments by **keyword arguments**
                 *IMPORTANT NOTE 2:* inplace=True cannot be used with varargs
             """
-            # try to retrieve __self__ instance from *args, falling back to method.__self__
-            self = args[0] if args else method.__self__   # requires carrying __self__ along in all nested decorators
+            if kwargs:
+                inplace = kwargs.pop('inplace', False)
+                result = method(*args, **_accepted_kwargs(kwargs, method_arg_names))
 
-            inplace = kwargs.pop('inplace', False)
-            kwargs_set = set(kwargs)
-
-            method_arg_spec = inspect.getargspec(method)
-            method_args = kwargs \
-                if method_arg_spec.keywords \
-                else {k: kwargs[k] for k in kwargs_set.intersection(method_arg_spec.args)}
-
-            result = method(*args, **method_args)
+            else:   # fast path: nothing to inspect or filter
+                inplace = False
+                result = method(*args)
 
             if inplace:
-                inplace_kwargs_spec = inspect.getargspec(Class._inplace)
-                inplace_kwargs = kwargs \
-                    if inplace_kwargs_spec.keywords \
-                    else {k: kwargs[k] for k in kwargs_set.intersection(inplace_kwargs_spec.args)}
-                Class._inplace(self, result, **inplace_kwargs)
+                # try to retrieve __self__ instance from *args, falling back to method.__self__
+                self = args[0] if args else method.__self__   # requires carrying __self__ along in all nested decorators
+
+                Class._inplace(self, result, **_accepted_kwargs(kwargs, _arg_spec(Class._inplace)[0]))
 
             elif callable(result) \
                     and (not isinstance(result, Class)) \
                     and (not isinstance(result, type if six.PY3 else ClassType)) \
-                    and (_arg_spec(result) != _SELF_ONLY_METHOD_ARG_SPEC):
-                result.__self__ = self
+                    and (not _arg_spec(result)[1]):
+                result.__self__ = args[0] if args else method.__self__
                 return enable_inplace(result)
 
             else:
@@ -1,25 +1,191 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import gc
+import math
 import os
+import threading
+import time
+
 import keras
 
 
 MASK_VAL = .13 ** 3
 
 
-_LOADED_MODELS = {}
+# LOADED MODEL REGISTRY
+# least-recently-used Keras models are evicted once either limit is exceeded,
+# so that long-lived processes scoring many models don't grow without bound
+_MAX_N_LOADED_MODELS = 30
+
+_MAX_LOADED_MODELS_BYTES = 4 * 2 ** 30   # estimated from parameter counts & dtypes
+
+_LOADED_MODELS = OrderedDict()   # file path -> (model, estimated bytes), least recently used first
+
+_LOADED_MODELS_BYTES = 0
+
+_LOADED_MODELS_LOCK = threading.Lock()
+
+# per-path locks, so that concurrent threads don't load the same model twice
+_LOAD_LOCKS = {}
+
+_LOADED_MODELS_STATS = dict(
+    n_hits=0,
+    n_misses=0,
+    n_evictions=0,
+    load_time=0.)   # seconds
+
+
+def _model_bytes(model):
+    try:
+        return sum(math.prod(weight.shape) * weight.dtype.size
+                   for weight in model.weights)
+
+    except (AttributeError, TypeError):
+        return model.count_params() * 4   # assume float32
+
+
+def _evict_lru_models():
+    # evict least-recently-used models (always keeping the latest one) while over either limit;
+    # must be called while holding _LOADED_MODELS_LOCK
+    global _LOADED_MODELS_BYTES
+
+    n_evicted = 0
+
+    while (len(_LOADED_MODELS) > 1) and \
+            ((len(_LOADED_MODELS) > _MAX_N_LOADED_MODELS) or
+             (_LOADED_MODELS_BYTES > _MAX_LOADED_MODELS_BYTES)):
+        _, (_, n_bytes) = _LOADED_MODELS.popitem(last=False)
+        _LOADED_MODELS_BYTES -= n_bytes
+        n_evicted += 1
+
+    _LOADED_MODELS_STATS['n_evictions'] += n_evicted
+
+    return n_evicted
+
+
+def _release_evicted_models():
+    # collect the evicted models' memory once no longer referenced;
+    # Keras' global state is left alone (no clear_session()), as other threads may be loading or using models
+    gc.collect()
+
+
+def configure_loaded_models(max_n_models=None, max_bytes=None):
+    """
+    Set the loaded Keras model registry's limits, evicting models as needed
+    """
+    global _MAX_N_LOADED_MODELS, _MAX_LOADED_MODELS_BYTES
+
+    with _LOADED_MODELS_LOCK:
+        if max_n_models is not None:
+            _MAX_N_LOADED_MODELS = max_n_models
+
+        if max_bytes is not None:
+            _MAX_LOADED_MODELS_BYTES = max_bytes
+
+        n_evicted = _evict_lru_models()
+
+    if n_evicted:
+        _release_evicted_models()
+
+
+def _cached_keras_model(file_path):
+    # must be called while holding _LOADED_MODELS_LOCK
+    model, _ = _LOADED_MODELS[file_path]
+    _LOADED_MODELS.move_to_end(file_path)
+    _LOADED_MODELS_STATS['n_hits'] += 1
+    return model
 
 
 def _load_keras_model(file_path):
-    global _LOADED_MODELS
+    global _LOADED_MODELS_BYTES
+
+    with _LOADED_MODELS_LOCK:
+        if file_path in _LOADED_MODELS:
+            return _cached_keras_model(file_path)
+
+        load_lock = _LOAD_LOCKS.setdefault(file_path, threading.Lock())
+
+    with load_lock:
+        try:
+            # another thread may have loaded the same model while this one was waiting
+            with _LOADED_MODELS_LOCK:
+                if file_path in _LOADED_MODELS:
+                    return _cached_keras_model(file_path)
+
+                _LOADED_MODELS_STATS['n_misses'] += 1
+
+            assert os.path.isfile(file_path), \
+                f'*** {file_path} FILE DOES NOT EXIST ***'
+
+            tic = time.time()
+
+            model = \
+                keras.models.load_model(
+                    file_path,
+                    custom_objects=None,
+                    compile=True,
+                    options=None)
+
+            toc = time.time()
+
+            n_bytes = _model_bytes(model)
+
+            with _LOADED_MODELS_LOCK:
+                _LOADED_MODELS[file_path] = model, n_bytes
+                _LOADED_MODELS_BYTES += n_bytes
+
+                _LOADED_MODELS_STATS['load_time'] += toc - tic
+
+                n_evicted = _evict_lru_models()
+
+        finally:
+            # also after failed loads, so that no lock is left behind per bad path
+            # (unless already replaced by a later thread's)
+            with _LOADED_MODELS_LOCK:
+                if _LOAD_LOCKS.get(file_path) is load_lock:
+                    del _LOAD_LOCKS[file_path]
+
+    if n_evicted:
+        _release_evicted_models()
+
+    return model
+
+
+def prewarm_keras_models(file_paths, n_threads=4, wait=False):
+    """
+    Load Keras models into the registry in background threads
+
+    Return:
+        list of futures, 1 per file path, resolving to the loaded models
+    """
+    executor = ThreadPoolExecutor(max_workers=n_threads)
+
+    futures = [executor.submit(_load_keras_model, file_path)
+               for file_path in file_paths]
+
+    # queued loads still run after a non-waiting shutdown
+    executor.shutdown(wait=wait)
+
+    return futures
+
+
+def loaded_models_stats():
+    """
+    Return the loaded Keras model registry's size & hit / miss / eviction / load-time statistics
+    """
+    with _LOADED_MODELS_LOCK:
+        stats = dict(
+            _LOADED_MODELS_STATS,
+            n_models=len(_LOADED_MODELS),
+            n_bytes=_LOADED_MODELS_BYTES,
+            max_n_models=_MAX_N_LOADED_MODELS,
+            max_bytes=_MAX_LOADED_MODELS_BYTES)
 
-    if file_path not in _LOADED_MODELS:
-        assert os.path.isfile(file_path), \
-            f'*** {file_path} FILE DOES NOT EXIST ***'
+    n_lookups = stats['n_hits'] + stats['n_misses']
 
-        _LOADED_MODELS[file_path] = \
-            keras.models.load_model(
-                file_path,
-                custom_objects=None,
-                compile=True,
-                options=None)
+    stats['hit_rate'] = \
+        stats['n_hits'] / n_lookups \
+        if n_lookups \
+        else None
 
-    return _LOADED_MODELS[file_path]
+    return stats
@@ -1,8 +1,12 @@
+from concurrent.futures import ThreadPoolExecutor
+import errno
+import importlib
 import os
-from pyarrow.hdfs import HadoopFileSystem
 import shutil
 import subprocess
 import sys
+import threading
+import uuid
 
 
 # Hadoop configuration directory
@@ -30,8 +34,34 @@ _HADOOP_CONF_DIR_ENV_VAR_NAME = 'HADOOP_CONF_DIR'
 # check if running on Linux cluster or local Mac
 _ON_LINUX_CLUSTER = sys.platform.startswith('linux')
 
-# detect & set up HDFS client
-if _HADOOP_HOME:
+# HDFS client & availability, probed on first use rather than at import time
+_HDFS_PROBE = None
+
+_HDFS_PROBE_LOCK = threading.Lock()
+
+
+def _probe_hdfs():
+    """
+    Detect & set up HDFS client (once per process; result cached)
+
+    Return:
+        (HDFS client or ``None``, whether HDFS is available)
+    """
+    global _HDFS_PROBE
+
+    if _HDFS_PROBE is None:
+        with _HDFS_PROBE_LOCK:
+            if _HDFS_PROBE is None:
+                _HDFS_PROBE = _connect_hdfs()
+
+    return _HDFS_PROBE
+
+
+def _connect_hdfs():
+    if not _HADOOP_HOME:
+        print('*** HDFS UNAVAILABLE ***')
+        return None, False
+
     os.environ['ARROW_LIBHDFS_DIR'] = \
         os.path.join(
             _HADOOP_HOME,
@@ -39,33 +69,45 @@ if _HADOOP_HOME:
             'native')
 
     try:
-        hdfs_client = HadoopFileSystem()
+        # same file-system API as all operations below (the legacy pyarrow.hdfs module is gone from PyArrow)
+        hdfs_client = _pyarrow_fs().HadoopFileSystem('default', 0)
 
-        try:
-            print('Testing HDFS... ', end='')
+    except:
+        print('*** HDFS UNAVAILABLE ***')
+        return None, False
 
-            if hdfs_client.isdir('/'):
-                _ON_LINUX_CLUSTER_WITH_HDFS = True
-                print('done!')
+    try:
+        print('Testing HDFS... ', end='')
 
-            else:
-                _ON_LINUX_CLUSTER_WITH_HDFS = False
-                print('UNAVAILABLE')
+        if hdfs_client.get_file_info('/').type == _pyarrow_fs().FileType.Directory:
+            print('done!')
+            return hdfs_client, True
 
-        except:
-            hdfs_client = None
-            _ON_LINUX_CLUSTER_WITH_HDFS = False
+        else:
             print('UNAVAILABLE')
+            return hdfs_client, False
 
     except:
-        hdfs_client = None
-        _ON_LINUX_CLUSTER_WITH_HDFS = False
-        print('*** HDFS UNAVAILABLE ***')
+        print('UNAVAILABLE')
+        return None, False
+
+
+def _hdfs_available():
+    return _probe_hdfs()[1]
+
 
-else:
-    hdfs_client = None
-    _ON_LINUX_CLUSTER_WITH_HDFS = False
-    print('*** HDFS UNAVAILABLE ***')
+_LAZY_ATTRS = {
+    'hdfs_client': lambda: _probe_hdfs()[0],
+    '_ON_LINUX_CLUSTER_WITH_HDFS': _hdfs_available
+}
+
+
+def __getattr__(name):
+    # PEP 562: "hdfs_client" & "_ON_LINUX_CLUSTER_WITH_HDFS" trigger the HDFS probe only when accessed
+    if name in _LAZY_ATTRS:
+        return _LAZY_ATTRS[name]()
+
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
 
 
 def _exec(cmd, must_succeed=False):
@@ -89,137 +131,472 @@ def command_prefix(hdfs=True, hadoop_home='/opt/hadoop'):
         else ''
 
 
+# in-process Arrow file systems (no "hdfs dfs" JVM start-up per call), created on first use
+_LOCAL_ARROW_FS = None
+
+_HDFS_ARROW_FS = None
+
+_N_THREADS = 16
+
+
+def _pyarrow_fs():
+    # deferred: importing PyArrow costs more than the rest of this module combined
+    return importlib.import_module('pyarrow.fs')
+
+
+def _arrow_fs(hdfs=True):
+    """
+    Return the Arrow file system to operate on:
+    HDFS if requested & available, else the local file system
+    """
+    global _HDFS_ARROW_FS, _LOCAL_ARROW_FS
+
+    if hdfs and _hdfs_available():
+        if _HDFS_ARROW_FS is None:
+            # reuse the connection made by the probe
+            _HDFS_ARROW_FS = _probe_hdfs()[0]
+
+        return _HDFS_ARROW_FS
+
+    else:
+        if _LOCAL_ARROW_FS is None:
+            _LOCAL_ARROW_FS = _pyarrow_fs().LocalFileSystem()
+
+        return _LOCAL_ARROW_FS
+
+
+def _arrow_path(path, hdfs=True):
+    return path \
+        if hdfs and _hdfs_available() \
+        else os.path.abspath(path)
+
+
+def _file_type(path, hdfs=True):
+    return _arrow_fs(hdfs=hdfs).get_file_info(_arrow_path(path, hdfs=hdfs)).type
+
+
+def _batch(func, arg_tuples, callback=None):
+    # run func over many argument tuples in parallel, re-raising the 1st error
+    arg_tuples = list(arg_tuples)
+
+    def run(args):
+        result = func(*args)
+
+        if callback:
+            callback(*args)
+
+        return result
+
+    with ThreadPoolExecutor(max_workers=_N_THREADS) as executor:
+        return list(executor.map(run, arg_tuples))
+
+
 def exist(path, hdfs=False, dir=False):
-    return (hdfs_client.isdir(path=path)
-             if dir
-             else hdfs_client.isfile(path=path)) \
-        if hdfs and _ON_LINUX_CLUSTER_WITH_HDFS \
-        else (os.path.isdir(path)
-              if dir
-              else (os.path.isfile(path) or os.path.islink(path)))
+    return _file_type(path, hdfs=hdfs) == \
+        (_pyarrow_fs().FileType.Directory
+         if dir
+         else _pyarrow_fs().FileType.File)
 
 
 def mkdir(dir, hdfs=True, hadoop_home='/opt/hadoop'):
-    cmd_pref = command_prefix(hdfs=hdfs, hadoop_home=hadoop_home)
+    hdfs = hdfs and _hdfs_available()
+
+    _chmod = _ON_LINUX_CLUSTER and (not hdfs) and (not os.path.isdir(dir))
 
-    cmd = '{}mkdir -p "{}"{}'.format(
-        cmd_pref,
-        dir,
-        ' -m 0777'
-            if _ON_LINUX_CLUSTER and (not hdfs)
-            else '')
+    _arrow_fs(hdfs=hdfs).create_dir(_arrow_path(dir, hdfs=hdfs), recursive=True)
 
-    _ = os.system(cmd)
-    assert _ <= 0, 'FAILED: {} (EXIT CODE: {})'.format(cmd, _)
+    if _chmod:
+        os.chmod(dir, 0o777)
 
 
 def rm(path, hdfs=True, is_dir=True, hadoop_home='/opt/hadoop'):
-    if not _ON_LINUX_CLUSTER_WITH_HDFS:
-        hdfs = False
+    hdfs = hdfs and _hdfs_available()
 
-    if hdfs:
-        os.system('{}rm{} -skipTrash "{}"'.format(
-            command_prefix(hdfs=True, hadoop_home=hadoop_home),
-            ' -r' if is_dir else '',
-            path))
+    arrow_fs = _arrow_fs(hdfs=hdfs)
+    arrow_path = _arrow_path(path, hdfs=hdfs)
 
-    elif is_dir and os.path.isdir(path):
-        try:
-            shutil.rmtree(
-                path=path,
-                ignore_errors=False)
+    file_type = arrow_fs.get_file_info(arrow_path).type
 
-        except:
-            os.system('rm -f "{}"'.format(path))
+    if file_type == _pyarrow_fs().FileType.Directory:
+        if is_dir:
+            arrow_fs.delete_dir(arrow_path)
 
-        assert not os.path.isdir(path), \
-            '*** CANNOT REMOVE LOCAL DIR "{}" ***'.format(path)
+            assert not exist(path=path, hdfs=hdfs, dir=True), \
+                '*** CANNOT REMOVE {} DIR "{}" ***'.format('HDFS' if hdfs else 'LOCAL', path)
 
-    elif os.path.isfile(path) or os.path.islink(path):
-        os.remove(path)
+    elif file_type == _pyarrow_fs().FileType.File:
+        arrow_fs.delete_file(arrow_path)
 
-        assert not (os.path.isfile(path) or os.path.islink(path)), \
-            '*** CANNOT REMOVE LOCAL FILE/SYMLINK "{}" ***'.format(path)
+    elif (not hdfs) and os.path.islink(path):   # e.g. broken symlink
+        os.remove(path)
 
 
 def empty(dir, hdfs=True, hadoop_home='/opt/hadoop'):
     if exist(path=dir, hdfs=hdfs, dir=True):
-        rm(path=dir, hdfs=hdfs, is_dir=True, hadoop_home=hadoop_home)
-    mkdir(dir=dir, hdfs=hdfs, hadoop_home=hadoop_home)
+        hdfs = hdfs and _hdfs_available()
+        _arrow_fs(hdfs=hdfs).delete_dir_contents(_arrow_path(dir, hdfs=hdfs))
+
+    else:
+        mkdir(dir=dir, hdfs=hdfs, hadoop_home=hadoop_home)
+
+
+def _is_s3_path(path):
+    return path.startswith(('s3://', 's3a://', 's3n://'))
+
+
+def _strip_uri(path):
+    # "hdfs://host:port/a/b" -> "/a/b"
+    return '/' + path.split('://', 1)[1].split('/', 1)[-1] \
+        if '://' in path \
+        else path
+
+
+def touch(path, hdfs=True):
+    """
+    Create or truncate an empty file, updating its modification time
+    """
+    hdfs = hdfs and _hdfs_available()
+
+    with _arrow_fs(hdfs=hdfs).open_output_stream(_arrow_path(path, hdfs=hdfs)):
+        pass
+
+
+def dir_usage(dir, hdfs=True):
+    """
+    Return:
+        dict mapping each sub-directory name to (total size in bytes, latest modification timestamp in seconds)
+        over all files (recursively) under it
+    """
+    hdfs = hdfs and _hdfs_available()
+
+    if not exist(path=dir, hdfs=hdfs, dir=True):
+        return {}
+
+    pyarrow_fs = _pyarrow_fs()
+    arrow_dir = _arrow_path(dir, hdfs=hdfs).rstrip('/')
+    prefix = _strip_uri(arrow_dir) + '/'
+
+    usage = {}
+
+    # 1 recursive listing rather than 1 per sub-directory
+    for file_info in _arrow_fs(hdfs=hdfs).get_file_info(pyarrow_fs.FileSelector(arrow_dir, recursive=True)):
+        sub_dir_name, sep, _ = _strip_uri(file_info.path)[len(prefix):].partition('/')
+
+        if sep and (file_info.type == pyarrow_fs.FileType.File):
+            n_bytes, mtime = usage.get(sub_dir_name, (0, 0.))
+
+            usage[sub_dir_name] = \
+                n_bytes + file_info.size, \
+                max(mtime, file_info.mtime_ns / 1e9)
+
+    return usage
+
+
+def file_versions(paths):
+    """
+    Return:
+        list of (size in bytes, modification timestamp in nanoseconds) of local / HDFS files
+        (e.g. as listed by ``Spark DataFrame.inputFiles()``),
+        or ``None`` if any file's version cannot be determined (e.g. S3 or missing files)
+    """
+    local_paths = []
+    hdfs_paths = []
+
+    for path in paths:
+        if path.startswith('file:'):
+            local_paths.append(_strip_uri(path) if '://' in path else path[len('file:'):])
+
+        elif path.startswith('hdfs:') and _hdfs_available():
+            hdfs_paths.append(_strip_uri(path))
+
+        elif '://' not in path:
+            (hdfs_paths if _hdfs_available() else local_paths).append(path)
+
+        else:
+            return None
+
+    file_infos = \
+        (_arrow_fs(hdfs=False).get_file_info([os.path.abspath(path) for path in local_paths])
+         if local_paths
+         else []) + \
+        (_arrow_fs(hdfs=True).get_file_info(hdfs_paths)
+         if hdfs_paths
+         else [])
+
+    pyarrow_fs = _pyarrow_fs()
+
+    if any(file_info.type != pyarrow_fs.FileType.File for file_info in file_infos):
+        return None
+
+    return [(file_info.size, file_info.mtime_ns) for file_info in file_infos]
 
 
-def cp(from_path, to_path, hdfs=True, is_dir=True, hadoop_home='/opt/hadoop'):
-    rm(path=to_path, hdfs=hdfs, is_dir=is_dir, hadoop_home=hadoop_home)
+def _tmp_sibling_path(path):
+    return '{}.{}.tmp'.format(path.rstrip('/'), uuid.uuid4().hex)
 
-    par_dir_path = os.path.dirname(to_path)
+
+def _copy_file(from_path, to_path, from_hdfs=False, to_hdfs=False, hardlink=False):
+    # overwrites any existing destination file, without deleting it first
+    from_hdfs = from_hdfs and _hdfs_available()
+    to_hdfs = to_hdfs and _hdfs_available()
+
+    if not (from_hdfs or to_hdfs):
+        tmp_path = _tmp_sibling_path(to_path)
+
+        try:
+            if hardlink:
+                os.link(from_path, tmp_path)
+            else:
+                shutil.copy2(from_path, tmp_path)
+
+        except OSError:   # e.g. hard-linking across devices
+            if not hardlink:
+                raise
+
+            shutil.copy2(from_path, tmp_path)
+
+        # atomically replaces the destination file
+        os.replace(tmp_path, to_path)
+
+    else:
+        _pyarrow_fs().copy_files(
+            source=_arrow_path(from_path, hdfs=from_hdfs),
+            destination=_arrow_path(to_path, hdfs=to_hdfs),
+            source_filesystem=_arrow_fs(hdfs=from_hdfs),
+            destination_filesystem=_arrow_fs(hdfs=to_hdfs),
+            use_threads=False)
+
+
+def copy_tree(from_path, to_path, from_hdfs=False, to_hdfs=False, hardlink=False, callback=None):
+    """
+    Copy directory tree ``from_path`` to ``to_path`` with files copied in parallel threads,
+    overwriting existing files in place & then removing destination files not in the source,
+    so that the destination ends up mirroring the source without being deleted up-front
+
+    ``hardlink=True`` hard-links rather than copies local files where possible;
+    ``callback(n_copied_bytes, n_total_bytes)`` is called after each copied file.
+    """
+    from_hdfs = from_hdfs and _hdfs_available()
+    to_hdfs = to_hdfs and _hdfs_available()
+
+    from_arrow_fs = _arrow_fs(hdfs=from_hdfs)
+    from_arrow_path = _arrow_path(from_path, hdfs=from_hdfs).rstrip('/')
+
+    to_arrow_fs = _arrow_fs(hdfs=to_hdfs)
+    to_arrow_path = _arrow_path(to_path, hdfs=to_hdfs).rstrip('/')
+
+    def rel_paths_and_sizes(arrow_fs, arrow_path):
+        file_infos = \
+            arrow_fs.get_file_info(
+                _pyarrow_fs().FileSelector(arrow_path, allow_not_found=True, recursive=True))
+
+        return {_strip_uri(file_info.path)[(len(_strip_uri(arrow_path)) + 1):]: (file_info.type, file_info.size)
+                for file_info in file_infos}
+
+    if from_arrow_fs.get_file_info(from_arrow_path).type != _pyarrow_fs().FileType.Directory:
+        raise FileNotFoundError('*** "{}" IS NOT A DIRECTORY ***'.format(from_path))
+
+    from_items = rel_paths_and_sizes(from_arrow_fs, from_arrow_path)
+
+    to_type = to_arrow_fs.get_file_info(to_arrow_path).type
+
+    if to_type == _pyarrow_fs().FileType.File:
+        to_arrow_fs.delete_file(to_arrow_path)
+
+    to_items = \
+        rel_paths_and_sizes(to_arrow_fs, to_arrow_path) \
+        if to_type == _pyarrow_fs().FileType.Directory \
+        else {}
+
+    to_arrow_fs.create_dir(to_arrow_path, recursive=True)
+
+    for rel_path, (file_type, _) in from_items.items():
+        if file_type == _pyarrow_fs().FileType.Directory:
+            to_arrow_fs.create_dir('{}/{}'.format(to_arrow_path, rel_path), recursive=True)
+
+    rel_file_paths = \
+        [rel_path
+         for rel_path, (file_type, _) in from_items.items()
+         if file_type == _pyarrow_fs().FileType.File]
+
+    n_total_bytes = sum(from_items[rel_path][1] for rel_path in rel_file_paths)
+    n_copied_bytes = [0]
+    lock = threading.Lock()
+
+    def copy(rel_path):
+        _copy_file(
+            from_path='{}/{}'.format(from_arrow_path, rel_path),
+            to_path='{}/{}'.format(to_arrow_path, rel_path),
+            from_hdfs=from_hdfs, to_hdfs=to_hdfs,
+            hardlink=hardlink)
+
+        if callback:
+            with lock:
+                n_copied_bytes[0] += from_items[rel_path][1]
+                callback(n_copied_bytes[0], n_total_bytes)
+
+    with ThreadPoolExecutor(max_workers=_N_THREADS) as executor:
+        for _ in executor.map(copy, rel_file_paths):
+            pass
+
+    # remove extraneous destination files & dirs, deepest first
+    for rel_path in sorted(set(to_items).difference(from_items), key=len, reverse=True):
+        path = '{}/{}'.format(to_arrow_path, rel_path)
+
+        if to_items[rel_path][0] == _pyarrow_fs().FileType.Directory:
+            to_arrow_fs.delete_dir(path)
+
+        elif to_arrow_fs.get_file_info(path).type == _pyarrow_fs().FileType.File:
+            to_arrow_fs.delete_file(path)
+
+
+def _cp(from_path, to_path, from_hdfs, to_hdfs, is_dir, hardlink=False, callback=None):
+    par_dir_path = os.path.dirname(to_path.rstrip('/'))
     if par_dir_path:
-        mkdir(dir=par_dir_path, hdfs=hdfs, hadoop_home=hadoop_home)
+        mkdir(dir=par_dir_path, hdfs=to_hdfs)
+
+    if is_dir:
+        copy_tree(
+            from_path=from_path, to_path=to_path,
+            from_hdfs=from_hdfs, to_hdfs=to_hdfs,
+            hardlink=hardlink, callback=callback)
+
+    else:
+        _copy_file(
+            from_path=from_path, to_path=to_path,
+            from_hdfs=from_hdfs, to_hdfs=to_hdfs,
+            hardlink=hardlink)
+
+
+def cp(from_path, to_path, hdfs=True, is_dir=True, hadoop_home='/opt/hadoop',
+       hardlink=False, callback=None):
+    if _is_s3_path(from_path) and _is_s3_path(to_path):   # server-side S3 copy
+        from .aws import s3
+        s3.cp(from_path=from_path, to_path=to_path, is_dir=is_dir, quiet=True, verbose=False)
 
+    else:
+        _cp(from_path=from_path, to_path=to_path,
+            from_hdfs=hdfs, to_hdfs=hdfs,
+            is_dir=is_dir, hardlink=hardlink, callback=callback)
+
+
+def _rename_over(from_path, to_path, hdfs):
+    """
+    Rename within 1 file system, replacing any existing destination of the same kind as the source:
+    files are replaced directly (atomically on local disk);
+    an existing destination dir is renamed aside & deleted only after the source has been renamed in;
+    a file moved onto an existing dir is moved into that dir (as by ``mv``);
+    a dir cannot replace an existing file
+    """
     if hdfs:
-        os.system('{}cp "{}" "{}"'.format(
-            command_prefix(hdfs=True, hadoop_home=hadoop_home),
-            from_path, to_path))
+        arrow_fs = _arrow_fs(hdfs=True)
+        FileType = _pyarrow_fs().FileType
+
+        from_is_dir = arrow_fs.get_file_info(from_path).type == FileType.Directory
+        to_type = arrow_fs.get_file_info(to_path).type
+
+        if to_type == FileType.NotFound:
+            arrow_fs.move(from_path, to_path)
+            return
+
+        to_is_dir = to_type == FileType.Directory
+
+    else:
+        from_is_dir = os.path.isdir(from_path) and not os.path.islink(from_path)
+
+        if not os.path.lexists(to_path):
+            os.rename(from_path, to_path)
+            return
+
+        to_is_dir = os.path.isdir(to_path) and not os.path.islink(to_path)
+
+    if to_is_dir and not from_is_dir:
+        _rename_over(
+            from_path=from_path,
+            to_path=os.path.join(to_path, os.path.basename(from_path.rstrip('/'))),
+            hdfs=hdfs)
+
+    elif from_is_dir and not to_is_dir:
+        raise NotADirectoryError(
+            errno.ENOTDIR,
+            '*** CANNOT REPLACE FILE WITH DIR {} ***'.format(from_path),
+            to_path)
 
-    elif is_dir:
-        shutil.copytree(
-            src=from_path,
-            dst=to_path,
-            symlinks=False,
-            ignore=None)
+    elif hdfs:
+        tmp_path = _tmp_sibling_path(to_path)
+        arrow_fs.move(to_path, tmp_path)
+        arrow_fs.move(from_path, to_path)
+
+        if to_is_dir:
+            arrow_fs.delete_dir(tmp_path)
+        else:
+            arrow_fs.delete_file(tmp_path)
+
+    elif to_is_dir:
+        tmp_path = _tmp_sibling_path(to_path)
+        os.rename(to_path, tmp_path)
+
+        try:
+            os.rename(from_path, to_path)
+
+        except OSError:
+            os.rename(tmp_path, to_path)
+            raise
+
+        shutil.rmtree(tmp_path, ignore_errors=True)
 
     else:
-        shutil.copyfile(
-            src=from_path,
-            dst=to_path)
+        os.replace(from_path, to_path)
 
 
 def mv(from_path, to_path, hdfs=True, is_dir=True, hadoop_home='/opt/hadoop'):
-    rm(path=to_path, hdfs=hdfs, is_dir=is_dir, hadoop_home=hadoop_home)
+    if _is_s3_path(from_path) and _is_s3_path(to_path):   # server-side S3 copy, then delete
+        from .aws import s3
+        s3.mv(from_path=from_path, to_path=to_path, is_dir=is_dir, quiet=True, verbose=False)
+        return
+
+    hdfs = hdfs and _hdfs_available()
 
-    par_dir_path = os.path.dirname(to_path)
+    par_dir_path = os.path.dirname(to_path.rstrip('/'))
     if par_dir_path:
         mkdir(dir=par_dir_path, hdfs=hdfs, hadoop_home=hadoop_home)
 
-    if hdfs:
-        os.system('{}mv "{}" "{}"'.format(
-            command_prefix(hdfs=hdfs, hadoop_home=hadoop_home),
-            from_path, to_path))
+    try:   # metadata-only rename
+        _rename_over(from_path=from_path, to_path=to_path, hdfs=hdfs)
 
-    else:
-        try:
-            shutil.move(
-                src=from_path,
-                dst=to_path)
+    except OSError as err:
+        if hdfs or (err.errno != errno.EXDEV):
+            raise
+
+        # local rename across devices: copy, then delete source
+        if os.path.isdir(to_path) and not os.path.isdir(from_path):
+            to_path = os.path.join(to_path, os.path.basename(from_path.rstrip('/')))
+
+        _cp(from_path=from_path, to_path=to_path,
+            from_hdfs=False, to_hdfs=False, is_dir=is_dir)
 
-        except:
-            os.system('mv "{}" "{}"'.format(
-                from_path, to_path))
+        rm(path=from_path, hdfs=False, is_dir=is_dir)
 
 
 def get(from_hdfs, to_local,
         is_dir=False, overwrite=True, _mv=False,
         hadoop_home='/opt/hadoop',
         must_succeed=False,
-        _on_linux_cluster_with_hdfs=_ON_LINUX_CLUSTER_WITH_HDFS):
-    if _on_linux_cluster_with_hdfs:
-        if overwrite:
-            rm(path=to_local,
-               hdfs=False,
-               is_dir=is_dir)
-
+        _on_linux_cluster_with_hdfs=None):
+    if _hdfs_available() \
+            if _on_linux_cluster_with_hdfs is None \
+            else _on_linux_cluster_with_hdfs:
         if overwrite or \
                 (is_dir and (not os.path.isdir(to_local))) or \
                 ((not is_dir) and (not os.path.isfile(to_local))):
-            par_dir_path = os.path.dirname(to_local)
-            if par_dir_path:
-                mkdir(
-                    dir=par_dir_path,
-                    hdfs=False)
+            try:
+                _cp(from_path=from_hdfs, to_path=to_local,
+                    from_hdfs=True, to_hdfs=False,
+                    is_dir=is_dir)
 
-            cmd = '{0} dfs -get "{1}" "{2}"'.format(
-                    _hdfs_cmd(hadoop_home=hadoop_home),
-                    from_hdfs, to_local)
-            _exec(cmd)
+            except (IOError, OSError):
+                if must_succeed:
+                    raise
 
             if _mv:
                 rm(path=from_hdfs,
@@ -249,23 +626,10 @@ def get(from_hdfs, to_local,
 
 def put(from_local, to_hdfs,
         is_dir=True, _mv=True, hadoop_home='/opt/hadoop'):
-    if _ON_LINUX_CLUSTER_WITH_HDFS:
-        rm(path=to_hdfs,
-           hdfs=True,
-           is_dir=is_dir,
-           hadoop_home=hadoop_home)
-
-        par_dir_path = os.path.dirname(to_hdfs)
-        if par_dir_path:
-            mkdir(
-                dir=par_dir_path,
-                hdfs=True,
-                hadoop_home=hadoop_home)
-
-        os.system(
-            '{0} dfs -put "{1}" "{2}"'.format(
-                _hdfs_cmd(hadoop_home=hadoop_home),
-                from_local, to_hdfs))
+    if _hdfs_available():
+        _cp(from_path=from_local, to_path=to_hdfs,
+            from_hdfs=False, to_hdfs=True,
+            is_dir=is_dir)
 
         if _mv:
             rm(path=from_local,
@@ -284,3 +648,52 @@ def put(from_local, to_hdfs,
                to_path=to_hdfs,
                hdfs=False,
                is_dir=is_dir)
+
+
+# BATCHED MULTI-PATH VARIANTS
+# (run over many paths in parallel threads; callback(*args) is called after each path)
+
+def batch_mkdir(dirs, hdfs=True, callback=None):
+    return _batch(
+        lambda dir: mkdir(dir=dir, hdfs=hdfs),
+        ((dir,) for dir in dirs),
+        callback=callback)
+
+
+def batch_rm(paths, hdfs=True, is_dir=True, callback=None):
+    return _batch(
+        lambda path: rm(path=path, hdfs=hdfs, is_dir=is_dir),
+        ((path,) for path in paths),
+        callback=callback)
+
+
+def batch_cp(from_and_to_paths, hdfs=True, is_dir=True, callback=None):
+    return _batch(
+        lambda from_path, to_path: cp(from_path=from_path, to_path=to_path, hdfs=hdfs, is_dir=is_dir),
+        from_and_to_paths,
+        callback=callback)
+
+
+def batch_mv(from_and_to_paths, hdfs=True, is_dir=True, callback=None):
+    return _batch(
+        lambda from_path, to_path: mv(from_path=from_path, to_path=to_path, hdfs=hdfs, is_dir=is_dir),
+        from_and_to_paths,
+        callback=callback)
+
+
+def batch_get(from_hdfs_and_to_local_paths, is_dir=False, overwrite=True, _mv=False, must_succeed=False,
+              callback=None):
+    return _batch(
+        lambda from_hdfs, to_local:
+            get(from_hdfs=from_hdfs, to_local=to_local,
+                is_dir=is_dir, overwrite=overwrite, _mv=_mv, must_succeed=must_succeed),
+        from_hdfs_and_to_local_paths,
+        callback=callback)
+
+
+def batch_put(from_local_and_to_hdfs_paths, is_dir=True, _mv=True, callback=None):
+    return _batch(
+        lambda from_local, to_hdfs:
+            put(from_local=from_local, to_hdfs=to_hdfs, is_dir=is_dir, _mv=_mv),
+        from_local_and_to_hdfs_paths,
+        callback=callback)
@@ -0,0 +1,213 @@
+from argparse import Namespace as _Namespace
+import hashlib
+import inspect
+import pickle
+import struct
+import sys
+
+
+DIGEST_SIZE = 16   # bytes, i.e. 32 hex chars
+
+_INT_STRUCT = struct.Struct('<q')
+
+
+def new_hasher():
+    """
+    Return a fresh incremental BLAKE2b hasher
+
+    Always the same algorithm regardless of installed optional packages,
+    so that all machines sharing an S3 cache compute the same keys & blob addresses
+    """
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def _update_with_tag(h, tag, data=b''):
+    h.update(tag)
+    h.update(_INT_STRUCT.pack(len(data)))
+    h.update(data)
+
+
+def update_hash(h, obj):
+    """
+    Feed ``obj`` into hasher ``h`` in a stable, type-aware way
+
+    NumPy arrays, Pandas objects, Arrow tables & ``Namespace`` objects are hashed
+    from their content buffers rather than via pickling; containers are hashed recursively
+    (dicts & sets independently of ordering); other objects are pickled,
+    & ``TypeError`` is raised for unpicklable ones.
+    """
+    if obj is None:
+        _update_with_tag(h, b'N')
+
+    elif isinstance(obj, bool):
+        _update_with_tag(h, b'b', b'1' if obj else b'0')
+
+    elif isinstance(obj, int):
+        _update_with_tag(h, b'i', str(obj).encode('ascii'))
+
+    elif isinstance(obj, float):
+        _update_with_tag(h, b'f', repr(obj).encode('ascii'))
+
+    elif isinstance(obj, str):
+        _update_with_tag(h, b's', obj.encode('utf-8'))
+
+    elif isinstance(obj, (bytes, bytearray, memoryview)):
+        _update_with_tag(h, b'B', bytes(obj))
+
+    elif isinstance(obj, (list, tuple)):
+        _update_with_tag(h, b'l' if isinstance(obj, list) else b't', _INT_STRUCT.pack(len(obj)))
+        for item in obj:
+            update_hash(h, item)
+
+    elif isinstance(obj, dict):
+        _update_with_tag(h, b'd', _INT_STRUCT.pack(len(obj)))
+        for k_digest, v in sorted(((hash_obj(k), v) for k, v in obj.items()), key=lambda kv: kv[0]):
+            _update_with_tag(h, b'k', k_digest.encode('ascii'))
+            update_hash(h, v)
+
+    elif isinstance(obj, (set, frozenset)):
+        _update_with_tag(h, b'S', _INT_STRUCT.pack(len(obj)))
+        for item_digest in sorted(hash_obj(item) for item in obj):
+            _update_with_tag(h, b'k', item_digest.encode('ascii'))
+
+    elif isinstance(obj, _Namespace):
+        _update_with_tag(h, b'n', type(obj).__name__.encode('utf-8'))
+        update_hash(h, {k: v for k, v in obj.__dict__.items() if k != '__metadata__'})
+
+    elif _update_hash_with_data_obj(h, obj):
+        pass
+
+    else:
+        try:
+            data = pickle.dumps(obj, protocol=4)
+
+        except Exception as err:
+            # reprs (e.g. of distributed data frames) may not identify content,
+            # so hashing them could give stale hits: require explicit keys instead
+            raise TypeError(
+                '*** CANNOT HASH UNPICKLABLE {} OBJECT: PROVIDE AN EXPLICIT CACHE KEY ***'.format(
+                    type(obj).__name__)) from err
+
+        _update_with_tag(h, b'p', data)
+
+
+def _update_hash_with_data_obj(h, obj):
+    # only look at libraries that are already imported,
+    # so that hashing never triggers a heavy import
+    numpy = sys.modules.get('numpy')
+
+    if (numpy is not None) and isinstance(obj, numpy.ndarray):
+        if obj.dtype.hasobject:
+            _update_with_tag(h, b'A', obj.dtype.str.encode('ascii'))
+            update_hash(h, obj.tolist())
+
+        else:
+            _update_with_tag(h, b'a', '{}{}'.format(obj.dtype.str, obj.shape).encode('ascii'))
+            # byte view, since buffers of e.g. datetime64 / timedelta64 arrays cannot be cast by memoryview
+            h.update(memoryview(numpy.ascontiguousarray(obj).reshape(-1).view(numpy.uint8)))
+
+        return True
+
+    pandas = sys.modules.get('pandas')
+
+    if (pandas is not None) and isinstance(obj, (pandas.DataFrame, pandas.Series, pandas.Index)):
+        if isinstance(obj, pandas.DataFrame):
+            _update_with_tag(h, b'D')
+            update_hash(h, [str(col) for col in obj.columns])
+            update_hash(h, [str(dtype) for dtype in obj.dtypes])
+
+        else:
+            _update_with_tag(h, b'Z', str(obj.dtype).encode('utf-8'))
+            update_hash(h, str(obj.name))
+
+        h.update(
+            memoryview(
+                pandas.util.hash_pandas_object(obj, index=not isinstance(obj, pandas.Index))
+                .values)
+            .cast('B'))
+
+        return True
+
+    pyarrow = sys.modules.get('pyarrow')
+
+    if (pyarrow is not None) and isinstance(obj, (pyarrow.Table, pyarrow.RecordBatch)):
+        _update_with_tag(h, b'T', obj.schema.to_string().encode('utf-8'))
+        h.update(_INT_STRUCT.pack(obj.num_rows))
+
+        for column in obj.columns:
+            for chunk in (column.chunks if isinstance(column, pyarrow.ChunkedArray) else [column]):
+                # slices share their parents' buffers, so their positions within them must be hashed too
+                h.update(_INT_STRUCT.pack(chunk.offset))
+                h.update(_INT_STRUCT.pack(len(chunk)))
+
+                for buffer in chunk.buffers():
+                    if buffer is None:
+                        _update_with_tag(h, b'0')
+                    else:
+                        _update_with_tag(h, b'1', buffer.to_pybytes())
+
+        return True
+
+    return False
+
+
+def hash_obj(obj):
+    h = new_hasher()
+    update_hash(h, obj)
+    return h.hexdigest()
+
+
+def hash_args(*args, **kwargs):
+    h = new_hasher()
+    update_hash(h, args)
+    update_hash(h, kwargs)
+    return h.hexdigest()
+
+
+def hash_file(file_path, chunk_size=8 * 2 ** 20):
+    h = new_hasher()
+
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def _update_hash_with_code(h, code):
+    h.update(code.co_code)
+
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            _update_hash_with_code(h, const)
+        else:
+            update_hash(h, repr(const))
+
+    update_hash(h, code.co_names)
+
+
+def func_fingerprint(func):
+    """
+    Hash a function's identity & implementation (source code if available, else bytecode),
+    so that cached results are invalidated when the function's code changes
+    """
+    func = inspect.unwrap(func)
+
+    h = new_hasher()
+
+    update_hash(
+        h,
+        '{}.{}'.format(
+            getattr(func, '__module__', None),
+            getattr(func, '__qualname__', getattr(func, '__name__', None))))
+
+    try:
+        update_hash(h, inspect.getsource(func))
+
+    except (OSError, TypeError):
+        code = getattr(func, '__code__', None)
+
+        if code is not None:
+            _update_hash_with_code(h, code)
+
+    return h.hexdigest()
@@ -1,41 +1,99 @@
-import collections
-from functools import reduce
-import numpy
-import tensorflow
+from collections.abc import Iterable
+import sys
+
+
+def _is_ndarray(x):
+    # only check against NumPy / TensorFlow types if those libraries are already imported,
+    # so that importing this module never triggers their (slow) imports
+    numpy = sys.modules.get('numpy')
+    return (numpy is not None) and isinstance(x, numpy.ndarray)
+
+
+def _is_tf_tensor(x):
+    tensorflow = sys.modules.get('tensorflow')
+    return (tensorflow is not None) and isinstance(x, getattr(tensorflow, 'Tensor', ()))
+
+
+def _is_nested(x):
+    return isinstance(x, Iterable) and (not isinstance(x, str))
+
+
+# types that are always leaves, checked first to keep the per-leaf cost minimal
+_SCALAR_TYPES = frozenset((bool, int, float, complex, str, dict, type(None)))
+
+
+def _flat_leaves(x):
+    # NumPy arrays & vectors (e.g. Spark ML vectors) flatten in 1 shot; None means "recurse into x"
+    if _is_ndarray(x):
+        return x.ravel().tolist()
+
+    elif 'Vector' in type(x).__name__:
+        return x.toArray().tolist()
+
+
+def iflatten(iterable):
+    """
+    Lazily yield the leaves of an arbitrarily nested iterable, depth-first & in order,
+    iteratively (no recursion limit) & in time linear in the number of leaves
+    """
+    leaves = _flat_leaves(iterable)
+
+    if leaves is not None:
+        yield from leaves
+        return
+
+    if (not isinstance(iterable, Iterable)) or isinstance(iterable, (dict, str)):
+        yield iterable
+        return
+
+    stack = [iter(iterable)]
+
+    while stack:
+        for item in stack[-1]:
+            if type(item) in _SCALAR_TYPES:
+                yield item
+                continue
+
+            leaves = _flat_leaves(item)
+
+            if leaves is not None:
+                yield from leaves
+
+            elif isinstance(item, Iterable) and not isinstance(item, (dict, str)):
+                stack.append(iter(item))
+                break
+
+            else:
+                yield item
+
+        else:
+            stack.pop()
 
 
 def flatten(iterable):
-    return iterable.flatten().tolist() \
-        if isinstance(iterable, numpy.ndarray) \
-        else (iterable.toArray().tolist()
-              if 'Vector' in str(type(iterable))
-              else (reduce(lambda left, right: left + flatten(right), iterable, [])
-                    if isinstance(iterable, collections.Iterable) and not isinstance(iterable, (dict, str))
-                    else [iterable]))
+    return list(iflatten(iterable))
 
 
 def nested_filter(func, iterable):
     return [(nested_filter(func, i)
-             if isinstance(i, collections.Iterable) and not isinstance(i, str)
+             if _is_nested(i)
              else i)
             for i in iterable
-            if (isinstance(i, collections.Iterable) and (not isinstance(i, str))) or func(i)]
+            if _is_nested(i) or func(i)]
 
 
 def nested_map(func, iterable):
-    ls = list(iterable)
-    for i, item in enumerate(iterable):
-        ls[i] = \
-            nested_map(func, item) \
-                if isinstance(item, collections.Iterable) and not isinstance(item, str) \
-                else func(item)
-    return ls
+    # 1 pass & 1 result list per level, without first copying each level's items
+    return [nested_map(func, item)
+            if _is_nested(item)
+            else func(item)
+            for item in iterable]
 
 
 def to_iterable(x, iterable_type=tuple):
     if isinstance(x, iterable_type):
         return x
-    elif isinstance(x, collections.Iterable) and (not isinstance(x, (str, tensorflow.Tensor))):
+    elif isinstance(x, Iterable) and (not isinstance(x, str)) and (not _is_tf_tensor(x)):
         return iterable_type(x)
     elif iterable_type is tuple:
         return x,
@@ -43,5 +101,5 @@ def to_iterable(x, iterable_type=tuple):
         return [x]
     elif iterable_type is set:
         return {x}
-    elif iterable_type is numpy.ndarray:
-        return numpy.array((x,))
+    elif iterable_type is getattr(sys.modules.get('numpy'), 'ndarray', None):
+        return sys.modules['numpy'].array((x,))
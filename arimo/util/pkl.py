@@ -1,5 +1,8 @@
 from __future__ import print_function
 
+import mmap
+import os
+import struct
 import sys
 
 import six
@@ -8,6 +11,16 @@ if six.PY2:
 else:
     import pickle
 
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 COMPAT_PROTOCOL = 2
 COMPAT_COMPRESS = 'bz2'   # smaller file size than ZLib/GZip
@@ -19,6 +32,20 @@ PKL_EXT = '.pkl'
 PKL_W_PY_VER = PKL_EXT + str(sys.version_info.major)
 
 
+# Protocol 5 (PEP 574) lets large contiguous buffers (e.g. NumPy arrays)
+# be written out-of-band instead of being copied into the pickle stream
+OOB_PROTOCOL = 5
+OOB_PROTOCOL_AVAILABLE = pickle.HIGHEST_PROTOCOL >= OOB_PROTOCOL
+
+FAST_COMPRESSORS = 'lz4', 'zstd'
+
+OOB_MAGIC = b'ARIMOPK5'
+_OOB_HEADER_STRUCT = struct.Struct('<8s4sI')   # magic, compressor tag, n buffers
+_OOB_LEN_STRUCT = struct.Struct('<Q')
+
+_NO_COMPRESS_TAG = b'none'
+
+
 def pickle_able(obj):
     try:
         s = pickle.dumps(obj)
@@ -28,3 +55,119 @@ def pickle_able(obj):
     except Exception as err:
         print(err)
         return False
+
+
+def _compressor_tag(compress):
+    if compress is None:
+        return _NO_COMPRESS_TAG
+
+    assert compress in FAST_COMPRESSORS, \
+        '*** compress must be one of {} or None ***'.format(FAST_COMPRESSORS)
+
+    if compress == 'lz4':
+        assert lz4_frame is not None, \
+            '*** LZ4 compression requires the "lz4" package ***'
+
+    else:
+        assert zstandard is not None, \
+            '*** ZStd compression requires the "zstandard" package ***'
+
+    return compress.encode('ascii').ljust(4, b' ')
+
+
+def _compress(data, tag, lvl):
+    if tag == _NO_COMPRESS_TAG:
+        return data
+
+    elif tag == b'lz4 ':
+        return lz4_frame.compress(data, compression_level=lvl)
+
+    else:
+        return zstandard.ZstdCompressor(level=lvl).compress(data)
+
+
+def _decompress(data, tag, writable=False):
+    # writable: decompressed into a bytearray, so that arrays over it can be modified in place
+    if tag == _NO_COMPRESS_TAG:
+        return data
+
+    elif tag == b'lz4 ':
+        return lz4_frame.decompress(data, return_bytearray=writable)
+
+    else:
+        data = zstandard.ZstdDecompressor().decompress(data)
+
+        return bytearray(data) \
+            if writable \
+            else data
+
+
+def dump_oob(obj, file_path, compress=None, compress_lvl=DEFAULT_COMPRESS_LVL):
+    """
+    Pickle ``obj`` to ``file_path`` with Protocol 5 & out-of-band buffers,
+    optionally compressing the pickle stream & each buffer with LZ4 or ZStd.
+
+    Uncompressed files are loaded zero-copy by :func:`load_oob`.
+    """
+    assert OOB_PROTOCOL_AVAILABLE, \
+        '*** Pickle Protocol {} requires Python 3.8+ ***'.format(OOB_PROTOCOL)
+
+    tag = _compressor_tag(compress)
+
+    buffers = []
+    data = pickle.dumps(obj, protocol=OOB_PROTOCOL, buffer_callback=buffers.append)
+
+    with open(file_path, 'wb') as f:
+        f.write(_OOB_HEADER_STRUCT.pack(OOB_MAGIC, tag, len(buffers)))
+
+        for chunk in [data] + [buffer.raw() for buffer in buffers]:
+            chunk = _compress(chunk, tag=tag, lvl=compress_lvl)
+            f.write(_OOB_LEN_STRUCT.pack(len(chunk)))
+            f.write(chunk)
+
+
+def load_oob(file_path):
+    """
+    Load an object written by :func:`dump_oob`.
+
+    Uncompressed buffers are memory-mapped (copy-on-write) rather than read:
+    arrays in the result are writable views over the file, whose in-place changes never reach the file;
+    the map stays open as long as any such array is referenced, & is otherwise closed before returning.
+    """
+    with open(file_path, 'rb') as f:
+        if not os.fstat(f.fileno()).st_size:
+            raise ValueError('*** {} is empty ***'.format(file_path))
+
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    view = memoryview(mm)
+
+    magic, tag, n_buffers = _OOB_HEADER_STRUCT.unpack_from(view, 0)
+
+    if magic != OOB_MAGIC:
+        raise ValueError('*** {} is not an out-of-band pickle file ***'.format(file_path))
+
+    offset = _OOB_HEADER_STRUCT.size
+
+    chunks = []
+
+    for i in range(n_buffers + 1):
+        chunk_len, = _OOB_LEN_STRUCT.unpack_from(view, offset)
+        offset += _OOB_LEN_STRUCT.size
+        chunks.append(_decompress(view[offset:(offset + chunk_len)], tag=tag, writable=i > 0))
+        offset += chunk_len
+
+    obj = pickle.loads(chunks[0], buffers=chunks[1:])
+
+    if (tag != _NO_COMPRESS_TAG) or (not n_buffers):
+        # no result array references the map: close it now rather than whenever garbage-collected
+        del chunks
+        view.release()
+        mm.close()
+
+    return obj
+
+
+def is_oob_file(file_path):
+    with open(file_path, 'rb') as f:
+        return f.read(len(OOB_MAGIC)) == OOB_MAGIC
@@ -47,17 +47,13 @@ from pyarrow.types import \
     _NESTED_TYPES, is_list, is_struct, is_union, is_map, is_nested, \
     is_dictionary
 
-from .spark_sql import \
-    _NULL_TYPE, \
-    _BOOL_TYPE, \
-    _STR_TYPE, \
-    _BINARY_TYPE, \
-    _INT_TYPE, _BIGINT_TYPE, \
-    _FLOAT_TYPE, _DOUBLE_TYPE, \
-    _DATE_TYPE, _TIMESTAMP_TYPE, \
-    _VECTOR_TYPE, \
-    _DECIMAL_TYPE_PREFIX, \
-    _ARRAY_TYPE_PREFIX, _MAP_TYPE_PREFIX, _STRUCT_TYPE_PREFIX
+
+# Spark SQL simpleStrings of the corresponding types
+# (as in .spark_sql, but not imported from there, so that importing this module does not import PySpark)
+_NULL_TYPE = 'null'
+_BOOL_TYPE = 'boolean'
+_STR_TYPE = 'string'
+_BINARY_TYPE = 'binary'
 
 
 _ARROW_NULL_TYPE = null()
@@ -0,0 +1,111 @@
+"""
+Per-call overhead of methods wrapped by ``arimo.util.decor.enable_inplace`` vs. unwrapped methods,
+and vs. the former wrapper introspecting signatures on every call
+
+Run from the repository root:
+    python benchmarks/enable_inplace.py [--n-calls 100000] [--n-repeats 5]
+"""
+
+
+import argparse
+import inspect
+import timeit
+
+from arimo.util.decor import enable_inplace
+
+
+class _Frame(object):
+    def __init__(self, x=0):
+        self.x = x
+
+    def select(self, n=1, alias=None):
+        return _Frame(self.x + n)
+
+    def _inplace(self, result, alias=None):
+        self.x = result.x
+
+
+@enable_inplace
+class _WrappedFrame(_Frame):
+    _INPLACE_ABLE = 'select',
+
+
+def _legacy_enable_inplace(Class, method):
+    # former wrapper, for reference
+    # (inspect.getargspec, removed in Python 3.11, replaced by the equivalent .getfullargspec)
+    def method_with_inplace(*args, **kwargs):
+        self = args[0] if args else method.__self__
+
+        inplace = kwargs.pop('inplace', False)
+        kwargs_set = set(kwargs)
+
+        method_arg_spec = inspect.getfullargspec(method)
+        method_args = kwargs \
+            if method_arg_spec.varkw \
+            else {k: kwargs[k] for k in kwargs_set.intersection(method_arg_spec.args)}
+
+        result = method(*args, **method_args)
+
+        if inplace:
+            inplace_kwargs_spec = inspect.getfullargspec(Class._inplace)
+            inplace_kwargs = kwargs \
+                if inplace_kwargs_spec.varkw \
+                else {k: kwargs[k] for k in kwargs_set.intersection(inplace_kwargs_spec.args)}
+            Class._inplace(self, result, **inplace_kwargs)
+
+        elif callable(result) and (not isinstance(result, Class)):
+            raise NotImplementedError('*** callable results not benchmarked ***')
+
+        else:
+            return result
+
+    return method_with_inplace
+
+
+class _LegacyWrappedFrame(_Frame):
+    pass
+
+
+_LegacyWrappedFrame.select = _legacy_enable_inplace(_LegacyWrappedFrame, _Frame.select)
+
+
+CALLS = (
+    ('no args', lambda frame: frame.select()),
+    ('keyword args', lambda frame: frame.select(n=2, alias='a')),
+    ('inplace=True', lambda frame: frame.select(n=2, alias='a', inplace=True)),
+)
+
+
+def _ns_per_call(call, frame, n_calls, n_repeats):
+    return min(timeit.repeat(lambda: call(frame), number=n_calls, repeat=n_repeats)) / n_calls * 1e9
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-calls', type=int, default=10 ** 5)
+    arg_parser.add_argument('--n-repeats', type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print('{:<16}{:>16}{:>16}{:>16}{:>14}'.format(
+        'call', 'unwrapped (ns)', 'wrapped (ns)', 'legacy (ns)', 'overhead (ns)'))
+
+    for call_name, call in CALLS:
+        unwrapped = \
+            _ns_per_call(call, _Frame(), args.n_calls, args.n_repeats) \
+            if call_name != 'inplace=True' \
+            else None
+
+        wrapped = _ns_per_call(call, _WrappedFrame(), args.n_calls, args.n_repeats)
+
+        legacy = _ns_per_call(call, _LegacyWrappedFrame(), args.n_calls, args.n_repeats)
+
+        print('{:<16}{:>16}{:>16.0f}{:>16.0f}{:>14}'.format(
+            call_name,
+            '-' if unwrapped is None else '{:.0f}'.format(unwrapped),
+            wrapped,
+            legacy,
+            '-' if unwrapped is None else '{:.0f}'.format(wrapped - unwrapped)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,110 @@
+"""
+Import time of ``arimo.util``, ``arimo.data`` & the data handlers (via ``python -X importtime``)
+against regression budgets
+
+Each module is imported in fresh interpreters; the median cumulative import time must stay within its budget,
+and heavy libraries (Spark, Arrow, Pandas, Boto3, scikit-learn, TensorFlow, ...) must not be imported at all,
+except those intrinsic to the module (e.g. Arrow & Pandas for the Parquet handler, Spark for the distributed one).
+Exits with status 1 if any budget is exceeded or any module fails to import, so that it can gate CI.
+
+Run from the repository root:
+    python benchmarks/import_time.py [--n-runs 5] [--scale 1.0]
+"""
+
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+
+# module -> (max median cumulative import time (seconds), heavy libraries it is allowed to import)
+BUDGETS = {
+    'arimo.util': (.25, ()),
+    'arimo.data': (.5, ()),
+    'arimo.data.parquet': (1.5, ('numpy', 'pandas', 'pyarrow')),
+    'arimo.data.distributed': (3., ('numpy', 'pandas', 'pyarrow', 'pyspark')),
+}
+
+# libraries that importing the above must otherwise leave to first use
+HEAVY_LIBS = \
+    'boto3', 'botocore', 'keras', 'numpy', 'pandas', 'pyarrow', 'pyspark', 'ray', 's3fs', 'sklearn', 'tensorflow'
+
+
+def _import_time(module):
+    # -> (cumulative import time in seconds, names of top-level packages imported)
+    process = \
+        subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import {}'.format(module)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            check=False,
+            env=dict(os.environ,
+                     PYTHONPATH=os.pathsep.join(
+                        [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))] +
+                        [path for path in [os.environ.get('PYTHONPATH')] if path])),
+            universal_newlines=True)
+
+    if process.returncode:
+        raise ImportError(process.stderr.strip().splitlines()[-1])
+
+    cumulative_us = None
+    imported = set()
+
+    for line in process.stderr.splitlines():
+        if line.startswith('import time:') and ('|' in line):
+            _, cumulative, name = line[len('import time:'):].split('|')
+
+            name = name.strip()
+
+            imported.add(name.split('.')[0])
+
+            if name == module:
+                cumulative_us = int(cumulative)
+
+    return cumulative_us / 1e6, imported
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-runs', type=int, default=5)
+    arg_parser.add_argument('--scale', type=float, default=1.,
+                            help='multiplier of the budgets, e.g. for slow CI machines')
+    args = arg_parser.parse_args()
+
+    over_budget = False
+
+    for module, (budget, allowed_libs) in BUDGETS.items():
+        budget *= args.scale
+
+        times, heavy_libs = [], set()
+
+        try:
+            for _ in range(args.n_runs):
+                seconds, imported = _import_time(module)
+                times.append(seconds)
+                heavy_libs.update(imported.intersection(HEAVY_LIBS).difference(allowed_libs))
+
+        except ImportError as err:
+            over_budget = True
+            print('{:<24} FAILED TO IMPORT: {}'.format(module, err))
+            continue
+
+        median = statistics.median(times)
+
+        ok = (median <= budget) and (not heavy_libs)
+        over_budget |= not ok
+
+        print('{:<24} median {:.3f} s (min {:.3f} s) / budget {:.3f} s{}   {}'.format(
+            module, median, min(times), budget,
+            '; heavy libraries imported: {}'.format(sorted(heavy_libs))
+                if heavy_libs
+                else '',
+            'OK' if ok else 'OVER BUDGET'))
+
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,149 @@
+"""
+Speed of NumPy-vectorized ``arimo.util.interpolate`` vs. the former element-wise pure-Python implementation
+on integer-indexed Pandas series,
+at 1%, 10% & 50% NULLs (target: >= 100x)
+
+Run from the repository root:
+    python benchmarks/interpolate.py [--n 1000000] [--n-repeats 3] [--n-groups 1000]
+"""
+
+
+import argparse
+import time
+
+import numpy
+import pandas
+
+from arimo.util import grouped_interpolate, interpolate
+
+
+NULL_PROPORTIONS = .01, .1, .5
+
+TARGET_SPEEDUP = 100
+
+METHODS = 'mean', 'before', 'after', 'linear'
+
+
+def _legacy_interpolate(series, method='mean'):
+    # former element-wise implementation, for reference
+    # (on a copy, & without its never-working Pandas-Timestamp-/date-time-index branches)
+    values = series.to_numpy(copy=True)
+
+    n_items = len(series)
+
+    if method in ('mean', 'linear'):
+        pandas_series_by_num = isinstance(series.index[0], (int, float))
+
+        i = 0
+        i_must_be_less_than = n_items - 2
+        j_must_be_less_than = n_items
+        while i < i_must_be_less_than:
+            while not (pandas.notnull(values[i]) and pandas.isnull(values[i + 1])) and (i < i_must_be_less_than):
+                i += 1
+            if i < i_must_be_less_than:
+                j = i + 2
+                while pandas.isnull(values[j]) and (j < j_must_be_less_than):
+                    j += 1
+                if j < j_must_be_less_than:
+                    if method == 'mean':
+                        values[(i + 1):j] = (j - i - 1) * ((values[i] + values[j]) / 2,)
+                    elif pandas_series_by_num:
+                        index_range = series.index[j] - series.index[i]
+                        value_range = values[j] - values[i]
+                        if index_range:
+                            for k in range(i + 1, j):
+                                values[k] = \
+                                    values[i] + \
+                                    ((series.index[k] - series.index[i]) / index_range) * value_range
+                        else:
+                            values[(i + 1):j] = (j - i - 1) * ((values[i] + values[j]) / 2,)
+                    else:
+                        values[i:(j + 1)] = \
+                            numpy.linspace(
+                                start=values[i],
+                                stop=values[j],
+                                num=j - i + 1,
+                                endpoint=True,
+                                retstep=False)
+                i = j
+
+    elif method == 'before':
+        for i in range(1, n_items):
+            if pandas.isnull(values[i]):
+                values[i] = values[i - 1]
+
+    elif method == 'after':
+        for i in reversed(range(n_items - 1)):
+            if pandas.isnull(values[i]):
+                values[i] = values[i + 1]
+
+    return pandas.Series(index=series.index, data=values)
+
+
+def _series(n, null_proportion, rng):
+    values = rng.standard_normal(n)
+
+    values[rng.random(n) < null_proportion] = numpy.nan
+
+    # the former implementation could not handle NULLs at the ends
+    values[0] = values[-1] = 0.
+
+    return pandas.Series(values)
+
+
+def _best_time(func, n_repeats):
+    times = []
+
+    for _ in range(n_repeats):
+        tic = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - tic)
+
+    return min(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n', type=int, default=10 ** 6)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    arg_parser.add_argument('--n-groups', type=int, default=10 ** 3)
+    arg_parser.add_argument('--skip-legacy', action='store_true')
+    args = arg_parser.parse_args()
+
+    rng = numpy.random.default_rng(seed=0)
+
+    print('{:<8}{:<9}{:>14}{:>14}{:>14}{:>10}'.format(
+        'NULLs', 'method', 'legacy (s)', 'vector (s)', 'grouped (s)', 'speedup'))
+
+    speedups = []
+
+    for null_proportion in NULL_PROPORTIONS:
+        values = _series(args.n, null_proportion, rng)
+
+        groups = numpy.sort(rng.integers(0, args.n_groups, size=args.n))
+
+        for method in METHODS:
+            vector_time = _best_time(lambda: interpolate(values, method=method), args.n_repeats)
+
+            grouped_time = _best_time(lambda: grouped_interpolate(values, by=groups, method=method), args.n_repeats)
+
+            if args.skip_legacy:
+                legacy_time = speedup = numpy.nan
+
+            else:
+                # slow: timed once
+                legacy_time = _best_time(lambda: _legacy_interpolate(values, method=method), 1)
+                speedup = legacy_time / vector_time
+                speedups.append(speedup)
+
+            print('{:<8.0%}{:<9}{:>14.3f}{:>14.4f}{:>14.4f}{:>9.0f}x'.format(
+                null_proportion, method, legacy_time, vector_time, grouped_time, speedup))
+
+    if speedups:
+        print('\nmin speedup {:.0f}x vs. target {}x: {}'.format(
+            min(speedups), TARGET_SPEEDUP,
+            'OK' if min(speedups) >= TARGET_SPEEDUP else 'BELOW TARGET'))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Scaling of ``arimo.util.iterables.flatten`` & ``nested_map`` with the number of leaves, up to 1e6
+(time per leaf should stay flat), vs. the former ``reduce``-concatenation ``flatten`` & copy-first ``nested_map``
+
+Run from the repository root:
+    python benchmarks/iterables.py [--max-n-leaves 1000000] [--max-legacy-n-leaves 30000] [--n-repeats 3]
+"""
+
+
+import argparse
+from collections.abc import Iterable
+from functools import reduce
+import time
+
+import numpy
+
+from arimo.util.iterables import flatten, nested_map
+
+
+def _legacy_flatten(iterable):
+    return iterable.flatten().tolist() \
+        if isinstance(iterable, numpy.ndarray) \
+        else (iterable.toArray().tolist()
+              if 'Vector' in str(type(iterable))
+              else (reduce(lambda left, right: left + _legacy_flatten(right), iterable, [])
+                    if isinstance(iterable, Iterable) and not isinstance(iterable, (dict, str))
+                    else [iterable]))
+
+
+def _legacy_nested_map(func, iterable):
+    ls = list(iterable)
+    for i, item in enumerate(iterable):
+        ls[i] = \
+            _legacy_nested_map(func, item) \
+                if isinstance(item, Iterable) and not isinstance(item, str) \
+                else func(item)
+    return ls
+
+
+def _nested(n_leaves, branching):
+    # list nested `branching` items per level, with n_leaves int leaves in total
+    x = list(range(n_leaves))
+
+    while len(x) > branching:
+        x = [x[i:(i + branching)] for i in range(0, len(x), branching)]
+
+    return x
+
+
+def _structures(n_leaves):
+    yield 'flat list', list(range(n_leaves))
+    yield 'nested list (10 per level)', _nested(n_leaves, branching=10)
+    yield 'list of 2-tuples', [(i, str(i)) for i in range(n_leaves // 2)]
+    yield 'list of NumPy arrays', [numpy.arange(100) for _ in range(n_leaves // 100)]
+
+
+def _best_time(func, n_repeats):
+    times = []
+
+    for _ in range(n_repeats):
+        tic = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - tic)
+
+    return min(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--max-n-leaves', type=int, default=10 ** 6)
+    arg_parser.add_argument('--max-legacy-n-leaves', type=int, default=3 * 10 ** 4,
+                            help='the former flatten is quadratic: only time it up to this size')
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    n_leaves_list = []
+    n_leaves = 10 ** 3
+    while n_leaves <= args.max_n_leaves:
+        n_leaves_list.append(n_leaves)
+        n_leaves *= 10
+
+    def _ns_per_leaf(seconds, n):
+        return '{:.0f}'.format(seconds / n * 1e9) \
+            if seconds is not None \
+            else '-'
+
+    for func_name in ('flatten', 'nested_map'):
+        print('\n{} (ns per leaf)'.format(func_name))
+        print('{:<30}{:>12}{:>12}{:>12}'.format('structure', '# leaves', 'new', 'legacy'))
+
+        for n_leaves in n_leaves_list:
+            for structure_name, structure in _structures(n_leaves):
+                if func_name == 'flatten':
+                    new_time = _best_time(lambda: flatten(structure), args.n_repeats)
+
+                    legacy_time = \
+                        _best_time(lambda: _legacy_flatten(structure), 1) \
+                        if n_leaves <= args.max_legacy_n_leaves \
+                        else None
+
+                else:
+                    new_time = _best_time(lambda: nested_map(str, structure), args.n_repeats)
+
+                    legacy_time = _best_time(lambda: _legacy_nested_map(str, structure), args.n_repeats)
+
+                print('{:<30}{:>12,}{:>12}{:>12}'.format(
+                    structure_name, n_leaves,
+                    _ns_per_leaf(new_time, n_leaves), _ns_per_leaf(legacy_time, n_leaves)))
+
+
+if __name__ == '__main__':
+    main()
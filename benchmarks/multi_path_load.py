@@ -0,0 +1,143 @@
+"""
+Multi-path load & union: 1 multi-path ``DistributedDataFrame.load`` / ``unionAllCols`` (DataFrame paths)
+vs. the former RDD union re-created with a rebuilt schema, on a local Spark session
+
+Run from the repository root (requires PySpark & Java):
+    python benchmarks/multi_path_load.py [--n-paths 20] [--n-rows-per-path 100000] [--n-repeats 3]
+"""
+
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from pyspark.sql import SparkSession, functions
+from pyspark.sql.types import StructField, StructType
+
+import arimo.util.data_backend
+from arimo.data.distributed import DistributedDataFrame
+
+
+def _local_spark():
+    spark = SparkSession.builder \
+        .master('local[*]') \
+        .appName('multi_path_load benchmark') \
+        .config('spark.ui.enabled', False) \
+        .getOrCreate()
+
+    spark.sparkContext.setLogLevel('WARN')
+
+    # bind the session for DistributedDataFrame, without the cluster set-up of initSpark(...)
+    arimo.util.data_backend.spark = spark
+
+    return spark
+
+
+def _write_paths(spark, dir_path, n_paths, n_rows_per_path):
+    # Parquet datasets sharing some columns, each also having 1 of 3 optional columns
+    paths = []
+
+    for i in range(n_paths):
+        path = os.path.join(dir_path, 'part{}'.format(i))
+
+        spark.range(n_rows_per_path) \
+            .select(
+                'id',
+                functions.rand(seed=i).alias('x'),
+                functions.lit('path{}'.format(i)).alias('src'),
+                functions.rand(seed=-i).alias('opt{}'.format(i % 3))) \
+            .write.parquet(path)
+
+        paths.append(path)
+
+    return paths
+
+
+def _rdd_union(sparkDFs):
+    # former default of unionAllCols: pad each frame to all columns, union their RDDs & re-create with a rebuilt schema
+    colTypes = {}
+
+    for sparkDF in sparkDFs:
+        for structField in sparkDF.schema:
+            colTypes.setdefault(structField.name, structField.dataType)
+
+    padded = [sparkDF.select(
+                *((sparkDF[colName]
+                   if colName in sparkDF.columns
+                   else functions.lit(None).cast(dataType).alias(colName))
+                  for colName, dataType in colTypes.items()))
+              for sparkDF in sparkDFs]
+
+    spark = arimo.util.data_backend.spark
+
+    return spark.createDataFrame(
+        data=spark.sparkContext.union([sparkDF.rdd for sparkDF in padded]),
+        schema=StructType(
+            [StructField(name=colName, dataType=dataType, nullable=True)
+             for colName, dataType in colTypes.items()]),
+        samplingRatio=None,
+        verifySchema=False)
+
+
+def _loaders(spark, paths):
+    yield '1 multi-path load', \
+        lambda: DistributedDataFrame.load(path=paths, format='parquet', verbose=False)._sparkDF
+
+    yield "unionAllCols (_unionBy='name')", \
+        lambda: DistributedDataFrame.unionAllCols(
+                    *(spark.read.parquet(path) for path in paths), _unionBy='name')._sparkDF
+
+    yield "unionAllCols (_unionBy='sql')", \
+        lambda: DistributedDataFrame.unionAllCols(
+                    *(spark.read.parquet(path) for path in paths), _unionBy='sql')._sparkDF
+
+    yield 'RDD union (former)', \
+        lambda: _rdd_union([spark.read.parquet(path) for path in paths])
+
+
+def _aggregate(sparkDF):
+    return sparkDF \
+        .agg(functions.count('*'), functions.sum('x'), functions.count('opt0'), functions.count('opt2')) \
+        .collect()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-paths', type=int, default=20)
+    arg_parser.add_argument('--n-rows-per-path', type=int, default=10 ** 5)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    spark = _local_spark()
+
+    dir_path = tempfile.mkdtemp()
+
+    try:
+        paths = _write_paths(spark, dir_path, n_paths=args.n_paths, n_rows_per_path=args.n_rows_per_path)
+
+        print('{:<34}{:>12}{:>14}{:>12}'.format('path', 'load (s)', 'aggregate (s)', 'rows'))
+
+        for loader_name, loader in _loaders(spark, paths):
+            load_times, aggregate_times = [], []
+
+            for _ in range(args.n_repeats):
+                tic = time.perf_counter()
+                sparkDF = loader()
+                load_times.append(time.perf_counter() - tic)
+
+                tic = time.perf_counter()
+                nRows = _aggregate(sparkDF)[0][0]
+                aggregate_times.append(time.perf_counter() - tic)
+
+            print('{:<34}{:>12.3f}{:>14.3f}{:>12,}'.format(
+                loader_name, min(load_times), min(aggregate_times), nRows))
+
+    finally:
+        spark.stop()
+        shutil.rmtree(dir_path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Shuffles (Exchange nodes) in the physical plan of ``DistributedDataFrame._organizeTimeSeries``'s output,
+and time to compute its auxiliary columns, on a local Spark session
+
+Run from the repository root (requires PySpark & Java):
+    python benchmarks/organize_time_series.py [--n-ids 1000] [--n-rows-per-id 1000] [--n-repeats 3]
+"""
+
+
+import argparse
+import re
+import time
+
+from pyspark.sql import SparkSession, functions
+
+import arimo.util.data_backend
+from arimo.data.distributed import DistributedDataFrame
+
+
+_EXCHANGE_PATTERN = re.compile(r'\bExchange\b')
+
+
+def _local_spark():
+    spark = SparkSession.builder \
+        .master('local[*]') \
+        .appName('organize_time_series benchmark') \
+        .config('spark.ui.enabled', False) \
+        .config('spark.sql.adaptive.enabled', False) \
+        .getOrCreate()
+
+    spark.sparkContext.setLogLevel('WARN')
+
+    # bind the session for DistributedDataFrame, without the cluster set-up of initSpark(...)
+    arimo.util.data_backend.spark = spark
+
+    return spark
+
+
+def _n_shuffles(spark_df):
+    return len(_EXCHANGE_PATTERN.findall(spark_df._jdf.queryExecution().executedPlan().toString()))
+
+
+def _sources(spark, n_ids, n_rows_per_id):
+    df = spark.range(n_ids * n_rows_per_id) \
+        .select(
+            (functions.col('id') % n_ids).alias('id'),
+            (functions.col('id') * 60).cast('timestamp').alias('t'),
+            functions.rand(seed=0).alias('x'))
+
+    yield 'unpartitioned', df
+
+    yield 'partitioned by id', df.repartition('id')
+
+    organized = DistributedDataFrame(sparkDF=df, iCol='id', tCol='t')._sparkDF
+
+    yield 'already organized', organized
+
+
+def _compute(ddf):
+    # aggregate over the window-derived columns, so that the window is not pruned away
+    ddf._sparkDF \
+        .agg(functions.max(DistributedDataFrame._T_CHUNK_COL),
+             functions.sum(DistributedDataFrame._T_DELTA_COL)) \
+        .collect()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-ids', type=int, default=10 ** 3)
+    arg_parser.add_argument('--n-rows-per-id', type=int, default=10 ** 3)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    spark = _local_spark()
+
+    print('{:<22}{:>18}{:>18}{:>14}{:>12}'.format(
+        'source', 'source shuffles', 'output shuffles', 'added', 'time (s)'))
+
+    for source_name, source in _sources(spark, n_ids=args.n_ids, n_rows_per_id=args.n_rows_per_id):
+        ddf = DistributedDataFrame(sparkDF=source, iCol='id', tCol='t')
+
+        n_source_shuffles = _n_shuffles(source)
+        n_output_shuffles = _n_shuffles(ddf._sparkDF)
+
+        times = []
+
+        for _ in range(args.n_repeats):
+            tic = time.perf_counter()
+            _compute(ddf)
+            times.append(time.perf_counter() - tic)
+
+        print('{:<22}{:>18}{:>18}{:>14}{:>12.3f}'.format(
+            source_name, n_source_shuffles, n_output_shuffles, n_output_shuffles - n_source_shuffles, min(times)))
+
+    spark.stop()
+
+
+if __name__ == '__main__':
+    main()
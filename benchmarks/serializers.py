@@ -0,0 +1,123 @@
+"""
+Dump / load throughput & file size of S3CacheDecor serializer profiles
+on representative DataFrames & model outputs
+
+Run from the repository root:
+    python benchmarks/serializers.py [--n-rows 1000000] [--n-repeats 3]
+"""
+
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+import numpy
+import pandas
+
+from arimo.util import pkl
+from arimo.util.cache import _SERIALIZER_FUNCS, _is_feather_able, _is_npy_able
+
+
+def _data(n_rows):
+    rng = numpy.random.default_rng(seed=0)
+
+    return dict(
+        dataframe=pandas.DataFrame(
+            dict(id=rng.integers(0, 10 ** 4, size=n_rows),
+                 t=pandas.date_range('2020-01-01', periods=n_rows, freq='s'),
+                 x=rng.standard_normal(n_rows),
+                 y=rng.standard_normal(n_rows).astype('float32'),
+                 cat=pandas.Categorical(rng.choice(['a', 'b', 'c', 'd'], size=n_rows)).astype(str))),
+        model_output=rng.standard_normal((n_rows, 16)).astype('float32'),
+        model_outputs=dict(
+            scores=rng.standard_normal(n_rows).astype('float32'),
+            labels=rng.integers(0, 2, size=n_rows),
+            meta=dict(model='m', version=3)))
+
+
+def _profiles(obj):
+    # (profile name, serializer, compress, compress_lvl)
+    yield 'joblib bz2-9 (legacy)', 'joblib', None, None
+
+    if pkl.OOB_PROTOCOL_AVAILABLE:
+        yield 'pickle5', 'pickle5', None, None
+
+        for compress in pkl.FAST_COMPRESSORS:
+            for compress_lvl in (1, pkl.DEFAULT_COMPRESS_LVL, 9):
+                yield 'pickle5 {}-{}'.format(compress, compress_lvl), 'pickle5', compress, compress_lvl
+
+    if _is_feather_able(obj):
+        yield 'feather', 'feather', None, None
+
+        for compress in pkl.FAST_COMPRESSORS:
+            yield 'feather {}-{}'.format(compress, pkl.DEFAULT_COMPRESS_LVL), \
+                'feather', compress, pkl.DEFAULT_COMPRESS_LVL
+
+    if _is_npy_able(obj):
+        yield 'npy (mmap load)', 'npy', None, None
+
+    yield 'auto', 'auto', None, None
+
+
+def _bench(obj, serializer, compress, compress_lvl, dir_path, n_repeats):
+    read, write = _SERIALIZER_FUNCS[serializer]
+
+    file_path = os.path.join(dir_path, serializer)
+
+    kwargs = \
+        dict(compress=compress, compress_lvl=compress_lvl) \
+        if compress \
+        else {}
+
+    dump_times, load_times = [], []
+
+    for _ in range(n_repeats):
+        tic = time.perf_counter()
+        write(obj, file_path, **kwargs)
+        dump_times.append(time.perf_counter() - tic)
+
+        tic = time.perf_counter()
+        result = read(file_path)
+
+        # memory-mapped results are only read when touched
+        if isinstance(result, numpy.ndarray):
+            result.sum()
+
+        load_times.append(time.perf_counter() - tic)
+
+    n_bytes = os.path.getsize(file_path)
+
+    os.remove(file_path)
+
+    return min(dump_times), min(load_times), n_bytes
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-rows', type=int, default=10 ** 6)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    dir_path = tempfile.mkdtemp()
+
+    try:
+        for data_name, obj in _data(args.n_rows).items():
+            print('\n{} ({:,} rows)'.format(data_name, args.n_rows))
+            print('{:<28}{:>12}{:>12}{:>14}'.format('profile', 'dump (s)', 'load (s)', 'size (MiB)'))
+
+            for profile_name, serializer, compress, compress_lvl in _profiles(obj):
+                dump_time, load_time, n_bytes = \
+                    _bench(obj, serializer, compress, compress_lvl,
+                           dir_path=dir_path, n_repeats=args.n_repeats)
+
+                print('{:<28}{:>12.3f}{:>12.3f}{:>14.1f}'.format(
+                    profile_name, dump_time, load_time, n_bytes / 2 ** 20))
+
+    finally:
+        shutil.rmtree(dir_path, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Job times under the static ``_SPARK_CONF`` vs. the adaptive configs of ``initSpark(adaptive=True)``
+(Adaptive Query Execution, shuffle partitions & Arrow batch size derived from cores & memory), on local[*] Spark
+
+Run from the repository root (requires PySpark & Java):
+    python benchmarks/spark_conf.py [--n-rows 10000000] [--executor-mem-gib 4] [--n-repeats 3]
+"""
+
+
+import argparse
+import time
+
+from pyspark.sql import SparkSession, Window, functions
+
+from arimo.util.data_backend import _SPARK_CONF, _adaptiveSparkConf
+
+
+def _local_spark():
+    spark = SparkSession.builder \
+        .master('local[*]') \
+        .appName('spark_conf benchmark') \
+        .config('spark.ui.enabled', False) \
+        .getOrCreate()
+
+    spark.sparkContext.setLogLevel('WARN')
+
+    return spark
+
+
+def _profiles(spark, executor_mem_gib):
+    # static: runtime-settable SQL configs of _SPARK_CONF, with AQE explicitly off (on by default as of Spark 3.2)
+    static = {k: v for k, v in _SPARK_CONF.items()
+              if k.startswith('spark.sql.') and spark.conf.isModifiable(k)}
+    static['spark.sql.adaptive.enabled'] = False
+
+    yield 'static', static
+
+    # adaptive: as derived in initSpark(adaptive=True), from the session's cores (local: 1 "executor")
+    n_cores = spark.sparkContext.defaultParallelism
+
+    adaptive = dict(static)
+    adaptive.update(
+        (k, v)
+        for k, (v, _reason) in
+            _adaptiveSparkConf(
+                nCores=n_cores,
+                executorMemGiB=executor_mem_gib,
+                nCoresPerExecutor=n_cores).items())
+
+    yield 'adaptive', adaptive
+
+
+def _jobs(spark, n_rows):
+    df = spark.range(n_rows) \
+        .select(
+            (functions.col('id') % (n_rows // 10 ** 3)).alias('k'),
+            functions.rand(seed=0).alias('x'),
+            functions.rand(seed=1).alias('y'))
+
+    dim = spark.range(n_rows // 10 ** 3) \
+        .select(functions.col('id').alias('k'), functions.rand(seed=2).alias('z'))
+
+    yield 'group-by aggregate', \
+        lambda: df.groupBy('k').agg(functions.avg('x'), functions.stddev('y')).collect()
+
+    yield 'shuffle join', \
+        lambda: df.join(dim.hint('merge'), on='k').agg(functions.sum(functions.col('x') * functions.col('z'))).collect()
+
+    yield 'window', \
+        lambda: df.select(
+                    'k',
+                    functions.lag('x').over(Window.partitionBy('k').orderBy('y')).alias('lagX')) \
+                .agg(functions.sum('lagX')) \
+                .collect()
+
+    yield 'toPandas (Arrow)', \
+        lambda: df.limit(min(n_rows, 10 ** 6)).toPandas()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-rows', type=int, default=10 ** 7)
+    arg_parser.add_argument('--executor-mem-gib', type=float, default=4)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    spark = _local_spark()
+
+    profiles = list(_profiles(spark, executor_mem_gib=args.executor_mem_gib))
+
+    for profile_name, conf in profiles:
+        print('\n{} configs:'.format(profile_name))
+        for k in ('spark.sql.adaptive.enabled',
+                  'spark.sql.shuffle.partitions',
+                  'spark.sql.execution.arrow.maxRecordsPerBatch'):
+            print('    {} = {}'.format(k, conf[k]))
+
+    print('\n{:<22}'.format('job') + ''.join('{:>14}'.format(profile_name + ' (s)') for profile_name, _ in profiles))
+
+    for job_name, job in _jobs(spark, n_rows=args.n_rows):
+        times = []
+
+        for _, conf in profiles:
+            for k, v in conf.items():
+                spark.conf.set(k, v)
+
+            job()   # warm-up
+
+            profile_times = []
+
+            for _ in range(args.n_repeats):
+                tic = time.perf_counter()
+                job()
+                profile_times.append(time.perf_counter() - tic)
+
+            times.append(min(profile_times))
+
+        print('{:<22}'.format(job_name) + ''.join('{:>14.3f}'.format(t) for t in times))
+
+    spark.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Throughput of Vector <-> array conversion: JVM-native ``vectorToArray`` / ``arrayToVector``
+vs. the row-at-a-time ``_VECTOR_TO_ARRAY`` / ``_ARRAY_TO_VECTOR`` Python UDFs, on a local Spark session
+
+Run from the repository root (requires PySpark & Java):
+    python benchmarks/vector_conversion.py [--n-rows 1000000] [--n-features 100] [--n-repeats 3]
+"""
+
+
+import argparse
+import time
+
+from pyspark.ml.linalg import DenseVector, VectorUDT
+from pyspark.sql import SparkSession, functions
+from pyspark.sql.types import ArrayType, DoubleType
+
+from arimo.util.data_backend import arrayToVector, vectorToArray
+
+
+def _local_spark():
+    spark = SparkSession.builder \
+        .master('local[*]') \
+        .appName('vector_conversion benchmark') \
+        .config('spark.ui.enabled', False) \
+        .getOrCreate()
+
+    spark.sparkContext.setLogLevel('WARN')
+
+    # same row-at-a-time UDFs as registered by initSpark(...)
+    spark.udf.register(
+        name='_ARRAY_TO_VECTOR',
+        f=lambda a: DenseVector(a),
+        returnType=VectorUDT())
+
+    spark.udf.register(
+        name='_VECTOR_TO_ARRAY',
+        f=lambda v: v.array.tolist(),
+        returnType=ArrayType(DoubleType()))
+
+    return spark
+
+
+def _run(df):
+    # compute every row without collecting
+    df.write.format('noop').mode('overwrite').save()
+
+
+def _best_time(func, n_repeats):
+    times = []
+
+    for _ in range(n_repeats):
+        tic = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - tic)
+
+    return min(times)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.strip().split('\n')[0])
+    arg_parser.add_argument('--n-rows', type=int, default=10 ** 6)
+    arg_parser.add_argument('--n-features', type=int, default=100)
+    arg_parser.add_argument('--n-repeats', type=int, default=3)
+    args = arg_parser.parse_args()
+
+    spark = _local_spark()
+
+    arrays = spark.range(args.n_rows) \
+        .select(functions.array(*(functions.rand(seed=i) for i in range(args.n_features))).alias('a')) \
+        .cache()
+
+    vectors = arrays.select(arrayToVector(functions.col('a')).alias('v')).cache()
+
+    print('caching {:,} x {:,} arrays & vectors...'.format(args.n_rows, args.n_features))
+    arrays.count()
+    vectors.count()
+
+    conversions = (
+        ('array -> vector', 'arrayToVector',
+         lambda: _run(arrays.select(arrayToVector(functions.col('a')).alias('v')))),
+        ('array -> vector', '_ARRAY_TO_VECTOR UDF',
+         lambda: _run(arrays.selectExpr('_ARRAY_TO_VECTOR(a) AS v'))),
+        ('vector -> array', 'vectorToArray',
+         lambda: _run(vectors.select(vectorToArray(functions.col('v')).alias('a')))),
+        ('vector -> array', '_VECTOR_TO_ARRAY UDF',
+         lambda: _run(vectors.selectExpr('_VECTOR_TO_ARRAY(v) AS a'))),
+    )
+
+    print('\n{:<18}{:<24}{:>12}{:>18}'.format('conversion', 'implementation', 'time (s)', 'rows / s'))
+
+    for conversion_name, implementation_name, conversion in conversions:
+        seconds = _best_time(conversion, args.n_repeats)
+
+        print('{:<18}{:<24}{:>12.3f}{:>18,.0f}'.format(
+            conversion_name, implementation_name, seconds, args.n_rows / seconds))
+
+    spark.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+import math
+
+import pytest
+
+pyspark_sql = pytest.importorskip('pyspark.sql')
+
+import arimo.util.data_backend   # noqa: E402
+from arimo.data.distributed import DistributedDataFrame   # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def ddf():
+    spark = pyspark_sql.SparkSession.builder \
+        .master('local[2]') \
+        .appName('test_distributed_quantile') \
+        .config('spark.ui.enabled', False) \
+        .getOrCreate()
+
+    # bind the session for DistributedDataFrame, without the cluster set-up of initSpark(...)
+    arimo.util.data_backend.spark = spark
+
+    yield DistributedDataFrame(
+        sparkDF=spark.createDataFrame(
+            [(i, float(i) if i % 10 else float('nan')) for i in range(1, 101)],
+            schema='id INT, x DOUBLE'))
+
+    spark.stop()
+
+
+def test_quantile_returns_number(ddf):
+    median = ddf.quantile('x', q=.5)
+
+    assert isinstance(median, float) and not math.isnan(median)
+    assert 45 <= median <= 55
+
+
+def test_quantiles_of_many_columns_in_chunks(ddf):
+    exprs = ['x AS x{}'.format(i) for i in range(DistributedDataFrame._EXACT_QUANTILE_SCAN_MAX_N_COLS + 3)]
+
+    wide = ddf(*exprs)
+
+    quantiles = wide._quantiles(cols=wide.columns, probs=(.1, .9))
+
+    assert all(isinstance(quantiles[(col, q)], float) and not math.isnan(quantiles[(col, q)])
+               for col in wide.columns
+               for q in (.1, .9))